@@ -0,0 +1,22 @@
+from .async_client import AsyncApiClient, AsyncResources
+from .cassettes import Cassette, CassetteMiss
+from .client import ApiClient, RequestTiming
+from .provisioning import ProvisioningError, ResourcePool, ResourceProvisioner
+from .resolver import ParallelResolver, ResourceGraph
+from .tokens import TokenBroker, TokenError
+
+__all__ = [
+    "ApiClient",
+    "AsyncApiClient",
+    "AsyncResources",
+    "Cassette",
+    "CassetteMiss",
+    "ParallelResolver",
+    "ProvisioningError",
+    "RequestTiming",
+    "ResourceGraph",
+    "ResourcePool",
+    "ResourceProvisioner",
+    "TokenBroker",
+    "TokenError",
+]
@@ -0,0 +1,135 @@
+"""
+Modo asíncrono (opcional) para las pruebas de API.
+
+AsyncApiClient expone la misma interfaz que ApiClient pero con métodos awaitables
+(estilo httpx.AsyncClient). Las peticiones se ejecutan en un pool de hilos sobre la
+sesión keep-alive del cliente síncrono, así que no requiere dependencias nuevas y
+comparte las conexiones y el registro de tiempos con el resto de la suite.
+
+AsyncResources es la versión asíncrona de las fixtures de recursos de conftest.py:
+los pasos independientes (por ejemplo, registrar al pasajero y crear el avión y el
+vuelo de una reserva) se ejecutan de forma concurrente con asyncio.gather.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Tuple
+
+import requests
+
+from .payloads import (aircraft_payload, airport_payload, booking_payload, flight_payload,
+                       payment_payload, user_payload)
+from .provisioning import ProvisioningError
+
+
+class AsyncApiClient:
+    """
+    Cliente HTTP awaitable sobre un ApiClient con pool de conexiones.
+
+    max_concurrency limita las peticiones simultáneas; por defecto coincide con el
+    tamaño del pool de conexiones del cliente síncrono.
+    """
+
+    def __init__(self, client, max_concurrency: Optional[int] = None):
+        self.client = client
+        self.base_url = client.base_url
+        self.max_concurrency = max_concurrency or client.pool_size
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="api-async")
+
+    async def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(self.client.request, method, path, **kwargs))
+
+    async def get(self, path: str, **kwargs) -> requests.Response:
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs) -> requests.Response:
+        return await self.request("POST", path, **kwargs)
+
+    async def put(self, path: str, **kwargs) -> requests.Response:
+        return await self.request("PUT", path, **kwargs)
+
+    async def patch(self, path: str, **kwargs) -> requests.Response:
+        return await self.request("PATCH", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs) -> requests.Response:
+        return await self.request("DELETE", path, **kwargs)
+
+    async def run_sync(self, func, *args, **kwargs):
+        """Ejecuta una función bloqueante (p. ej. del TokenBroker) en el pool de hilos."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+
+class AsyncResources:
+    """
+    Versión asíncrona de las fixtures de recursos de conftest.py.
+
+    Los métodos devuelven los mismos valores que las fixtures homónimas y lanzan
+    ProvisioningError si la API rechaza la creación.
+    """
+
+    def __init__(self, client: AsyncApiClient, broker):
+        self.client = client
+        self.broker = broker
+
+    async def _create(self, path: str, payload: dict, token: str, ok_codes=(201,), key: str = "id") -> str:
+        response = await self.client.post(path, json=payload, headers={"Authorization": f"Bearer {token}"})
+        if response.status_code not in ok_codes:
+            raise ProvisioningError(
+                f"POST {path} devolvió {response.status_code}. Cuerpo de la respuesta: {response.text}",
+                response,
+            )
+        created = response.json()
+        if key not in created:
+            raise ProvisioningError(f"Falta '{key}' en la respuesta de POST {path}.", response)
+        return created[key]
+
+    # --- Tokens ---
+
+    async def admin_token(self) -> str:
+        return await self.client.run_sync(self.broker.admin_token)
+
+    async def user_token(self) -> str:
+        return await self.client.run_sync(self.broker.passenger_token)
+
+    # --- Recursos ---
+
+    async def aircraft_id(self, admin_token: Optional[str] = None) -> str:
+        admin_token = admin_token or await self.admin_token()
+        return await self._create("/aircrafts", aircraft_payload(), admin_token)
+
+    async def flight_id(self, admin_token: Optional[str] = None) -> str:
+        admin_token = admin_token or await self.admin_token()
+        aircraft_id = await self.aircraft_id(admin_token)
+        return await self._create("/flights", flight_payload(aircraft_id), admin_token, ok_codes=(200, 201))
+
+    async def booking_id(self, user_token: Optional[str] = None) -> Tuple[str, str]:
+        """
+        Crea una reserva y devuelve (user_token, booking_id). El token del pasajero y
+        la cadena avión -> vuelo se resuelven en paralelo.
+        """
+        if user_token:
+            flight_id = await self.flight_id()
+        else:
+            user_token, flight_id = await asyncio.gather(self.user_token(), self.flight_id())
+        booking_id = await self._create("/bookings", booking_payload(flight_id), user_token)
+        return user_token, booking_id
+
+    async def payment_id(self, user_token: Optional[str] = None) -> Tuple[str, str]:
+        """Crea una reserva pagada y devuelve (user_token, payment_id)."""
+        user_token, booking_id = await self.booking_id(user_token)
+        payment_id = await self._create("/payments", payment_payload(booking_id), user_token)
+        return user_token, payment_id
+
+    async def airport_iata_code(self, admin_token: Optional[str] = None) -> str:
+        admin_token = admin_token or await self.admin_token()
+        return await self._create("/airports", airport_payload(), admin_token, key="iata_code")
+
+    async def user_id_to_delete(self, admin_token: Optional[str] = None) -> str:
+        admin_token = admin_token or await self.admin_token()
+        payload = user_payload("user_to_delete", "ToDeletePass123!", "User to Delete")
+        return await self._create("/users/", payload, admin_token)
@@ -0,0 +1,175 @@
+"""
+Benchmark estadístico de latencia para los endpoints de la API de aerolínea.
+
+Una sola muestra sobre un host con cold starts no dice nada: aquí cada endpoint se
+calienta con unas peticiones que se descartan, luego se toman N muestras con
+perf_counter_ns y se calculan percentiles (p50/p95/p99) y throughput. Los resultados
+de cada ejecución se guardan en JSON y se pueden comparar contra una línea base con
+una tolerancia configurable (ver scripts/api_benchmark.py).
+"""
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import requests
+
+DEFAULT_WARMUP = 5
+DEFAULT_SAMPLES = 50
+# Métrica y tolerancia por defecto de la comparación contra la línea base (0.2 = +20%)
+DEFAULT_METRIC = "p95_ms"
+DEFAULT_TOLERANCE = 0.2
+# Directorio de los resultados de cada ejecución (scripts/api_benchmark.py y TC-API-32)
+RESULTS_DIR = Path("benchmarks") / "results"
+
+
+@dataclass
+class Endpoint:
+    """Endpoint a medir."""
+    name: str
+    method: str
+    path: str
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+# Endpoints públicos que se miden por defecto
+DEFAULT_ENDPOINTS = [
+    Endpoint("root", "GET", "/"),
+    Endpoint("airports_list", "GET", "/airports"),
+]
+
+
+@dataclass
+class EndpointStats:
+    """Estadísticas de latencia de un endpoint (en milisegundos)."""
+    name: str
+    method: str
+    path: str
+    samples: int
+    errors: int
+    min_ms: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    throughput_rps: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Percentil con interpolación lineal sobre una lista ya ordenada."""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * pct / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def _send(client, endpoint: Endpoint, url: str) -> Optional[requests.Response]:
+    """Una petición del benchmark; None si falló sin respuesta (timeout, conexión)."""
+    try:
+        return client.session.request(endpoint.method, url, headers=endpoint.headers, timeout=client.timeout)
+    except requests.RequestException:
+        return None
+
+
+def measure(client, endpoint: Endpoint, warmup: int = DEFAULT_WARMUP,
+            samples: int = DEFAULT_SAMPLES) -> EndpointStats:
+    """
+    Mide un endpoint con la sesión keep-alive del ApiClient. Las peticiones de
+    calentamiento y las respuestas con error (no 2xx, o sin respuesta por timeout o
+    conexión rechazada) no cuentan en la latencia; estas últimas suman a 'errors'.
+    """
+    url = client.url(endpoint.path)
+    for _ in range(warmup):
+        _send(client, endpoint, url)
+
+    latencies_ns = []
+    errors = 0
+    window_start = time.perf_counter_ns()
+    for _ in range(samples):
+        start = time.perf_counter_ns()
+        response = _send(client, endpoint, url)
+        elapsed = time.perf_counter_ns() - start
+        if response is not None and 200 <= response.status_code < 300:
+            latencies_ns.append(elapsed)
+        else:
+            errors += 1
+    window_s = (time.perf_counter_ns() - window_start) / 1e9
+
+    latencies = sorted(ns / 1e6 for ns in latencies_ns)
+    return EndpointStats(
+        name=endpoint.name,
+        method=endpoint.method,
+        path=endpoint.path,
+        samples=len(latencies),
+        errors=errors,
+        min_ms=round(latencies[0], 3) if latencies else 0.0,
+        mean_ms=round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        p50_ms=round(percentile(latencies, 50), 3),
+        p95_ms=round(percentile(latencies, 95), 3),
+        p99_ms=round(percentile(latencies, 99), 3),
+        max_ms=round(latencies[-1], 3) if latencies else 0.0,
+        throughput_rps=round(len(latencies) / window_s, 2) if window_s else 0.0,
+    )
+
+
+def run_benchmark(client, endpoints: List[Endpoint] = None, warmup: int = DEFAULT_WARMUP,
+                  samples: int = DEFAULT_SAMPLES) -> dict:
+    """Mide todos los endpoints y devuelve el resultado de la ejecución (serializable a JSON)."""
+    results = [measure(client, endpoint, warmup, samples) for endpoint in endpoints or DEFAULT_ENDPOINTS]
+    return make_run(client.base_url, results, warmup, samples)
+
+
+def make_run(base_url: str, results: List[EndpointStats], warmup: int, samples: int) -> dict:
+    """Resultado de una ejecución (serializable a JSON) a partir de las estadísticas de cada endpoint."""
+    return {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "base_url": base_url,
+        "warmup": warmup,
+        "samples": samples,
+        "results": {stats.name: stats.to_dict() for stats in results},
+    }
+
+
+def save_run(run: dict, directory=RESULTS_DIR) -> Path:
+    """Guarda la ejecución como benchmark_<fecha>.json en 'directory'."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.fromisoformat(run["started_at"]).strftime("%Y%m%d_%H%M%S")
+    path = directory / f"benchmark_{stamp}.json"
+    path.write_text(json.dumps(run, indent=2))
+    return path
+
+
+def load_run(path) -> dict:
+    return json.loads(Path(path).read_text())
+
+
+def compare(run: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE,
+            metric: str = DEFAULT_METRIC) -> List[str]:
+    """
+    Compara la ejecución contra la línea base y devuelve una descripción de cada
+    regresión: endpoints cuya métrica supera la de la línea base en más de 'tolerance'
+    (fracción, 0.2 = 20%) o que ahora tienen errores. Los endpoints sin línea base se ignoran.
+    """
+    regressions = []
+    for name, current in run["results"].items():
+        reference: Optional[dict] = baseline.get("results", {}).get(name)
+        if reference is None:
+            continue
+        limit = reference[metric] * (1 + tolerance)
+        if current[metric] > limit:
+            regressions.append(
+                f"{name}: {metric} {current[metric]:.1f} ms > {limit:.1f} ms "
+                f"(línea base {reference[metric]:.1f} ms + {tolerance:.0%})"
+            )
+        if current["errors"] > reference.get("errors", 0):
+            regressions.append(f"{name}: {current['errors']} respuestas con error (línea base {reference['errors']})")
+    return regressions
@@ -0,0 +1,228 @@
+"""
+Grabación y reproducción de las peticiones HTTP de la suite de API (cassettes).
+
+En modo 'record' cada petición que hace el cliente compartido (fixtures, broker de
+tokens, aprovisionamiento y pruebas) se envía al servidor y se guarda junto con su
+respuesta. En modo 'replay' las respuestas se sirven desde disco, sin red.
+
+Las interacciones se indexan por método, ruta y cuerpo normalizado: los valores que
+cambian en cada ejecución (UUIDs, emails con sufijos aleatorios, timestamps, fechas
+ISO, códigos IATA generados...) se enmascaran. Al reproducir, los valores grabados
+que aparecen en la respuesta se reemplazan por los de la petición actual, de modo
+que, por ejemplo, el avión creado devuelve el tail_number que envió la prueba.
+"""
+import json
+import re
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from storage.json_files import write_atomic
+
+from .timing import TimingAdapter
+
+OFF = "off"
+RECORD = "record"
+REPLAY = "replay"
+MODES = (OFF, RECORD, REPLAY)
+
+UUID_PATTERN = r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+DATETIME_PATTERN = r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})?"
+EMAIL_PATTERN = r"[^@\s\"]*\d[^@\s\"]*@[\w.-]+"
+# Segmentos de ruta dinámicos: UUIDs, números y códigos IATA ("/airports/TQX")
+PATH_SEGMENT_PATTERN = re.compile(rf"^(?:{UUID_PATTERN}|\d+|[A-Z]{{3}})$")
+
+# Valores dinámicos dentro de los cuerpos, en orden de prioridad
+DYNAMIC_VALUES = [
+    ("uuid", re.compile(UUID_PATTERN)),
+    ("datetime", re.compile(DATETIME_PATTERN)),
+    ("email", re.compile(EMAIL_PATTERN)),
+    ("hex", re.compile(r"\b(?=[0-9a-f]*\d)[0-9a-f]{6,}\b")),
+    ("number", re.compile(r"(?<![\w.])\d{4,}(?![\w.])")),
+]
+# Campos cuyo valor se genera al azar en los payloads (ver api_client/payloads.py y api_tests/)
+DYNAMIC_FIELDS = ("tail_number", "iata_code")
+
+
+class CassetteMiss(requests.exceptions.ConnectionError):
+    """No hay ninguna interacción grabada para la petición (modo replay)."""
+
+
+def _mask_string(value: str, values: List[str]) -> str:
+    for name, pattern in DYNAMIC_VALUES:
+        def replace(match, name=name):
+            values.append(match.group(0))
+            return f"<{name}>"
+        value = pattern.sub(replace, value)
+    return value
+
+
+def _mask(data, values: List[str], field: Optional[str] = None):
+    if isinstance(data, dict):
+        return {key: _mask(data[key], values, key) for key in sorted(data)}
+    if isinstance(data, list):
+        return [_mask(item, values) for item in data]
+    if isinstance(data, str):
+        if field in DYNAMIC_FIELDS:
+            values.append(data)
+            return f"<{field}>"
+        return _mask_string(data, values)
+    return data
+
+
+def normalize(method: str, url: str, body=None, content_type: str = "") -> Tuple[str, List[str]]:
+    """
+    Clave de la petición y lista de valores dinámicos enmascarados (en orden de aparición).
+    """
+    values: List[str] = []
+    split = urlsplit(url)
+    segments = []
+    for segment in split.path.rstrip("/").split("/"):
+        if PATH_SEGMENT_PATTERN.match(segment):
+            values.append(segment)
+            segment = "<id>"
+        segments.append(segment)
+    path = "/".join(segments) or "/"
+    if split.query:
+        path += "?" + urlencode(_mask(dict(parse_qsl(split.query)), values))
+
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+    normalized_body = ""
+    if body:
+        if "json" in content_type:
+            normalized_body = json.dumps(_mask(json.loads(body), values), separators=(",", ":"))
+        elif "x-www-form-urlencoded" in content_type:
+            normalized_body = urlencode(_mask(dict(parse_qsl(body)), values))
+        else:
+            normalized_body = _mask_string(body, values)
+    return f"{method.upper()} {path} {normalized_body}".rstrip(), values
+
+
+def _substitute(text: str, recorded: List[str], current: List[str]) -> str:
+    """Reemplaza en 'text' los valores dinámicos grabados por los de la petición actual."""
+    for old, new in zip(recorded, current):
+        if old == new:
+            continue
+        if re.fullmatch(DATETIME_PATTERN, old):
+            # La API puede reformatear las fechas (fracciones, zona horaria)
+            pattern = re.escape(old[:19]) + r"(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})?"
+        else:
+            pattern = rf"(?<![A-Za-z0-9]){re.escape(old)}(?![A-Za-z0-9])"
+        text = re.sub(pattern, new.replace("\\", r"\\"), text)
+    return text
+
+
+class Cassette:
+    """
+    Interacciones grabadas, agrupadas por clave.
+
+    Cada interacción recuerda la prueba durante la que se grabó ('test'). Al reproducir
+    se prefieren las de la prueba en curso, en el orden en que se grabaron; si no hay,
+    se usan las de cualquier otra prueba (p. ej. el aprovisionamiento de la sesión, que
+    con otra selección de pruebas o de workers ocurre en otra prueba). Al agotarse se
+    repite la última.
+    """
+
+    def __init__(self, directory, name: str = "master"):
+        self.directory = Path(directory)
+        self.path = self.directory / f"{name}.jsonl"
+        self.interactions: Dict[str, List[dict]] = defaultdict(list)
+        self.current_test: Optional[str] = None
+        self._used = set()
+        self._recorded: List[dict] = []
+        self._lock = threading.Lock()
+
+    def load(self) -> "Cassette":
+        """Carga todos los cassettes del directorio (uno por worker de xdist en la grabación)."""
+        for path in sorted(self.directory.glob("*.jsonl")):
+            with path.open(encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        interaction = json.loads(line)
+                        self.interactions[interaction["key"]].append(interaction)
+        return self
+
+    def record(self, key: str, values: List[str], response: requests.Response):
+        interaction = {
+            "key": key,
+            "values": values,
+            "status": response.status_code,
+            "content_type": response.headers.get("Content-Type", ""),
+            "body": response.text,
+            "test": self.current_test,
+        }
+        with self._lock:
+            self.interactions[key].append(interaction)
+            self._recorded.append(interaction)
+
+    def play(self, key: str) -> Optional[dict]:
+        with self._lock:
+            recorded = self.interactions.get(key)
+            if not recorded:
+                return None
+            unused = [i for i in recorded if id(i) not in self._used]
+            interaction = next((i for i in unused if i.get("test") == self.current_test), None)
+            if interaction is None:
+                interaction = unused[0] if unused else recorded[-1]
+            self._used.add(id(interaction))
+            return interaction
+
+    def save(self):
+        """Escribe las interacciones grabadas en esta sesión (JSON Lines compacto)."""
+        with self._lock:
+            if not self._recorded:
+                return
+            write_atomic(self.path, "".join(
+                json.dumps(interaction, separators=(",", ":"), ensure_ascii=False) + "\n"
+                for interaction in self._recorded
+            ))
+
+    def __len__(self):
+        return sum(len(items) for items in self.interactions.values())
+
+
+class CassetteAdapter(TimingAdapter):
+    """
+    Adaptador de transporte de requests que graba o reproduce cada petición.
+    Se monta sobre la sesión del ApiClient con ApiClient.use_cassette().
+    """
+
+    def __init__(self, cassette: Cassette, mode: str, **kwargs):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Modo de cassette inválido '{mode}'. Opciones: {RECORD}, {REPLAY}.")
+        super().__init__(**kwargs)
+        self.cassette = cassette
+        self.mode = mode
+
+    def send(self, request, **kwargs):
+        key, values = normalize(request.method, request.url, request.body,
+                                request.headers.get("Content-Type", ""))
+        if self.mode == RECORD:
+            response = super().send(request, **kwargs)
+            self.cassette.record(key, values, response)
+            return response
+
+        interaction = self.cassette.play(key)
+        if interaction is None:
+            raise CassetteMiss(f"No hay ninguna respuesta grabada para '{key}'.", request=request)
+        return self._build_response(request, interaction, values)
+
+    @staticmethod
+    def _build_response(request, interaction: dict, values: List[str]) -> requests.Response:
+        response = requests.Response()
+        response.status_code = interaction["status"]
+        response.reason = "Replayed"
+        response.headers = CaseInsensitiveDict({"Content-Type": interaction["content_type"]})
+        response._content = _substitute(interaction["body"], interaction["values"], values).encode("utf-8")
+        response.encoding = "utf-8"
+        # El cuerpo ya está en memoria: iter_content() (stream=True) lo entrega en fragmentos
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        return response
@@ -0,0 +1,155 @@
+"""
+Cliente HTTP compartido para la API de aerolínea.
+
+Mantiene una única requests.Session con pool de conexiones keep-alive, de modo que
+las fixtures y las pruebas reutilicen las conexiones TCP/TLS abiertas en lugar de
+negociar una nueva en cada llamada. También registra el tiempo de cada petición,
+desglosado por fases (ver api_client/timing.py).
+"""
+import os
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from .cassettes import PATH_SEGMENT_PATTERN, CassetteAdapter
+from .timing import TimingAdapter, finish_phases, reset_phases
+
+# Tamaño del pool por defecto (conexiones por host, por proceso/worker de xdist)
+DEFAULT_POOL_SIZE = 10
+
+
+@dataclass
+class RequestTiming:
+    """
+    Tiempo registrado para una petición HTTP, con el desglose por fases. 'endpoint' es
+    la plantilla de la ruta ("GET /bookings/{id}"); 'test' y 'stage' son la prueba en
+    curso y su fase ("setup" para las fixtures, "call" o "teardown").
+    """
+    method: str
+    path: str
+    status_code: Optional[int]
+    elapsed_ms: float
+    endpoint: str = ""
+    dns_ms: float = 0.0
+    connect_ms: float = 0.0
+    tls_ms: float = 0.0
+    ttfb_ms: float = 0.0
+    download_ms: float = 0.0
+    reused: bool = True
+    test: Optional[str] = None
+    stage: Optional[str] = None
+
+
+def endpoint_template(method: str, path: str) -> str:
+    """Plantilla de la ruta: los IDs, números y códigos IATA se reemplazan por {id}."""
+    segments = ["{id}" if PATH_SEGMENT_PATTERN.match(segment) else segment
+                for segment in path.rstrip("/").split("/")]
+    return f"{method.upper()} {'/'.join(segments) or '/'}"
+
+
+class ApiClient:
+    """
+    Cliente con pool de conexiones para la API de aerolínea.
+
+    Acepta rutas relativas a base_url ("/flights") o URLs absolutas. Con trust_env=False
+    no se consultan proxies ni .netrc del entorno en cada petición (útil contra la API local).
+    """
+
+    def __init__(self, base_url: str, pool_size: int = DEFAULT_POOL_SIZE, timeout: Optional[float] = None,
+                 trust_env: bool = True):
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.timings: List[RequestTiming] = []
+        # Prueba y fase en curso, para atribuirles las peticiones (lo actualiza conftest.py)
+        self.current_test: Optional[str] = None
+        self.current_stage: Optional[str] = None
+
+        self.session = requests.Session()
+        self.session.trust_env = trust_env
+        adapter = TimingAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @classmethod
+    def from_env(cls, base_url: str, pool_size: Optional[int] = None, trust_env: bool = True):
+        """
+        Crea el cliente leyendo la configuración de las variables de entorno
+        API_POOL_SIZE y API_TIMEOUT (en segundos).
+        """
+        if pool_size is None:
+            pool_size = int(os.getenv("API_POOL_SIZE", DEFAULT_POOL_SIZE))
+        timeout = os.getenv("API_TIMEOUT")
+        return cls(base_url, pool_size=pool_size, timeout=float(timeout) if timeout else None, trust_env=trust_env)
+
+    def url(self, path: str) -> str:
+        """Construye la URL completa a partir de una ruta relativa."""
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Ejecuta la petición sobre la sesión compartida y registra su duración."""
+        kwargs.setdefault("timeout", self.timeout)
+        url = self.url(path)
+        status_code = None
+        reset_phases()
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+            status_code = response.status_code
+            return response
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            phases = finish_phases()
+            path = urlsplit(url).path
+            self.timings.append(RequestTiming(
+                method.upper(), path, status_code, elapsed_ms,
+                endpoint=endpoint_template(method, path),
+                dns_ms=phases["dns_ms"], connect_ms=phases["connect_ms"], tls_ms=phases["tls_ms"],
+                ttfb_ms=phases["ttfb_ms"], download_ms=phases["download_ms"], reused=phases["reused"],
+                test=self.current_test, stage=self.current_stage,
+            ))
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs) -> requests.Response:
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs) -> requests.Response:
+        return self.request("PUT", path, **kwargs)
+
+    def patch(self, path: str, **kwargs) -> requests.Response:
+        return self.request("PATCH", path, **kwargs)
+
+    def delete(self, path: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", path, **kwargs)
+
+    def summary(self) -> str:
+        """Resumen legible de las peticiones realizadas con este cliente."""
+        if not self.timings:
+            return "Sin peticiones HTTP registradas."
+        total_ms = sum(t.elapsed_ms for t in self.timings)
+        slowest = max(self.timings, key=lambda t: t.elapsed_ms)
+        return (
+            f"{len(self.timings)} peticiones HTTP en {total_ms / 1000:.2f}s "
+            f"(promedio {total_ms / len(self.timings):.0f} ms, "
+            f"más lenta: {slowest.method} {slowest.path} {slowest.elapsed_ms:.0f} ms)"
+        )
+
+    def use_cassette(self, cassette, mode: str):
+        """
+        Graba (mode="record") o reproduce (mode="replay") todas las peticiones del cliente
+        con el cassette indicado. Ver api_client/cassettes.py.
+        """
+        adapter = CassetteAdapter(cassette, mode, pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def close(self):
+        """Cierra la sesión y libera las conexiones del pool."""
+        self.session.close()
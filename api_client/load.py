@@ -0,0 +1,293 @@
+"""
+Generador de carga concurrente para los endpoints de vuelos, reservas y pagos.
+
+Usa un modelo de llegadas de lazo abierto: las llegadas se programan a una tasa fija
+(con rampa lineal opcional) sin importar cuánto tarde el servidor, y la latencia de
+cada llegada se mide desde su instante programado. Si los hilos están ocupados, la
+espera en cola cuenta como latencia, así que un servidor lento no "frena" la carga
+y sus pausas no quedan ocultas (coordinated omission).
+
+Los recursos se crean con los mismos constructores de payloads que las fixtures de
+conftest.py (api_client/payloads.py). Ver scripts/api_load.py.
+"""
+import itertools
+import math
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional
+
+import requests
+
+from .benchmark import percentile
+from .payloads import booking_payload, payment_payload
+from .tokens import TokenError
+
+# Límites superiores (ms) de los intervalos del histograma de latencia
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, math.inf)
+
+
+def arrival_offsets(rate: float, duration: float, ramp_up: float = 0.0) -> Iterator[float]:
+    """
+    Instantes (segundos desde el inicio) de cada llegada. Durante 'ramp_up' la tasa
+    crece linealmente de 0 a 'rate' llegadas por segundo; después se mantiene.
+    """
+    if rate <= 0:
+        return
+    ramp_arrivals = rate * ramp_up / 2
+    for i in itertools.count(1):
+        if i <= ramp_arrivals:
+            offset = math.sqrt(2 * ramp_up * i / rate)
+        else:
+            offset = ramp_up + (i - ramp_arrivals) / rate
+        if offset >= duration:
+            return
+        yield offset
+
+
+@dataclass
+class EndpointLoad:
+    """Latencias y códigos de estado de un endpoint bajo carga."""
+    label: str
+    latencies_ms: List[float] = field(default_factory=list)
+    outcomes: Counter = field(default_factory=Counter)
+
+    @property
+    def total(self) -> int:
+        return sum(self.outcomes.values())
+
+    @property
+    def errors(self) -> int:
+        return sum(count for outcome, count in self.outcomes.items() if not str(outcome).startswith("2"))
+
+    def histogram(self) -> List[tuple]:
+        """[(límite superior en ms, cantidad)] de los intervalos con al menos una muestra."""
+        counts = Counter()
+        for latency in self.latencies_ms:
+            counts[next(bound for bound in HISTOGRAM_BUCKETS_MS if latency <= bound)] += 1
+        return [(bound, counts[bound]) for bound in HISTOGRAM_BUCKETS_MS if counts[bound]]
+
+    def to_dict(self) -> dict:
+        latencies = sorted(self.latencies_ms)
+        return {
+            "requests": self.total,
+            "errors": self.errors,
+            "error_rate": round(self.errors / self.total, 4) if self.total else 0.0,
+            "outcomes": {str(outcome): count for outcome, count in sorted(self.outcomes.items(), key=str)},
+            "p50_ms": round(percentile(latencies, 50), 3),
+            "p95_ms": round(percentile(latencies, 95), 3),
+            "p99_ms": round(percentile(latencies, 99), 3),
+            "max_ms": round(latencies[-1], 3) if latencies else 0.0,
+            "histogram": [["inf" if bound == math.inf else bound, count] for bound, count in self.histogram()],
+        }
+
+
+class LoadContext:
+    """Estado compartido por los escenarios: cliente, tokens y vuelos de respaldo."""
+
+    def __init__(self, client, broker, flight_ids: List[str]):
+        self.client = client
+        self.broker = broker
+        self._flights = itertools.cycle(flight_ids)
+        self._flights_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self.endpoints: Dict[str, EndpointLoad] = {}
+
+    def next_flight(self) -> str:
+        with self._flights_lock:
+            return next(self._flights)
+
+    def request(self, label: str, method: str, path: str, started_ns: Optional[int] = None,
+                **kwargs) -> Optional[requests.Response]:
+        """
+        Ejecuta y registra una petición. 'started_ns' es el instante programado de la
+        llegada (perf_counter_ns) para la primera petición de cada escenario.
+        """
+        kwargs.setdefault("timeout", self.client.timeout)
+        if started_ns is None:
+            started_ns = time.perf_counter_ns()
+        response = None
+        try:
+            response = self.client.session.request(method, self.client.url(path), **kwargs)
+            outcome = response.status_code
+        except requests.exceptions.RequestException as e:
+            outcome = type(e).__name__
+        self.record(label, outcome, (time.perf_counter_ns() - started_ns) / 1e6)
+        return response
+
+    def record(self, label: str, outcome, latency_ms: float):
+        with self._lock:
+            stats = self.endpoints.setdefault(label, EndpointLoad(label))
+            stats.latencies_ms.append(latency_ms)
+            stats.outcomes[outcome] += 1
+
+
+def _auth(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+# --- Escenarios: una llegada ejecuta uno de estos flujos ---
+
+def flights_scenario(ctx: LoadContext, started_ns: int):
+    """Listado y detalle de vuelos (endpoints públicos)."""
+    ctx.request("GET /flights", "GET", "/flights", started_ns)
+    ctx.request("GET /flights/{id}", "GET", f"/flights/{ctx.next_flight()}")
+
+
+def bookings_scenario(ctx: LoadContext, started_ns: int):
+    """Un pasajero reserva un asiento en uno de los vuelos de respaldo."""
+    ctx.request("POST /bookings", "POST", "/bookings", started_ns,
+                json=booking_payload(ctx.next_flight()), headers=_auth(ctx.broker.passenger_token()))
+
+
+def payments_scenario(ctx: LoadContext, started_ns: int):
+    """Un pasajero reserva y paga la reserva."""
+    token = ctx.broker.passenger_token()
+    response = ctx.request("POST /bookings", "POST", "/bookings", started_ns,
+                           json=booking_payload(ctx.next_flight()), headers=_auth(token))
+    if response is None or response.status_code != 201:
+        return
+    ctx.request("POST /payments", "POST", "/payments",
+                json=payment_payload(response.json()["id"]), headers=_auth(token))
+
+
+def _arrive(scenario: Callable, ctx: LoadContext, scheduled_ns: int):
+    """Ejecuta una llegada; los fallos fuera de las peticiones se registran bajo el escenario."""
+    try:
+        scenario(ctx, scheduled_ns)
+    except (TokenError, ValueError, KeyError) as e:
+        ctx.record(scenario.__name__, type(e).__name__, (time.perf_counter_ns() - scheduled_ns) / 1e6)
+
+
+SCENARIOS: Dict[str, Callable[[LoadContext, int], None]] = {
+    "flights": flights_scenario,
+    "bookings": bookings_scenario,
+    "payments": payments_scenario,
+}
+# Asientos por avión de respaldo (capacidad por defecto de aircraft_payload)
+SEATS_PER_FLIGHT = 150
+
+
+@dataclass
+class LoadReport:
+    """Resultado de una ejecución de carga."""
+    scenarios: List[str]
+    target_rps: float
+    duration_s: float
+    ramp_up_s: float
+    concurrency: int
+    arrivals: int
+    elapsed_s: float
+    max_dispatch_lag_ms: float
+    endpoints: Dict[str, EndpointLoad]
+
+    @property
+    def achieved_rps(self) -> float:
+        completed = sum(stats.total for stats in self.endpoints.values())
+        return completed / self.elapsed_s if self.elapsed_s else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "scenarios": self.scenarios,
+            "target_rps": self.target_rps,
+            "duration_s": self.duration_s,
+            "ramp_up_s": self.ramp_up_s,
+            "concurrency": self.concurrency,
+            "arrivals": self.arrivals,
+            "elapsed_s": round(self.elapsed_s, 3),
+            "achieved_rps": round(self.achieved_rps, 2),
+            "max_dispatch_lag_ms": round(self.max_dispatch_lag_ms, 3),
+            "endpoints": {label: stats.to_dict() for label, stats in sorted(self.endpoints.items())},
+        }
+
+    def format(self) -> str:
+        """Reporte legible: resumen, errores por código y histograma de cada endpoint."""
+        lines = [
+            f"{self.arrivals} llegadas en {self.elapsed_s:.1f}s "
+            f"(objetivo {self.target_rps:g} llegadas/s, {self.achieved_rps:.1f} peticiones/s logradas, "
+            f"concurrencia {self.concurrency})"
+        ]
+        for label, stats in sorted(self.endpoints.items()):
+            data = stats.to_dict()
+            lines.append(
+                f"\n{label}: {data['requests']} peticiones, {data['error_rate']:.1%} errores | "
+                f"p50 {data['p50_ms']:.1f} ms, p95 {data['p95_ms']:.1f} ms, p99 {data['p99_ms']:.1f} ms, "
+                f"máx {data['max_ms']:.1f} ms"
+            )
+            lines.append("   códigos: " + ", ".join(f"{outcome}={count}" for outcome, count in data["outcomes"].items()))
+            peak = max(count for _, count in stats.histogram())
+            for bound, count in stats.histogram():
+                label_ms = f"≤{bound:g} ms" if bound != math.inf else "> 10000 ms"
+                lines.append(f"   {label_ms:>11} {count:7} {'█' * max(1, round(40 * count / peak))}")
+        return "\n".join(lines)
+
+
+class LoadRunner:
+    """
+    Ejecuta los escenarios con llegadas de lazo abierto.
+
+    'rate' son llegadas por segundo (cada llegada ejecuta el siguiente escenario, en
+    round-robin) y 'concurrency' el máximo de llegadas en curso a la vez. El pool de
+    conexiones del ApiClient debería ser al menos igual a 'concurrency'.
+    """
+
+    def __init__(self, client, broker, provisioner, scenarios: List[str], rate: float, duration: float,
+                 ramp_up: float = 0.0, concurrency: int = 16):
+        unknown = [name for name in scenarios if name not in SCENARIOS]
+        if unknown:
+            raise ValueError(f"Escenarios desconocidos: {unknown}. Opciones: {', '.join(SCENARIOS)}.")
+        self.client = client
+        self.broker = broker
+        self.provisioner = provisioner
+        self.scenarios = scenarios
+        self.rate = rate
+        self.duration = duration
+        self.ramp_up = min(ramp_up, duration)
+        self.concurrency = concurrency
+
+    def setup(self) -> LoadContext:
+        """
+        Registra los pasajeros y crea los vuelos de respaldo necesarios para no quedarse
+        sin asientos durante la ejecución.
+        """
+        arrivals = self.rate * (self.duration - self.ramp_up / 2)
+        seats = arrivals * sum(name != "flights" for name in self.scenarios) / len(self.scenarios)
+        admin_token = self.broker.admin_token()
+        self.broker.passenger_accounts()
+        aircraft_id = self.provisioner.create_aircraft(admin_token)
+        flight_ids = [self.provisioner.create_flight(admin_token, aircraft_id)
+                      for _ in range(max(1, math.ceil(seats / SEATS_PER_FLIGHT) + 1))]
+        return LoadContext(self.client, self.broker, flight_ids)
+
+    def run(self, ctx: Optional[LoadContext] = None) -> LoadReport:
+        if ctx is None:
+            ctx = self.setup()
+        scenarios = itertools.cycle([SCENARIOS[name] for name in self.scenarios])
+        arrivals = 0
+        max_lag_ns = 0
+
+        start_ns = time.perf_counter_ns()
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="load") as executor:
+            for offset in arrival_offsets(self.rate, self.duration, self.ramp_up):
+                scheduled_ns = start_ns + int(offset * 1e9)
+                delay = (scheduled_ns - time.perf_counter_ns()) / 1e9
+                if delay > 0:
+                    time.sleep(delay)
+                max_lag_ns = max(max_lag_ns, time.perf_counter_ns() - scheduled_ns)
+                executor.submit(_arrive, next(scenarios), ctx, scheduled_ns)
+                arrivals += 1
+        elapsed_s = (time.perf_counter_ns() - start_ns) / 1e9
+
+        return LoadReport(
+            scenarios=self.scenarios,
+            target_rps=self.rate,
+            duration_s=self.duration,
+            ramp_up_s=self.ramp_up,
+            concurrency=self.concurrency,
+            arrivals=arrivals,
+            elapsed_s=elapsed_s,
+            max_dispatch_lag_ms=max_lag_ns / 1e6,
+            endpoints=ctx.endpoints,
+        )
@@ -0,0 +1,83 @@
+"""
+Constructores de payloads para los recursos de la API de aerolínea.
+
+Los usan las fixtures de conftest.py y el aprovisionamiento en bloque, de modo que
+todos los recursos de prueba se crean con los mismos datos.
+"""
+import random
+import string
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+
+def _random_suffix(k: int = 3, alphabet: str = string.ascii_lowercase + string.digits) -> str:
+    return ''.join(random.choices(alphabet, k=k))
+
+
+def aircraft_payload(capacity: int = 150, model_prefix: str = "Test Model") -> dict:
+    """Avión con un tail_number único de 6 caracteres (N + 5 alfanuméricos)."""
+    timestamp = str(int(time.time()))[-5:]
+    return {
+        "tail_number": f"N{_random_suffix(5, string.ascii_uppercase + string.digits)}",
+        "model": f"{model_prefix} {timestamp}",
+        "capacity": capacity
+    }
+
+
+def flight_payload(aircraft_id: str, origin: str = "MEX", destination: str = "BCN",
+                   departs_in: timedelta = timedelta(hours=1), duration: timedelta = timedelta(hours=2),
+                   base_price: float = 599.99) -> dict:
+    """Vuelo futuro operado por el avión indicado."""
+    departure_time = datetime.now(timezone.utc) + departs_in
+    arrival_time = departure_time + duration
+    return {
+        "origin": origin,
+        "destination": destination,
+        "departure_time": departure_time.isoformat(),
+        "arrival_time": arrival_time.isoformat(),
+        "base_price": base_price,
+        "aircraft_id": aircraft_id
+    }
+
+
+def booking_payload(flight_id: str, passengers: Optional[List[dict]] = None) -> dict:
+    """Reserva para el vuelo indicado; por defecto con un solo pasajero."""
+    if passengers is None:
+        passengers = [{"full_name": "Pasajero de Prueba Fixture", "passport": "P12345678"}]
+    return {
+        "flight_id": flight_id,
+        "passengers": passengers
+    }
+
+
+def payment_payload(booking_id: str, amount: float = 299.99, payment_method: str = "credit_card") -> dict:
+    """Pago de una reserva."""
+    return {
+        "booking_id": booking_id,
+        "amount": amount,
+        "payment_method": payment_method
+    }
+
+
+def airport_payload() -> dict:
+    """Aeropuerto con un código IATA aleatorio de 3 letras que empieza por 'T'."""
+    return {
+        "iata_code": f"T{_random_suffix(2, string.ascii_uppercase)}",
+        "city": f"Test City {int(time.time())}",
+        "country": "Test Country"
+    }
+
+
+def user_payload(email_prefix: str = "new_user", password: str = "SecureNewPass123!",
+                 full_name_prefix: str = "New User", role: Optional[str] = "passenger") -> dict:
+    """Usuario con email único; 'role' se omite si es None."""
+    timestamp = str(int(time.time()))[-5:]
+    user_data = {
+        "email": f"{email_prefix}_{timestamp}_{_random_suffix()}@test.com",
+        "password": password,
+        "full_name": f"{full_name_prefix} {timestamp}"
+    }
+    if role is not None:
+        user_data["role"] = role
+    return user_data
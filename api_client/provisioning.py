@@ -0,0 +1,209 @@
+"""
+Aprovisionamiento en bloque de recursos de prueba para la API de aerolínea.
+
+Al inicio de la sesión crea en paralelo los aviones, vuelos, reservas y pagos que
+van a pedir las pruebas y los reparte desde pools tipados:
+
+- Recursos "compartibles" (aviones): se entregan en round-robin y nunca se agotan,
+  porque las pruebas sólo los leen o los referencian.
+- Recursos "consumibles" (vuelos, reservas, pagos): cada uno se entrega una sola
+  vez, ya que las pruebas pueden modificarlos, cancelarlos o eliminarlos.
+
+Las reservas y los pagos pertenecen a un pasajero, así que se guardan por dueño
+y sólo se entregan a una prueba que use el token de ese mismo pasajero. Cuando un
+pool se agota, las fixtures vuelven a crear el recurso bajo demanda.
+"""
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+from .payloads import aircraft_payload, booking_payload, flight_payload, payment_payload
+from .tokens import TokenError
+
+SHAREABLE = "shareable"
+CONSUMABLE = "consumable"
+
+
+class ProvisioningError(Exception):
+    """La API rechazó la creación de un recurso de prueba."""
+
+    def __init__(self, message: str, response: Optional[requests.Response] = None):
+        super().__init__(message)
+        self.response = response
+
+
+class ResourcePool:
+    """Pool de IDs de un tipo de recurso, opcionalmente agrupados por dueño."""
+
+    def __init__(self, name: str, kind: str = CONSUMABLE):
+        self.name = name
+        self.kind = kind
+        self._items: Dict[Optional[str], deque] = defaultdict(deque)
+        self._lock = threading.Lock()
+
+    def add(self, item: str, owner: Optional[str] = None):
+        with self._lock:
+            self._items[owner].append(item)
+
+    def take(self, owner: Optional[str] = None) -> Optional[str]:
+        """
+        Entrega un recurso del pool o None si no hay ninguno disponible.
+        Los compartibles rotan y permanecen en el pool; los consumibles se retiran.
+        """
+        with self._lock:
+            items = self._items.get(owner)
+            if not items:
+                return None
+            if self.kind == SHAREABLE:
+                items.rotate(-1)
+                return items[-1]
+            return items.popleft()
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(items) for items in self._items.values())
+
+
+class ResourceProvisioner:
+    """
+    Crea recursos de prueba en paralelo y los entrega desde pools tipados.
+
+    Requiere un ApiClient y un TokenBroker: los aviones y vuelos se crean como
+    administrador, y las reservas y pagos con el token de cada pasajero del pool.
+    """
+
+    def __init__(self, client, broker, max_workers: int = 8):
+        self.client = client
+        self.broker = broker
+        self.max_workers = max_workers
+        self.pools = {
+            "aircraft": ResourcePool("aircraft", SHAREABLE),
+            "flights": ResourcePool("flights", CONSUMABLE),
+            "bookings": ResourcePool("bookings", CONSUMABLE),
+            "payments": ResourcePool("payments", CONSUMABLE),
+        }
+        self.errors: List[str] = []
+
+    # --- Entrega ---
+
+    def take(self, kind: str, token: Optional[str] = None) -> Optional[str]:
+        """
+        Entrega un recurso del pool 'kind'. Para reservas y pagos se debe indicar el
+        token del pasajero, y sólo se entregan recursos creados por ese pasajero.
+        """
+        owner = self.broker.owner_of(token) if token else None
+        return self.pools[kind].take(owner)
+
+    def available(self, kind: str) -> int:
+        """Cantidad de recursos que quedan en el pool 'kind' (de cualquier dueño)."""
+        return len(self.pools[kind])
+
+    # --- Creación individual ---
+
+    def _create(self, path: str, payload: dict, token: str, ok_codes=(201,)) -> str:
+        response = self.client.post(path, json=payload, headers={"Authorization": f"Bearer {token}"})
+        if response.status_code not in ok_codes:
+            raise ProvisioningError(
+                f"POST {path} devolvió {response.status_code}. Cuerpo de la respuesta: {response.text}",
+                response,
+            )
+        created = response.json()
+        if "id" not in created:
+            raise ProvisioningError(f"Falta 'id' en la respuesta de POST {path}.", response)
+        return created["id"]
+
+    def create_aircraft(self, admin_token: str) -> str:
+        return self._create("/aircrafts", aircraft_payload(), admin_token)
+
+    def create_flight(self, admin_token: str, aircraft_id: str) -> str:
+        # La API puede devolver 200 en lugar de 201 de forma intermitente
+        return self._create("/flights", flight_payload(aircraft_id), admin_token, ok_codes=(200, 201))
+
+    def create_booking(self, user_token: str, flight_id: str) -> str:
+        return self._create("/bookings", booking_payload(flight_id), user_token)
+
+    def create_payment(self, user_token: str, booking_id: str) -> str:
+        return self._create("/payments", payment_payload(booking_id), user_token)
+
+    # --- Aprovisionamiento en bloque ---
+
+    def _run_parallel(self, tasks: List[Callable[[], Optional[str]]]) -> List[str]:
+        """Ejecuta las tareas en el pool de hilos y devuelve los resultados exitosos."""
+        if not tasks:
+            return []
+
+        def guarded(task):
+            try:
+                return task()
+            except (ProvisioningError, TokenError, requests.exceptions.RequestException, ValueError) as e:
+                self.errors.append(str(e))
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return [result for result in executor.map(guarded, tasks) if result is not None]
+
+    def provision(self, aircraft: int = 1, flights: int = 0, bookings: int = 0, payments: int = 0) -> dict:
+        """
+        Crea los recursos pedidos y los agrega a los pools.
+
+        Las reservas y los pagos se reparten a partes iguales entre los pasajeros del
+        pool del broker. Los fallos individuales se registran en 'errors' sin abortar
+        el resto: las fixtures crean bajo demanda lo que falte.
+
+        Returns:
+            dict: cantidad creada por tipo de recurso y duración total en segundos.
+        """
+        start = time.perf_counter()
+        admin_token = self.broker.admin_token()
+        passengers = self.broker.passenger_accounts() if bookings or payments else []
+
+        # 1. Aviones (al menos uno si hace falta crear vuelos)
+        aircraft = max(aircraft, 1 if flights or bookings or payments else 0)
+        aircraft_ids = self._run_parallel([lambda: self.create_aircraft(admin_token)] * aircraft)
+        for aircraft_id in aircraft_ids:
+            self.pools["aircraft"].add(aircraft_id)
+
+        # 2. Vuelos del pool más uno de respaldo para las reservas y pagos aprovisionados
+        backing_flight = 1 if passengers else 0
+        flight_ids = []
+        if aircraft_ids:
+            flight_ids = self._run_parallel([
+                (lambda i=i: self.create_flight(admin_token, aircraft_ids[i % len(aircraft_ids)]))
+                for i in range(flights + backing_flight)
+            ])
+        backing_flight_id = flight_ids.pop() if backing_flight and flight_ids else None
+        for flight_id in flight_ids:
+            self.pools["flights"].add(flight_id)
+
+        # 3. Reservas: las del pool y las que después se pagan
+        created = {"aircraft": len(aircraft_ids), "flights": len(flight_ids), "bookings": 0, "payments": 0}
+        if backing_flight_id:
+            per_passenger = lambda total: -(-total // len(passengers))
+            booking_tasks = []
+            for account in passengers:
+                for purpose in ["bookings"] * per_passenger(bookings) + ["payments"] * per_passenger(payments):
+                    booking_tasks.append(
+                        lambda a=account, p=purpose: (a, p, self.create_booking(
+                            self.broker.token_for(a), backing_flight_id))
+                    )
+            payment_tasks = []
+            for account, purpose, booking_id in self._run_parallel(booking_tasks):
+                if purpose == "bookings":
+                    self.pools["bookings"].add(booking_id, owner=account.email)
+                    created["bookings"] += 1
+                else:
+                    payment_tasks.append(
+                        lambda a=account, b=booking_id: (a, self.create_payment(self.broker.token_for(a), b))
+                    )
+
+            # 4. Pagos
+            for account, payment_id in self._run_parallel(payment_tasks):
+                self.pools["payments"].add(payment_id, owner=account.email)
+                created["payments"] += 1
+
+        created["seconds"] = round(time.perf_counter() - start, 2)
+        return created
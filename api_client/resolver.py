@@ -0,0 +1,201 @@
+"""
+Resolución paralela de las fixtures de recursos de la API.
+
+Las fixtures de conftest.py registran su lógica de creación como nodos de un
+ResourceGraph, declarando de qué otros recursos dependen (p. ej. booking_id depende
+de user_token y flight_id). Para cada prueba, ParallelResolver resuelve los recursos
+que ésta pide ejecutando las ramas independientes del grafo a la vez en un pool de
+hilos, y mide el camino crítico: el tiempo de preparación que no se puede reducir
+aunque todo lo independiente corra en paralelo.
+"""
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+class ResourceGraph:
+    """Registro de proveedores de recursos y de sus dependencias."""
+
+    def __init__(self):
+        self.providers: Dict[str, Callable] = {}
+        self.dependencies: Dict[str, tuple] = {}
+
+    def node(self, name: str, deps: Iterable[str] = ()):
+        """
+        Decorador que registra el proveedor del recurso 'name'.
+
+        El proveedor recibe un contexto con los servicios de la sesión (api_client,
+        token_broker, resource_pool...) y el método need(*nombres) para obtener sus
+        dependencias; las que se piden en una misma llamada se resuelven a la vez.
+        """
+        def decorator(func):
+            self.providers[name] = func
+            self.dependencies[name] = tuple(deps)
+            return func
+        return decorator
+
+    def __contains__(self, name):
+        return name in self.providers
+
+    def validate(self):
+        """Verifica que todas las dependencias existan y que el grafo no tenga ciclos."""
+        visiting, done = set(), set()
+
+        def visit(name, path):
+            if name not in self.providers:
+                raise ValueError(f"Dependencia desconocida '{name}' en {' -> '.join(path)}.")
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Ciclo de dependencias: {' -> '.join(path + [name])}.")
+            visiting.add(name)
+            for dep in self.dependencies[name]:
+                visit(dep, path + [name])
+            visiting.discard(name)
+            done.add(name)
+
+        for name in self.providers:
+            visit(name, [])
+
+
+@dataclass
+class NodeTiming:
+    """Tiempos de resolución de un nodo."""
+    name: str
+    own_ms: float = 0.0
+    critical_ms: float = 0.0
+    blocked_ms: float = 0.0
+    critical_dep: Optional[str] = None
+    waited: List[str] = field(default_factory=list)
+
+
+class _Context:
+    """Contexto que recibe cada proveedor."""
+
+    def __init__(self, resolver, services):
+        self.__dict__.update(services)
+        self._resolver = resolver
+
+    def need(self, *names):
+        values = self._resolver.need(*names)
+        return values[0] if len(names) == 1 else values
+
+
+class ParallelResolver:
+    """
+    Resuelve los recursos de una prueba respetando el grafo de dependencias.
+
+    Con parallel=False resuelve en el hilo actual, en el mismo orden en que lo haría
+    pytest; los tiempos del camino crítico se miden igual en ambos modos.
+    """
+
+    def __init__(self, graph: ResourceGraph, roots: Iterable[str], parallel: bool = True, **services):
+        self.graph = graph
+        self.roots = [name for name in roots if name in graph]
+        self.parallel = parallel
+        self.context = _Context(self, services)
+        self.timings: Dict[str, NodeTiming] = {}
+        self.wall_ms = 0.0
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._executor = None
+        self._resolved = False
+
+    # --- API pública ---
+
+    def get(self, name: str):
+        """
+        Devuelve el valor del recurso. En la primera llamada resuelve a la vez todos
+        los recursos que pide la prueba.
+        """
+        if not self._resolved:
+            self._resolved = True
+            start = time.perf_counter()
+            try:
+                self.need(*self.roots)
+            finally:
+                self.wall_ms = (time.perf_counter() - start) * 1000
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                    self._executor = None
+        return self.need(name)[0]
+
+    def need(self, *names) -> tuple:
+        """
+        Lanza los recursos indicados (a la vez, en modo paralelo) y espera sus valores.
+        Un proveedor sólo puede pedir las dependencias que declaró en el grafo.
+        """
+        current = getattr(self._local, "node", None)
+        if current is not None:
+            undeclared = set(names) - set(self.graph.dependencies[current.name])
+            if undeclared:
+                raise ValueError(f"El recurso '{current.name}' no declara las dependencias {sorted(undeclared)}.")
+        start = time.perf_counter()
+        try:
+            # En modo secuencial _submit ya resuelve el nodo: también cuenta como espera
+            for name in names:
+                self._submit(name)
+            return tuple(self._futures[name].result() for name in names)
+        finally:
+            if current is not None:
+                current.blocked_ms += (time.perf_counter() - start) * 1000
+                current.waited.extend(name for name in names if name not in current.waited)
+
+    def report(self) -> dict:
+        """Resumen de la resolución: tiempo real, suma en serie y camino crítico."""
+        if not self.timings:
+            return {"wall_ms": round(self.wall_ms, 1), "serial_ms": 0.0, "critical_ms": 0.0, "critical_path": []}
+        last = max(self.timings.values(), key=lambda t: t.critical_ms)
+        path = []
+        node = last
+        while node is not None:
+            path.append(node.name)
+            node = self.timings.get(node.critical_dep) if node.critical_dep else None
+        return {
+            "wall_ms": round(self.wall_ms, 1),
+            "serial_ms": round(sum(t.own_ms for t in self.timings.values()), 1),
+            "critical_ms": round(last.critical_ms, 1),
+            "critical_path": list(reversed(path)),
+        }
+
+    # --- Ejecución de nodos ---
+
+    def _submit(self, name: str):
+        with self._lock:
+            if name in self._futures:
+                return
+            if self.parallel:
+                if self._executor is None:
+                    # Un hilo por nodo: un nodo esperando a sus dependencias nunca bloquea el pool
+                    self._executor = ThreadPoolExecutor(max_workers=len(self.graph.providers),
+                                                        thread_name_prefix="resource")
+                self._futures[name] = self._executor.submit(self._run, name)
+                return
+            future = Future()
+            self._futures[name] = future
+        # En modo secuencial se resuelve en el hilo actual
+        try:
+            future.set_result(self._run(name))
+        except BaseException as e:
+            future.set_exception(e)
+
+    def _run(self, name: str):
+        timing = NodeTiming(name)
+        previous = getattr(self._local, "node", None)
+        self._local.node = timing
+        start = time.perf_counter()
+        try:
+            return self.graph.providers[name](self.context)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._local.node = previous
+            timing.own_ms = max(elapsed_ms - timing.blocked_ms, 0.0)
+            waited = [self.timings[dep] for dep in timing.waited if dep in self.timings]
+            critical_dep = max(waited, key=lambda t: t.critical_ms, default=None)
+            timing.critical_dep = critical_dep.name if critical_dep else None
+            timing.critical_ms = timing.own_ms + (critical_dep.critical_ms if critical_dep else 0.0)
+            with self._lock:
+                self.timings[name] = timing
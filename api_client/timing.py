@@ -0,0 +1,178 @@
+"""
+Desglose por fases del tiempo de cada petición HTTP (DNS, conexión, TLS, TTFB y descarga).
+
+TimingAdapter reemplaza las clases de conexión de urllib3 por versiones que miden
+cada fase y las dejan en una variable local al hilo; ApiClient.request las lee al
+terminar la petición y las guarda en su RequestTiming. Las conexiones keep-alive
+reutilizadas no pasan por DNS, conexión ni TLS, así que esas fases quedan en 0.
+
+También agrupa los registros por endpoint (plantilla de ruta, p. ej. "GET /bookings/{id}")
+para los reportes de pytest-html y Allure (ver conftest.py).
+"""
+import socket
+import threading
+import time
+from typing import Dict, Iterable, List
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+PHASES = ("dns_ms", "connect_ms", "tls_ms", "ttfb_ms", "download_ms")
+
+_local = threading.local()
+
+
+def reset_phases():
+    """Inicia la medición de una petición en el hilo actual."""
+    _local.phases = dict.fromkeys(PHASES, 0.0)
+    _local.phases["reused"] = True
+    _local.headers_at = None
+
+
+def current_phases() -> dict:
+    """Fases medidas en el hilo actual desde el último reset_phases()."""
+    phases = getattr(_local, "phases", None)
+    if phases is None:
+        reset_phases()
+        phases = _local.phases
+    return phases
+
+
+def finish_phases() -> dict:
+    """Cierra la medición: la descarga es el tiempo desde que llegaron las cabeceras."""
+    phases = dict(current_phases())
+    headers_at = getattr(_local, "headers_at", None)
+    if headers_at is not None:
+        phases["download_ms"] = (time.perf_counter() - headers_at) * 1000
+    return phases
+
+
+class TimedHTTPConnection(HTTPConnection):
+    """Conexión HTTP que mide la resolución DNS, la conexión TCP y el TTFB."""
+
+    def _new_conn(self):
+        phases = current_phases()
+        phases["reused"] = False
+        start = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(self._dns_host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror:
+            # urllib3 vuelve a resolver y eleva su propio NameResolutionError
+            addresses = []
+        phases["dns_ms"] = (time.perf_counter() - start) * 1000
+
+        dns_host = self._dns_host
+        start = time.perf_counter()
+        try:
+            if not addresses:
+                return super()._new_conn()
+            # Conectar a las IPs ya resueltas (para no medir el DNS dos veces), en orden y pasando a
+            # la siguiente si una falla, como urllib3.util.connection.create_connection
+            error = None
+            for address in addresses:
+                self._dns_host = address[4][0]
+                try:
+                    return super()._new_conn()
+                except (ConnectTimeoutError, NewConnectionError) as e:
+                    error = e
+            raise error
+        finally:
+            self._dns_host = dns_host
+            phases["connect_ms"] = (time.perf_counter() - start) * 1000
+
+    def getresponse(self, *args, **kwargs):
+        start = time.perf_counter()
+        response = super().getresponse(*args, **kwargs)
+        _local.headers_at = time.perf_counter()
+        current_phases()["ttfb_ms"] = (_local.headers_at - start) * 1000
+        return response
+
+
+class TimedHTTPSConnection(TimedHTTPConnection, HTTPSConnection):
+    """Conexión HTTPS que además mide el handshake TLS."""
+
+    def connect(self):
+        start = time.perf_counter()
+        super().connect()
+        phases = current_phases()
+        elapsed = (time.perf_counter() - start) * 1000
+        phases["tls_ms"] = max(0.0, elapsed - phases["dns_ms"] - phases["connect_ms"])
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimingAdapter(HTTPAdapter):
+    """Adaptador de requests cuyas conexiones miden cada fase de la petición."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+def _empty_group() -> dict:
+    return {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "new_connections": 0, "statuses": {},
+            **dict.fromkeys(PHASES, 0.0)}
+
+
+def summarize(timings: Iterable) -> Dict[str, dict]:
+    """
+    Agrupa los RequestTiming por endpoint: cantidad, tiempo total, promedio, máximo,
+    suma de cada fase y conexiones nuevas. Ordenado de mayor a menor tiempo total.
+    """
+    groups: Dict[str, dict] = {}
+    for timing in timings:
+        group = groups.setdefault(timing.endpoint, _empty_group())
+        group["count"] += 1
+        group["total_ms"] += timing.elapsed_ms
+        group["max_ms"] = max(group["max_ms"], timing.elapsed_ms)
+        group["new_connections"] += not timing.reused
+        status = str(timing.status_code)
+        group["statuses"][status] = group["statuses"].get(status, 0) + 1
+        for phase in PHASES:
+            group[phase] += getattr(timing, phase)
+    for group in groups.values():
+        group["mean_ms"] = group["total_ms"] / group["count"]
+        for key in ("total_ms", "max_ms", "mean_ms", *PHASES):
+            group[key] = round(group[key], 3)
+    return dict(sorted(groups.items(), key=lambda item: item[1]["total_ms"], reverse=True))
+
+
+def merge_summaries(summaries: Iterable[Dict[str, dict]]) -> Dict[str, dict]:
+    """Suma los resúmenes de varias pruebas (p. ej. los que llegan de cada worker de xdist)."""
+    merged: Dict[str, dict] = {}
+    for summary in summaries:
+        for endpoint, group in summary.items():
+            target = merged.setdefault(endpoint, _empty_group())
+            for key in ("count", "total_ms", "new_connections", *PHASES):
+                target[key] += group[key]
+            target["max_ms"] = max(target["max_ms"], group["max_ms"])
+            for status, count in group["statuses"].items():
+                target["statuses"][status] = target["statuses"].get(status, 0) + count
+    for group in merged.values():
+        group["mean_ms"] = group["total_ms"] / group["count"]
+    return dict(sorted(merged.items(), key=lambda item: item[1]["total_ms"], reverse=True))
+
+
+def format_summary(summary: Dict[str, dict], limit: int = None) -> List[str]:
+    """Tabla de texto de un resumen por endpoint (tiempos en ms)."""
+    lines = [f"{'endpoint':34} {'n':>4} {'total':>9} {'prom':>8} {'máx':>8} "
+             f"{'dns':>7} {'conn':>7} {'tls':>7} {'ttfb':>9} {'desc':>7} {'nuevas':>6}"]
+    for endpoint, group in list(summary.items())[:limit]:
+        lines.append(
+            f"{endpoint:34} {group['count']:4} {group['total_ms']:9.1f} {group['mean_ms']:8.1f} "
+            f"{group['max_ms']:8.1f} {group['dns_ms']:7.1f} {group['connect_ms']:7.1f} {group['tls_ms']:7.1f} "
+            f"{group['ttfb_ms']:9.1f} {group['download_ms']:7.1f} {group['new_connections']:6}"
+        )
+    return lines
@@ -0,0 +1,253 @@
+"""
+Broker de tokens JWT para las pruebas de API.
+
+Registra una sola vez por sesión (o por worker de xdist) un pool de pasajeros de
+prueba, reparte sus tokens en round-robin y los renueva antes de que expiren
+leyendo el claim 'exp' del JWT. Las cuentas y sus tokens se guardan en disco, de
+modo que una nueva ejecución dentro de la vigencia del token no necesita ni
+registro ni login. La caché no guarda contraseñas (las cuentas de prueba usan las
+constantes de este módulo) y no se da por buena a ciegas: la primera vez que se usa
+una cuenta cacheada su token se verifica contra /users/me, y si el servidor ya no la
+reconoce (reinicio, base de datos limpia) se descarta y se registra otra en su lugar.
+"""
+import base64
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import List, Optional
+
+import requests
+
+from storage.json_files import read_json, update_json
+
+# Vigencia asumida cuando el token no trae claim 'exp' (segundos)
+DEFAULT_TOKEN_TTL = 15 * 60
+# Margen con el que se renueva un token antes de su expiración (segundos)
+DEFAULT_REFRESH_MARGIN = 60
+
+ADMIN_EMAIL = "admin@demo.com"
+ADMIN_PASSWORD = "admin123"
+PASSENGER_PASSWORD = "SecurePass123!"
+
+
+class TokenError(Exception):
+    """No fue posible obtener un token de la API."""
+
+    def __init__(self, message: str, response: Optional[requests.Response] = None):
+        super().__init__(message)
+        self.response = response
+
+
+def decode_jwt_exp(token: str) -> Optional[float]:
+    """
+    Devuelve el claim 'exp' (epoch en segundos) de un JWT sin verificar la firma,
+    o None si el token no tiene ese claim o no se puede decodificar.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+@dataclass
+class Account:
+    """Cuenta de prueba con su último token conocido."""
+    email: str
+    password: str
+    full_name: str
+    token: Optional[str] = None
+    expires_at: float = 0.0
+
+    def is_valid(self, margin: float = DEFAULT_REFRESH_MARGIN) -> bool:
+        return bool(self.token) and self.expires_at - margin > time.time()
+
+
+def _cached(account: Account) -> dict:
+    """Cuenta tal como se guarda en la caché: sin la contraseña."""
+    data = asdict(account)
+    del data["password"]
+    return data
+
+
+def _from_cache(data: dict, password: str) -> Account:
+    # Las cachés escritas antes de quitar las contraseñas todavía la traen: se ignora
+    return Account(**{**data, "password": password})
+
+
+class TokenBroker:
+    """
+    Reparte tokens de pasajeros (round-robin) y del administrador.
+
+    Es seguro usarlo desde varios hilos. Si se indica cache_path, las cuentas y
+    sus tokens se persisten en ese archivo JSON.
+    """
+
+    def __init__(self, client, pool_size: int = 3, cache_path: Optional[Path] = None,
+                 refresh_margin: float = DEFAULT_REFRESH_MARGIN, worker_id: Optional[str] = None):
+        self.client = client
+        self.pool_size = pool_size
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.refresh_margin = refresh_margin
+        self.worker_id = worker_id or os.getenv("PYTEST_XDIST_WORKER", "master")
+        self.admin = Account(ADMIN_EMAIL, ADMIN_PASSWORD, "Admin")
+        self.passengers: List[Account] = []
+        self._next = 0
+        self._lock = threading.RLock()
+        # Cuentas leídas de la caché que todavía no se verificaron contra el servidor
+        self._unverified = set()
+        self._load_cache()
+
+    # --- API pública ---
+
+    def admin_token(self) -> str:
+        """Token del administrador preexistente, renovado si está por expirar."""
+        with self._lock:
+            self._verify_cached(self.admin)
+            return self._ensure_token(self.admin)
+
+    def passenger_token(self) -> str:
+        """Siguiente token de pasajero del pool (round-robin)."""
+        with self._lock:
+            self._fill_pool()
+            account = self.passengers[self._next % len(self.passengers)]
+            self._next += 1
+            return self._ensure_token(account)
+
+    def passenger_accounts(self) -> List[Account]:
+        """Cuentas del pool de pasajeros (se registran si aún no existen)."""
+        with self._lock:
+            self._fill_pool()
+            return list(self.passengers)
+
+    def token_for(self, account: Account) -> str:
+        """Token vigente de una cuenta concreta del pool."""
+        with self._lock:
+            return self._ensure_token(account)
+
+    def owner_of(self, token: str) -> Optional[str]:
+        """Email del pasajero al que pertenece el token, o None si no es del pool."""
+        with self._lock:
+            for account in self.passengers:
+                if account.token == token:
+                    return account.email
+            return None
+
+    # --- Gestión del pool ---
+
+    def _fill_pool(self):
+        """
+        Descarta los pasajeros cacheados que el servidor ya no reconoce y registra pasajeros
+        hasta completar el pool; tolera fallos parciales del signup.
+        """
+        for account in list(self.passengers):
+            if not self._cached_account_usable(account):
+                self.passengers.remove(account)
+                self._save_cache()
+        last_error = None
+        attempts = 0
+        while len(self.passengers) < self.pool_size and attempts < self.pool_size * 2:
+            attempts += 1
+            try:
+                self.passengers.append(self._signup())
+            except TokenError as e:
+                last_error = e
+        if self.passengers:
+            self._save_cache()
+            return
+        raise last_error or TokenError("No se pudo registrar ningún pasajero de prueba.")
+
+    def _signup(self) -> Account:
+        suffix = uuid.uuid4().hex[:8]
+        account = Account(
+            email=f"pool_{self.worker_id}_{suffix}@test.com",
+            password=PASSENGER_PASSWORD,
+            full_name=f"Pool Passenger {suffix}",
+        )
+        response = self.client.post("/auth/signup", json={
+            "email": account.email,
+            "password": account.password,
+            "full_name": account.full_name,
+        })
+        if response.status_code != 201:
+            raise TokenError(
+                f"El registro del pasajero '{account.email}' devolvió {response.status_code}. "
+                f"Cuerpo de la respuesta: {response.text}",
+                response,
+            )
+        return account
+
+    def _cached_account_usable(self, account: Account) -> bool:
+        """False si la cuenta, leída de la caché, ya no existe en el servidor (401 al usarla o al hacer login)."""
+        if account.email not in self._unverified:
+            return True
+        self._verify_cached(account)
+        try:
+            self._ensure_token(account)
+        except TokenError as e:
+            if e.response is not None and e.response.status_code == 401:
+                return False
+            raise
+        return True
+
+    def _verify_cached(self, account: Account):
+        """Olvida el token cacheado de la cuenta si el servidor lo rechaza (se volverá a hacer login)."""
+        if account.email not in self._unverified:
+            return
+        self._unverified.discard(account.email)
+        if not account.is_valid(self.refresh_margin):
+            return
+        response = self.client.get("/users/me", headers={"Authorization": f"Bearer {account.token}"})
+        if response.status_code == 401:
+            account.token = None
+            account.expires_at = 0.0
+
+    def _ensure_token(self, account: Account) -> str:
+        if not account.is_valid(self.refresh_margin):
+            self._login(account)
+            self._save_cache()
+        return account.token
+
+    def _login(self, account: Account):
+        response = self.client.post("/auth/login", data={"username": account.email, "password": account.password})
+        if response.status_code != 200:
+            raise TokenError(
+                f"El login de '{account.email}' devolvió {response.status_code}. "
+                f"Cuerpo de la respuesta: {response.text}",
+                response,
+            )
+        token = response.json().get("access_token")
+        if not token:
+            raise TokenError(f"La respuesta de login de '{account.email}' no contiene 'access_token'.", response)
+        account.token = token
+        account.expires_at = decode_jwt_exp(token) or time.time() + DEFAULT_TOKEN_TTL
+
+    # --- Caché en disco ---
+
+    def _cache_key(self) -> str:
+        return f"{self.client.base_url}|{self.worker_id}"
+
+    def _load_cache(self):
+        if not self.cache_path:
+            return
+        data = read_json(self.cache_path, {}).get(self._cache_key(), {})
+        if data.get("admin"):
+            self.admin = _from_cache(data["admin"], ADMIN_PASSWORD)
+        self.passengers = [_from_cache(a, PASSENGER_PASSWORD) for a in data.get("passengers", [])][:self.pool_size]
+        self._unverified = {account.email for account in [self.admin] + self.passengers}
+
+    def _save_cache(self):
+        if not self.cache_path:
+            return
+        entry = {
+            "admin": _cached(self.admin),
+            "passengers": [_cached(a) for a in self.passengers],
+        }
+        # Cada worker guarda sólo su entrada; si falla el disco se vuelven a registrar las cuentas
+        update_json(self.cache_path, lambda content: {**content, self._cache_key(): entry}, indent=2)
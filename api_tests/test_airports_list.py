@@ -1,7 +1,7 @@
-import requests
+import json
 import pytest
-from jsonschema import validate
-from conftest import BASE_URL
+from jsonschema import ValidationError
+from schemas import registry
 
 """
 TC-API-10: Listar todos los aeropuertos.
@@ -12,25 +12,18 @@ Objetivo: Verificar que se puedan listar todos los aeropuertos disponibles.
 @pytest.mark.airports
 @pytest.mark.positive
 @pytest.mark.api
-def test_list_airports():
-    response = requests.get(f"{BASE_URL}/airports")
+def test_list_airports(api_client):
+    response = api_client.get("/airports", stream=True)
 
     # Verificar que la respuesta sea exitosa
     assert response.status_code == 200, f"Esperaba 200, obtuvo {response.status_code}"
 
-    airports = response.json()
+    # Validar cada aeropuerto contra AIRPORT_SCHEMA a medida que se lee la respuesta
+    try:
+        total = registry.validate_stream("airport", response)
+    except json.JSONDecodeError as e:
+        pytest.fail(f"Se esperaba una lista JSON de aeropuertos: {e}")
+    except ValidationError as e:
+        pytest.fail(f"La lista de aeropuertos no cumple el esquema: {e.message}")
 
-    # Verificar que la respuesta sea una lista
-    assert isinstance(airports, list), f"Se esperaba una lista, se obtuvo {type(airports)}"
-
-    # Verificar que haya al menos un aeropuerto
-    # assert len(airports) > 0, "La lista de aeropuertos está vacía"
-    # Verificación básica de un elemento
-    if airports:
-        first_airport = airports[0]
-        # Verificar campos básicos esperados
-        assert "iata_code" in first_airport, "Falta 'iata_code' en el aeropuerto"
-        assert "city" in first_airport, "Falta 'city' en el aeropuerto"
-        assert "country" in first_airport, "Falta 'country' en el aeropuerto"
-        # Validar que iata_code tenga 3 letras mayúsculas
-    print(f"✅ Listados {len(airports)} aeropuertos.")
+    print(f"✅ Listados {total} aeropuertos.")
@@ -0,0 +1,38 @@
+import pytest
+
+"""
+Caso de prueba: TC-API-22 en modo asíncrono: Obtener reserva (GET /bookings/{booking_id})
+Objetivo: Ejemplo del modo asíncrono opcional. La reserva se crea con async_resources
+(registro del pasajero y cadena avión -> vuelo en paralelo) y se consulta con async_api_client.
+"""
+@pytest.mark.TC_API_22
+@pytest.mark.medium
+@pytest.mark.bookings
+@pytest.mark.positive
+@pytest.mark.async_mode
+@pytest.mark.api
+async def test_get_booking_by_id_async(async_api_client, async_resources):
+    """
+    TC-API-22 (modo asíncrono): Obtener reserva.
+    """
+    user_token, booking_id = await async_resources.booking_id()
+    headers = {"Authorization": f"Bearer {user_token}"}
+
+    # 1. Hacer la solicitud GET a /bookings/{booking_id}
+    response = await async_api_client.get(f"/bookings/{booking_id}", headers=headers)
+
+    # 2. Verificar el código de estado.
+    if response.status_code == 500:
+        pytest.fail(
+            f"La API devolvió un error 500 (Internal Server Error) al intentar obtener la reserva. "
+            f"Cuerpo de la respuesta: {response.text}"
+        )
+    assert response.status_code == 200, (
+        f"Se esperaba 200 OK, se obtuvo {response.status_code}. Cuerpo de la respuesta: {response.text}"
+    )
+
+    # 3. Verificar que la respuesta es la reserva pedida
+    booking = response.json()
+    assert booking.get("id") == booking_id, (
+        f"El ID de la reserva devuelta ({booking.get('id')}) no coincide con el pedido ({booking_id})."
+    )
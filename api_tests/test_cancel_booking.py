@@ -1,6 +1,4 @@
-import requests
 import pytest
-from conftest import BASE_URL
 
 """
 Caso de prueba: TC-API-23: Cancelar reserva (DELETE /bookings/{booking_id})
@@ -11,7 +9,7 @@ Objetivo: Verificar que un usuario autenticado pueda cancelar una de sus reserva
 @pytest.mark.bookings
 @pytest.mark.e2e
 @pytest.mark.api
-def test_cancel_booking_as_owner(user_token, booking_id):
+def test_cancel_booking_as_owner(api_client, user_token, booking_id):
     """
     TC-API-23: Cancelar reserva.
     Este test recibe 'user_token' y 'test_booking_id' de los fixtures.
@@ -20,7 +18,7 @@ def test_cancel_booking_as_owner(user_token, booking_id):
     booking_id_to_cancel = booking_id # El ID viene del fixture
 
     # 3. Hacer la solicitud DELETE a /bookings/{booking_id}
-    response = requests.delete(f"{BASE_URL}/bookings/{booking_id_to_cancel}", headers=headers)
+    response = api_client.delete(f"/bookings/{booking_id_to_cancel}", headers=headers)
 
     # 4. Verificar el código de estado.
     # Manejar errores comunes
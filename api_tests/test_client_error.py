@@ -1,6 +1,4 @@
-import requests
 import pytest
-from conftest import BASE_URL
 
 """
 Caso de prueba: TC-API-30: Probar error 400 (GET /glitch-examples/client-error)
@@ -10,12 +8,12 @@ Objetivo: Verificar que la API devuelva correctamente un error 400 Bad Request c
 @pytest.mark.medium
 @pytest.mark.negative
 @pytest.mark.api
-def test_client_error_endpoint_returns_400():
+def test_client_error_endpoint_returns_400(api_client):
     """
     TC-API-30: Probar error 400.
     """
     # 1. Hacer la solicitud GET al endpoint que devuelve error 400
-    response = requests.get(f"{BASE_URL}/glitch-examples/client-error")
+    response = api_client.get("/glitch-examples/client-error")
 
     # 2. Verificar el código de estado.
     # Manejar errores comunes
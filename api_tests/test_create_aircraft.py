@@ -1,9 +1,7 @@
-import requests
 import pytest
 import time
 import random
 import string
-from conftest import BASE_URL
 
 """
 Caso de prueba: TC-API-27: Crear aeronave (POST /aircrafts)
@@ -14,7 +12,7 @@ Objetivo: Verificar que un usuario autenticado como admin pueda crear una nueva
 @pytest.mark.aircrafts
 @pytest.mark.positive
 @pytest.mark.api
-def test_create_aircraft_as_admin(admin_token):
+def test_create_aircraft_as_admin(api_client, admin_token):
     """
     TC-API-27: Crear aeronave.
     Este test recibe 'admin_token' de los fixtures.
@@ -34,7 +32,7 @@ def test_create_aircraft_as_admin(admin_token):
     }
 
     # 3. Hacer la solicitud POST a /aircrafts
-    response = requests.post(f"{BASE_URL}/aircrafts", json=new_aircraft_data, headers=headers)
+    response = api_client.post("/aircrafts", json=new_aircraft_data, headers=headers)
 
     # 4. Verificar el código de estado.
     # Manejar errores comunes
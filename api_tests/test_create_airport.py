@@ -1,9 +1,7 @@
-import requests
 import pytest
 import time
 import random
 import string
-from conftest import BASE_URL
 from jsonschema import validate
 
 """
@@ -15,7 +13,7 @@ Objetivo : Crear un nuevo aeropuerto con código IATA válido.
 @pytest.mark.airports
 @pytest.mark.positive
 @pytest.mark.api
-def test_create_airport(admin_token):
+def test_create_airport(api_client, admin_token):
     """
     TC-API-11: Crear aeropuerto.
     Este test recibe 'admin_token' de los fixtures.
@@ -39,7 +37,7 @@ def test_create_airport(admin_token):
     }
 
     # 3. Hacer la solicitud POST a /airports
-    response = requests.post(f"{BASE_URL}/airports", json=new_airport_data, headers=headers)
+    response = api_client.post("/airports", json=new_airport_data, headers=headers)
 
     # 4. Verificar el código de estado.
     # Manejar errores comunes
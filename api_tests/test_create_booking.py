@@ -1,7 +1,5 @@
-import requests
 import pytest
 import time
-from conftest import BASE_URL
 from datetime import datetime, timedelta, timezone
 from jsonschema import validate
 
@@ -14,7 +12,7 @@ Objetivo: Crear una nueva reserva para un usuario autorizado.
 @pytest.mark.bookings
 @pytest.mark.e2e
 @pytest.mark.api
-def test_create_booking_as_user(user_token, flight_id):
+def test_create_booking_as_user(api_client, user_token, flight_id):
     """
     TC-API-20: Crear reserva.
     Este test recibe 'user_token' y 'flight_id' de los fixtures.
@@ -40,7 +38,7 @@ def test_create_booking_as_user(user_token, flight_id):
     }
 
     # 4. Hacer la solicitud POST a /bookings
-    response = requests.post(f"{BASE_URL}/bookings", json=new_booking_data, headers=user_headers)
+    response = api_client.post("/bookings", json=new_booking_data, headers=user_headers)
 
     # 5. Verificar el código de estado.
     # Manejar errores comunes
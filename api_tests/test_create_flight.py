@@ -1,7 +1,5 @@
-import requests
 import pytest
 import time
-from conftest import BASE_URL
 from datetime import timezone
 from datetime import datetime, timedelta
 from jsonschema import validate
@@ -15,7 +13,7 @@ Objetivo: crear un nuevo vuelo con fechas y códigos válidos.
 @pytest.mark.flights
 @pytest.mark.positive
 @pytest.mark.api
-def test_create_flight_as_admin(admin_token, aircraft_id):
+def test_create_flight_as_admin(api_client, admin_token, aircraft_id):
     """
     TC-API-16: Crear vuelo.
     Este test recibe 'admin_token' y 'test_aircraft_id' de los fixtures.
@@ -38,7 +36,7 @@ def test_create_flight_as_admin(admin_token, aircraft_id):
     }
 
     # 3. Hacer la solicitud POST a /flights
-    response = requests.post(f"{BASE_URL}/flights", json=new_flight_data, headers=headers)
+    response = api_client.post("/flights", json=new_flight_data, headers=headers)
 
     # 4. Verificar el código de estado.
     # Manejar errores comunes
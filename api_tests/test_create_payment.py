@@ -1,6 +1,4 @@
-import requests
 import pytest
-from conftest import BASE_URL
 
 """
 Caso de prueba: TC-API-24: Crear pago (POST /payments)
@@ -11,7 +9,7 @@ Objetivo: Verificar que un usuario autenticado pueda crear un nuevo pago para un
 @pytest.mark.payments
 @pytest.mark.e2e
 @pytest.mark.api
-def test_create_payment_as_user(user_token, booking_id):
+def test_create_payment_as_user(api_client, user_token, booking_id):
     """
     TC-API-24: Crear pago.
     Este test recibe 'user_token' y 'test_booking_id' de los fixtures.
@@ -27,7 +25,7 @@ def test_create_payment_as_user(user_token, booking_id):
     }
 
     # 4. Hacer la solicitud POST a /payments
-    response = requests.post(f"{BASE_URL}/payments", json=new_payment_data, headers=headers)
+    response = api_client.post("/payments", json=new_payment_data, headers=headers)
 
     # 5. Verificar el código de estado.
     # Manejar errores comunes
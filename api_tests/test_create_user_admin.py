@@ -1,7 +1,5 @@
-import requests
 import pytest
 import time
-from conftest import BASE_URL
 from jsonschema import validate
 
 """
@@ -13,7 +11,7 @@ Objetivo: crear un nuevo usuario con permisos de administrador.
 @pytest.mark.users
 @pytest.mark.positive
 @pytest.mark.api
-def test_create_user_as_admin(admin_token, new_user_data):
+def test_create_user_as_admin(api_client, admin_token, new_user_data):
     """
     TC-API-06: Crear usuario como admin.
     Este test recibe 'admin_token' y 'new_user_data' de los fixtures.
@@ -25,7 +23,7 @@ def test_create_user_as_admin(admin_token, new_user_data):
     new_user_email = new_user_data["email"] # El email es único gracias al fixture
 
     # 3. Hacer la solicitud POST a /users/
-    response = requests.post(f"{BASE_URL}/users/", json=new_user_data, headers=headers)
+    response = api_client.post("/users/", json=new_user_data, headers=headers)
 
     # 4. Verificar el código de estado.
     # Manejar el fallo interno de la API.
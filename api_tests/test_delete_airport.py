@@ -1,9 +1,7 @@
-import requests
 import pytest
 import time
 import random
 import string
-from conftest import BASE_URL
 from jsonschema import validate
 
 """
@@ -15,7 +13,7 @@ Objetivo: Eliminar un aeropuerto ya creado usando datos válidos.
 @pytest.mark.airports
 @pytest.mark.positive
 @pytest.mark.api
-def test_delete_airport_as_admin(admin_token, airport_iata_code):
+def test_delete_airport_as_admin(api_client, admin_token, airport_iata_code):
     """
     TC-API-14: Eliminar aeropuerto.
     Este test recibe 'admin_token' y 'airport_iata_code' de los fixtures.
@@ -24,7 +22,7 @@ def test_delete_airport_as_admin(admin_token, airport_iata_code):
     iata_code_to_delete = airport_iata_code
 
     # 3. Hacer la solicitud DELETE a /airports/{iata_code}
-    response = requests.delete(f"{BASE_URL}/airports/{iata_code_to_delete}", headers=headers)
+    response = api_client.delete(f"/airports/{iata_code_to_delete}", headers=headers)
 
     # 4. Verificar el código de estado.
     # Un DELETE exitoso debe devolver 204 No Content.
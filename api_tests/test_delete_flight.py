@@ -1,7 +1,5 @@
-import requests
 import pytest
 import time
-from conftest import BASE_URL
 from datetime import datetime, timedelta, timezone
 from jsonschema import validate
 
@@ -14,7 +12,7 @@ Objetivo: Eliminar un vuelo previamente creado usando datos válidos.
 @pytest.mark.flights
 @pytest.mark.positive
 @pytest.mark.api
-def test_delete_flight_as_admin(admin_token, flight_id):
+def test_delete_flight_as_admin(api_client, admin_token, flight_id):
     """
     TC-API-19: Eliminar vuelo.
     Este test recibe 'admin_token' y 'flight_id' de los fixtures.
@@ -23,7 +21,7 @@ def test_delete_flight_as_admin(admin_token, flight_id):
     flight_id_to_delete = flight_id # El ID del vuelo ya viene del fixture
 
     # 3. Hacer la solicitud DELETE a /flights/{flight_id}
-    response = requests.delete(f"{BASE_URL}/flights/{flight_id_to_delete}", headers=headers)
+    response = api_client.delete(f"/flights/{flight_id_to_delete}", headers=headers)
 
     # 4. Verificar el código de estado.
     # Un DELETE exitoso debe devolver 204 No Content.
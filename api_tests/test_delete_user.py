@@ -1,8 +1,6 @@
-import requests
 import pytest
 import time
 from jsonschema import validate
-from conftest import BASE_URL
 
 """
 TC-API-09: Eliminar usuario.
@@ -13,7 +11,7 @@ Objetivo: eliminar un usuario previamente creado.
 @pytest.mark.users
 @pytest.mark.positive
 @pytest.mark.api
-def test_delete_user_as_admin(admin_token, user_id_to_delete):
+def test_delete_user_as_admin(api_client, admin_token, user_id_to_delete):
     """
     TC-API-09: Eliminar usuario.
     Este test recibe 'admin_token' y 'test_user_id_to_delete' de los fixtures.
@@ -22,7 +20,7 @@ def test_delete_user_as_admin(admin_token, user_id_to_delete):
     user_id_to_delete = user_id_to_delete
 
     # 3. Hacer la solicitud DELETE a /users/{user_id}
-    response = requests.delete(f"{BASE_URL}/users/{user_id_to_delete}", headers=headers)
+    response = api_client.delete(f"/users/{user_id_to_delete}", headers=headers)
 
     # 4. Verificar el código de estado.
     # Un DELETE exitoso debe devolver 204 No Content
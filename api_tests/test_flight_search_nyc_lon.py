@@ -1,6 +1,4 @@
-import requests
 import pytest
-from conftest import BASE_URL
 
 """
 Caso de prueba: TC-API-15: Buscar vuelos NYC -> LON
@@ -11,9 +9,9 @@ Objetivo: Verificar que se puedan buscar vuelos entre dos ciudades usando parám
 @pytest.mark.flights
 @pytest.mark.positive
 @pytest.mark.api
-def test_list_airports():
+def test_list_airports(api_client):
     # Probar un endpoint que funciona
-    response = requests.get(f"{BASE_URL}/airports/")
+    response = api_client.get("/airports/")
 
     # Verificar que la respuesta sea 200
     assert response.status_code == 200
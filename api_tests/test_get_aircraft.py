@@ -1,6 +1,5 @@
-import requests
 import pytest
-from conftest import BASE_URL
+from schemas import registry
 
 """
 Caso de prueba: TC-API-28: Obtener aeronave por ID (GET /aircrafts/{aircraft_id})
@@ -11,7 +10,7 @@ Objetivo: Verificar que un usuario autenticado como admin pueda obtener la infor
 @pytest.mark.aircrafts
 @pytest.mark.positive
 @pytest.mark.api
-def test_get_aircraft_by_id(admin_token, aircraft_id_for_get):
+def test_get_aircraft_by_id(api_client, admin_token, aircraft_id_for_get):
     """
     TC-API-28: Obtener aeronave por ID.
     Este test recibe 'admin_token' y 'test_aircraft_id_for_get' de los fixtures.
@@ -20,7 +19,7 @@ def test_get_aircraft_by_id(admin_token, aircraft_id_for_get):
     aircraft_id_to_get = aircraft_id_for_get # El ID viene del fixture
 
     # 3. Hacer la solicitud GET a /aircrafts/{aircraft_id}
-    response = requests.get(f"{BASE_URL}/aircrafts/{aircraft_id_to_get}", headers=headers)
+    response = api_client.get(f"/aircrafts/{aircraft_id_to_get}", headers=headers)
 
     # 4. Verificar el código de estado.
     # Manejar errores comunes
@@ -55,6 +54,9 @@ def test_get_aircraft_by_id(admin_token, aircraft_id_for_get):
     aircraft_data = response.json()
     assert isinstance(aircraft_data, dict), f"Se esperaba un diccionario, se obtuvo {type(aircraft_data)}"
 
+    # Validar contra AIRCRAFT_SCHEMA
+    registry.validate("aircraft", aircraft_data)
+
     # Verificar que los campos devueltos sean correctos y estén presentes
     expected_fields = ["id", "tail_number", "model", "capacity"]
     for field in expected_fields:
@@ -1,9 +1,8 @@
-import requests
 import pytest
 import time
 import random
 import string
-from conftest import BASE_URL
+from schemas import registry
 
 """
 Caso de prueba: TC-API-12: Obtener aeropuerto (GET /airports/{iata_code})
@@ -14,14 +13,14 @@ Objetivo: Verificar que se pueda obtener la información de un aeropuerto espec
 @pytest.mark.airports
 @pytest.mark.positive
 @pytest.mark.api
-def test_get_airport_by_iata_code(airport_iata_code):
+def test_get_airport_by_iata_code(api_client, airport_iata_code):
     """
     TC-API-15: Obtener aeropuerto.
     """
     iata_code_to_get = airport_iata_code # El código IATA viene del fixture
 
     # 2. Hacer la solicitud GET a /airports/{iata_code}
-    response = requests.get(f"{BASE_URL}/airports/{iata_code_to_get}")
+    response = api_client.get(f"/airports/{iata_code_to_get}")
 
     # 3. Verificar el código de estado.
     # Manejar errores comunes
@@ -56,6 +55,9 @@ def test_get_airport_by_iata_code(airport_iata_code):
     airport_data = response.json()
     assert isinstance(airport_data, dict), f"Se esperaba un diccionario, se obtuvo {type(airport_data)}"
 
+    # Validar contra AIRPORT_SCHEMA
+    registry.validate("airport", airport_data)
+
     # Verificar que los campos devueltos sean correctos
     assert "iata_code" in airport_data, "Falta 'iata_code' en la respuesta"
     assert airport_data["iata_code"] == iata_code_to_get, (
@@ -1,12 +1,9 @@
-import requests
 import pytest
 import time
 import random
 import string
-from conftest import BASE_URL
 from datetime import datetime, timedelta, timezone
-from jsonschema import validate
-from schemas.booking_schema import BOOKING_SCHEMA
+from schemas import registry
 
 """
 Caso de prueba: TC-API-22: Obtener reserva (GET /bookings/{booking_id})
@@ -18,7 +15,7 @@ reserva específica que le pertenece.
 @pytest.mark.bookings
 @pytest.mark.positive
 @pytest.mark.api
-def test_get_booking_by_id(user_token, booking_id):
+def test_get_booking_by_id(api_client, user_token, booking_id):
     """
     TC-API-22: Obtener reserva.
     """
@@ -26,7 +23,7 @@ def test_get_booking_by_id(user_token, booking_id):
     booking_id_to_get = booking_id
 
     # 1. Hacer la solicitud GET a /bookings/{booking_id}
-    response = requests.get(f"{BASE_URL}/bookings/{booking_id_to_get}", headers=headers)
+    response = api_client.get(f"/bookings/{booking_id_to_get}", headers=headers)
 
     # 2. Verificar el código de estado.
     # Manejar errores comunes
@@ -68,7 +65,7 @@ def test_get_booking_by_id(user_token, booking_id):
     assert isinstance(booking_data, dict), f"Se esperaba un diccionario, se obtuvo {type(booking_data)}"
 
     # ✅ COBERTURA: Validar contra BOOKING_SCHEMA (cubre booking_schema.py al 100%)
-    validate(instance=booking_data, schema=BOOKING_SCHEMA)
+    registry.validate("booking", booking_data)
     print("✅ Booking validado contra BOOKING_SCHEMA")
 
     # Verificar que los campos devueltos sean correctos y estén presentes
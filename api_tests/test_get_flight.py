@@ -1,10 +1,9 @@
-import requests
 import pytest
 import time
 from datetime import timezone
 from datetime import datetime, timedelta
-from jsonschema import validate
-from conftest import BASE_URL
+from jsonschema import ValidationError, validate
+from schemas import registry
 
 """
 Caso de prueba: TC-API-17: Obtener vuelo (GET /flights/{flight_id})
@@ -15,7 +14,7 @@ Objetivo: Verificar que se pueda obtener la información de un vuelo específico
 @pytest.mark.flights
 @pytest.mark.positive
 @pytest.mark.api
-def test_get_flight_by_id(admin_token, flight_id):
+def test_get_flight_by_id(api_client, admin_token, flight_id):
     """
     TC-API-17: Obtener vuelo.
     """
@@ -23,7 +22,7 @@ def test_get_flight_by_id(admin_token, flight_id):
     flight_id_to_get = flight_id # El ID ya viene del fixture
 
     # 3. Hacer la solicitud GET a /flights/{flight_id}
-    response = requests.get(f"{BASE_URL}/flights/{flight_id_to_get}", headers=headers)
+    response = api_client.get(f"/flights/{flight_id_to_get}", headers=headers)
 
     # 4. Verificar el código de estado.
     # Manejar errores comunes
@@ -82,6 +81,12 @@ def test_get_flight_by_id(admin_token, flight_id):
     flight_data = response.json()
     assert isinstance(flight_data, dict), f"Se esperaba un diccionario, se obtuvo {type(flight_data)}"
 
+    # Validar contra FLIGHT_SCHEMA
+    try:
+        registry.validate("flight", flight_data)
+    except ValidationError as e:
+        pytest.fail(f"El vuelo obtenido no cumple el esquema: {e.message}")
+
     # Verificar que los campos devueltos sean correctos y estén presentes
     expected_fields = ["id", "origin", "destination", "departure_time", "arrival_time", "base_price",
                        "aircraft_id", "available_seats"]
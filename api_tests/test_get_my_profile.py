@@ -1,6 +1,4 @@
-import requests
 import pytest
-from conftest import BASE_URL
 
 """
 Caso de prueba: TC-API-07: Obtener mi perfil (GET /users/me/)
@@ -11,7 +9,7 @@ Objetivo: Verificar que un usuario autenticado pueda obtener su propia informaci
 @pytest.mark.users
 @pytest.mark.positive
 @pytest.mark.api
-def test_get_my_profile(admin_token):
+def test_get_my_profile(api_client, admin_token):
     """
     TC-API-07: Obtener mi perfil.
     Este test recibe 'admin_token' de los fixtures.
@@ -19,7 +17,7 @@ def test_get_my_profile(admin_token):
     headers = {"Authorization": f"Bearer {admin_token}"}
 
     # 1. Hacer la solicitud GET a /users/me/
-    response = requests.get(f"{BASE_URL}/users/me/", headers=headers)
+    response = api_client.get("/users/me/", headers=headers)
 
     # 2. Verificar que la respuesta sea exitosa (200 OK)
     # Manejar el posible error 500 del servidor de la API
@@ -57,14 +55,14 @@ def test_get_my_profile(admin_token):
 @pytest.mark.users
 @pytest.mark.positive
 @pytest.mark.api
-def test_get_my_profile_as_regular_user(auth_token):
+def test_get_my_profile_as_regular_user(api_client, auth_token):
     """
     TC-API-07b: Obtener mi perfil como usuario regular.
     ✅ COBERTURA: Usa fixture auth_token (conftest líneas 78-134) que creaba 0 consumers.
     """
     headers = {"Authorization": f"Bearer {auth_token}"}
 
-    response = requests.get(f"{BASE_URL}/users/me/", headers=headers)
+    response = api_client.get("/users/me/", headers=headers)
 
     if response.status_code == 500:
         pytest.fail(
@@ -1,6 +1,5 @@
-import requests
 import pytest
-from conftest import BASE_URL
+from schemas import registry
 
 """
 Caso de prueba: TC-API-25: Obtener pago por ID (GET /payments/{payment_id})
@@ -11,7 +10,7 @@ Objetivo: Verificar que un usuario autenticado pueda obtener la información de
 @pytest.mark.payments
 @pytest.mark.positive
 @pytest.mark.api
-def test_get_payment_by_id(user_token, payment_id):
+def test_get_payment_by_id(api_client, user_token, payment_id):
     """
     TC-API-25: Obtener pago por ID.
     Este test recibe 'user_token' y 'test_payment_id' de los fixtures.
@@ -20,7 +19,7 @@ def test_get_payment_by_id(user_token, payment_id):
     payment_id_to_get = payment_id # El ID viene del fixture
 
     # 3. Hacer la solicitud GET a /payments/{payment_id}
-    response = requests.get(f"{BASE_URL}/payments/{payment_id_to_get}", headers=headers)
+    response = api_client.get(f"/payments/{payment_id_to_get}", headers=headers)
 
     # 4. Verificar el código de estado.
     # Manejar errores comunes
@@ -61,6 +60,9 @@ def test_get_payment_by_id(user_token, payment_id):
     payment_data = response.json()
     assert isinstance(payment_data, dict), f"Se esperaba un diccionario, se obtuvo {type(payment_data)}"
 
+    # Validar contra PAYMENT_SCHEMA
+    registry.validate("payment", payment_data)
+
     # Verificar que los campos devueltos sean correctos y estén presentes
     expected_fields = ["id", "booking_id", "status", "amount", "payment_method"]
     for field in expected_fields:
@@ -1,6 +1,7 @@
-import requests
+import json
 import pytest
-from conftest import BASE_URL
+from jsonschema import ValidationError
+from schemas import registry
 
 """
 Caso de prueba: TC-API-26: Listar aeronaves (GET /aircrafts)
@@ -11,7 +12,7 @@ Objetivo: Verificar que un usuario autenticado como admin pueda obtener la lista
 @pytest.mark.aircrafts
 @pytest.mark.positive
 @pytest.mark.api
-def test_list_aircrafts_as_admin(admin_token):
+def test_list_aircrafts_as_admin(api_client, admin_token):
     """
     TC-API-26: Listar aeronaves.
     Este test recibe 'admin_token' de los fixtures.
@@ -19,7 +20,7 @@ def test_list_aircrafts_as_admin(admin_token):
     headers = {"Authorization": f"Bearer {admin_token}"}
 
     # 3. Hacer la solicitud GET a /aircrafts
-    response = requests.get(f"{BASE_URL}/aircrafts", headers=headers)
+    response = api_client.get("/aircrafts", headers=headers, stream=True)
 
     # 4. Verificar el código de estado.
     # Manejar errores comunes
@@ -49,27 +50,13 @@ def test_list_aircrafts_as_admin(admin_token):
         f"Cuerpo de la respuesta: {response.text}"
     )
 
-    # 5. Validar la estructura de la respuesta (esquema List[AircraftOut])
-    aircrafts = response.json()
-    assert isinstance(aircrafts, list), f"Se esperaba una lista, se obtuvo {type(aircrafts)}"
+    # 5. Validar la estructura de la respuesta (esquema List[AircraftOut]): cada avión contra
+    # AIRCRAFT_SCHEMA (id, tail_number y model no vacíos, capacity entero > 0), en streaming
+    try:
+        total = registry.validate_stream("aircraft", response)
+    except json.JSONDecodeError as e:
+        pytest.fail(f"Se esperaba una lista JSON de aeronaves: {e}")
+    except ValidationError as e:
+        pytest.fail(f"La lista de aeronaves no cumple el esquema: {e.message}")
 
-    # Verificar que cada elemento de la lista sea un diccionario (AircraftOut)
-    if aircrafts: # Solo validar si la lista no está vacía
-        first_aircraft = aircrafts[0]
-        assert isinstance(first_aircraft, dict), f"Se esperaba un diccionario, se obtuvo {type(first_aircraft)}"
-
-        # Verificar que los campos devueltos sean correctos y estén presentes
-        expected_fields = ["id", "tail_number", "model", "capacity"]
-        for field in expected_fields:
-            assert field in first_aircraft, f"Falta el campo '{field}' en la respuesta del avión listado."
-
-        # Verificaciones básicas de contenido
-        assert first_aircraft["tail_number"] # Verificar que no esté vacío
-        assert first_aircraft["model"] # Verificar que no esté vacío
-        assert isinstance(first_aircraft["capacity"], int), (
-            f"La capacidad debe ser un entero. Obtenido: {type(first_aircraft['capacity'])}"
-        )
-        assert first_aircraft["capacity"] > 0, (f"La capacidad debe ser mayor que 0. Obtenido: "
-                                                f"{first_aircraft['capacity']}")
-
-    print(f"✅ Lista de aeronaves obtenida exitosamente. Total: {len(aircrafts)} aviones")
+    print(f"✅ Lista de aeronaves obtenida exitosamente. Total: {total} aviones")
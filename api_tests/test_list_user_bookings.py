@@ -1,9 +1,9 @@
-import requests
 import pytest
 import time
 from datetime import datetime, timedelta, timezone
-from jsonschema import validate
-from conftest import BASE_URL
+import json
+from jsonschema import ValidationError
+from schemas import registry
 
 """
 Caso de prueba: TC-API-20: Listar reservas del usuario (GET /bookings)
@@ -14,7 +14,7 @@ Objetivo: Verificar que un usuario autenticado pueda obtener la lista de sus pro
 @pytest.mark.bookings
 @pytest.mark.positive
 @pytest.mark.api
-def test_list_user_bookings_as_authenticated_user(user_token, admin_token, aircraft_id,
+def test_list_user_bookings_as_authenticated_user(api_client, user_token, admin_token, aircraft_id,
                                                   create_test_booking_for_listing):
     """
     TC-API-20: Listar reservas del usuario.
@@ -29,7 +29,7 @@ def test_list_user_bookings_as_authenticated_user(user_token, admin_token, aircr
         pytest.skip(f"No se pudo crear una reserva de prueba para listar: {e}")
 
     # 2. Hacer la solicitud GET a /bookings
-    response = requests.get(f"{BASE_URL}/bookings", headers=user_headers)
+    response = api_client.get("/bookings", headers=user_headers, stream=True)
 
     # 3. Verificar el código de estado.
     # Manejar errores comunes
@@ -60,24 +60,27 @@ def test_list_user_bookings_as_authenticated_user(user_token, admin_token, aircr
         f"Cuerpo de la respuesta: {response.text}"
     )
 
-    # 4. Validar la estructura de la respuesta (esquema List[BookingOut])
-    bookings = response.json()
-    assert isinstance(bookings, list), f"Se esperaba una lista, se obtuvo {type(bookings)}"
+    # 4. Validar la estructura de la respuesta (esquema List[BookingOut]): cada reserva se valida
+    # contra BOOKING_SCHEMA a medida que se lee, y se busca la reserva creada sin cargar toda la lista
+    booking_ids = []
+    found_booking = None
+    try:
+        for booking in registry.iter_stream("booking", response):
+            booking_ids.append(booking["id"])
+            if booking["id"] == booking_id_to_list:
+                found_booking = booking
+    except json.JSONDecodeError as e:
+        pytest.fail(f"Se esperaba una lista JSON de reservas: {e}")
+    except ValidationError as e:
+        pytest.fail(f"La lista de reservas no cumple el esquema: {e.message}")
 
     # Verificar que al menos la reserva creada esté en la lista
-    assert len(bookings) > 0, "La lista de reservas del usuario está vacía."
-
-    # Buscar la reserva creada en la lista
-    found_booking = None
-    for booking in bookings:
-        if booking["id"] == booking_id_to_list:
-            found_booking = booking
-            break
+    assert len(booking_ids) > 0, "La lista de reservas del usuario está vacía."
 
     assert found_booking is not None, (
         f"La reserva creada ('{booking_id_to_list}') no fue encontrada en la lista de reservas del usuario. "
         f"Esto indica un posible problema de consistencia en la API o en la prueba. "
-        f"Reservas obtenidas: {[b['id'] for b in bookings]}"
+        f"Reservas obtenidas: {booking_ids}"
     )
 
     # 5. Validar la estructura y datos de la reserva encontrada (esquema BookingOut)
@@ -108,5 +111,5 @@ def test_list_user_bookings_as_authenticated_user(user_token, admin_token, aircr
         # 'seat' es opcional
 
     print(
-        f"✅ Lista de reservas del usuario obtenida exitosamente. Total: {len(bookings)}, "
+        f"✅ Lista de reservas del usuario obtenida exitosamente. Total: {len(booking_ids)}, "
         f"Reserva buscada ID: {found_booking['id']}")
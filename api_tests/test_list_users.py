@@ -1,6 +1,7 @@
-import requests
+import json
 import pytest
-from conftest import BASE_URL
+from jsonschema import ValidationError
+from schemas import registry
 
 """
 Caso de prueba: TC-API-05: Listar todos los usuarios (autenticado)
@@ -11,7 +12,7 @@ Objetivo: Verificar que un usuario autenticado pueda obtener la lista de todos l
 @pytest.mark.users
 @pytest.mark.positive
 @pytest.mark.api
-def test_list_users_as_admin(admin_token):
+def test_list_users_as_admin(api_client, admin_token):
     """
     TC-API-05: Listar todos los usuarios (autenticado).
     Este test recibe 'admin_token' de los fixtures.
@@ -19,7 +20,7 @@ def test_list_users_as_admin(admin_token):
     headers = {"Authorization": f"Bearer {admin_token}"}
 
     # 1. Hacer la solicitud GET a /users/
-    response = requests.get(f"{BASE_URL}/users/", headers=headers)
+    response = api_client.get("/users/", headers=headers, stream=True)
 
     # Comprobar si el servidor devuelve error 500, es un fallo interno de la API de prueba.
     if response.status_code == 500:
@@ -32,19 +33,13 @@ def test_list_users_as_admin(admin_token):
     # 2. Verificar que la respuesta sea exitosa (200 OK)
     assert response.status_code == 200, f"Esperaba 200, obtuvo {response.status_code}. Cuerpo: {response.text}"
 
-    # 3. Verificar que la respuesta sea una lista de usuarios
-    users = response.json()
-    assert isinstance(users, list), f"Se esperaba una lista de usuarios, se obtuvo {type(users)}"
+    # 3. Verificar que la respuesta sea una lista de usuarios y que todos cumplan USER_SCHEMA,
+    # validándolos a medida que se lee la respuesta (memoria acotada aunque haya miles)
+    try:
+        total = registry.validate_stream("user", response)
+    except json.JSONDecodeError as e:
+        pytest.fail(f"Se esperaba una lista JSON de usuarios: {e}")
+    except ValidationError as e:
+        pytest.fail(f"La lista de usuarios no cumple el esquema: {e.message}")
 
-    # 4. Verificar que cada usuario en la lista tenga la estructura básica esperada
-    if users:
-        first_user = users[0]
-        assert "id" in first_user, "Falta 'id' en el objeto de usuario"
-        assert "email" in first_user, "Falta 'email' en el objeto de usuario"
-        assert "@" in first_user["email"], "El 'email' no tiene un formato válido"
-        assert "full_name" in first_user, "Falta 'full_name' en el objeto de usuario"
-        # verificar que el campo 'role' es válido
-        if "role" in first_user:
-            assert first_user["role"] in ["passenger", "admin"], f"Rol inválido: {first_user['role']}"
-
-    print(f"✅ Listados {len(users)} usuarios correctamente como administrador.")
+    print(f"✅ Listados {total} usuarios correctamente como administrador.")
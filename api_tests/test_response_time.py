@@ -1,7 +1,11 @@
-import requests
-import time
+import math
+
 import pytest
-from conftest import BASE_URL
+from api_client import benchmark
+from api_client.benchmark import Endpoint, measure
+
+# Fracción de respuestas con error que se tolera (el host gratuito tiene cold starts y cortes esporádicos)
+ERROR_BUDGET = 0.05
 
 """
 Prueba TC-API-32 Medir tiempo de respuesta del endpoint /airports
@@ -11,22 +15,29 @@ Objetivo: verificar el tiempo que le toma al endpoint responder a la petición
 @pytest.mark.high
 @pytest.mark.negative
 @pytest.mark.api
-def test_get_airports_response_time_under_2_seconds():
+def test_get_airports_response_time_under_2_seconds(api_client, request):
     """
-    Verificar que el endpoint /airports responda en menos de 2 segundos.
+    Verificar que el endpoint /airports responda en menos de 2 segundos (p95).
+    Se descartan unas peticiones de calentamiento y se toman N muestras
+    (--benchmark-warmup / --benchmark-samples). Las estadísticas se guardan en
+    benchmarks/results/ con el mismo formato que scripts/api_benchmark.py.
     """
-    start_time = time.time()
-
-    response = requests.get(f"{BASE_URL}/airports/")
-
-    end_time = time.time()
-    elapsed_time = end_time - start_time
+    warmup = request.config.getoption("benchmark_warmup")
+    samples = request.config.getoption("benchmark_samples")
+    stats = measure(api_client, Endpoint("airports_list", "GET", "/airports"), warmup=warmup, samples=samples)
+    path = benchmark.save_run(benchmark.make_run(api_client.base_url, [stats], warmup, samples))
 
-    # Verifica que el código de estado sea exitoso
-    assert response.status_code == 200, f"Esperaba 200, obtuvo {response.status_code}"
+    # Imprime las estadísticas para verlas en consola
+    print(f"\n⏱ /airports ({stats.samples} muestras): p50 {stats.p50_ms:.1f} ms, "
+          f"p95 {stats.p95_ms:.1f} ms, p99 {stats.p99_ms:.1f} ms, {stats.throughput_rps:.1f} req/s "
+          f"(guardado en {path})")
 
-    # Verifica que el tiempo de respuesta sea menor a 2 segundos
-    assert elapsed_time < 2.0, f"Tiempo de respuesta fue {elapsed_time:.2f}s, esperado < 2.0s"
+    # Verifica que casi todas las respuestas sean exitosas (hasta ERROR_BUDGET con error)
+    total = stats.errors + stats.samples
+    allowed_errors = math.floor(total * ERROR_BUDGET)
+    assert stats.samples and stats.errors <= allowed_errors, (
+        f"{stats.errors} de {total} respuestas no fueron 2xx (se toleran {allowed_errors})"
+    )
 
-    # Imprime el tiempo para verlo en consola
-    print(f"\n⏱ Tiempo de respuesta: {elapsed_time:.2f} segundos")
\ No newline at end of file
+    # Verifica que el p95 del tiempo de respuesta sea menor a 2 segundos
+    assert stats.p95_ms < 2000, f"p95 fue {stats.p95_ms / 1000:.2f}s, esperado < 2.0s"
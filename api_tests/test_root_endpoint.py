@@ -1,6 +1,4 @@
-import requests
 import pytest
-from conftest import BASE_URL
 
 """
 Caso de prueba: TC-API-33: Probar raíz de la API (GET / root)
@@ -11,12 +9,12 @@ Nota: Esta prueba no requiere autenticación.
 @pytest.mark.low
 @pytest.mark.positive
 @pytest.mark.api
-def test_root_endpoint_returns_welcome_message():
+def test_root_endpoint_returns_welcome_message(api_client):
     """
     TC-API-33: Probar raíz de la API.
     """
     # 1. Hacer la solicitud GET a la raíz de la API
-    response = requests.get(f"{BASE_URL}/")
+    response = api_client.get("/")
 
     # 2. Verificar el código de estado
     if response.status_code == 500:
@@ -1,7 +1,5 @@
-import requests
 import pytest
 import time
-from conftest import BASE_URL
 
 """
 Pruebas TC-API-31 Probar endpoint con error 500
@@ -10,7 +8,8 @@ Pruebas TC-API-31 Probar endpoint con error 500
 @pytest.mark.medium
 @pytest.mark.negative
 @pytest.mark.api
-def test_signup_endpoint_returns_known_error():
+@pytest.mark.fake_api_fault("signup_500")
+def test_signup_endpoint_returns_known_error(api_client):
     """
     Verificar que el endpoint /auth/signup devuelve un error conocido (500),
     como parte del comportamiento simulado de la API.
@@ -19,7 +18,7 @@ def test_signup_endpoint_returns_known_error():
     timestamp = int(time.time())  # <-- Usar time.time()
     email = f"test_user_{timestamp}@example.com"  # <-- Email único
 
-    response = requests.post(f"{BASE_URL}/auth/signup", json={
+    response = api_client.post("/auth/signup", json={
         "email": email,  # <-- Usar el email único
         "password": "123456",
         "full_name": "Test User"
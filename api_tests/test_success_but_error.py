@@ -1,6 +1,4 @@
-import requests
 import pytest
-from conftest import BASE_URL
 
 """
 Caso de prueba: TC-API-29: Probar endpoint que simula éxito con error
@@ -12,12 +10,12 @@ Nota: Esta prueba interactúa con un endpoint especial de la API que simula este
 @pytest.mark.low
 @pytest.mark.negative
 @pytest.mark.api
-def test_success_but_error_endpoint():
+def test_success_but_error_endpoint(api_client):
     """
     TC-API-29: Probar endpoint que simula éxito con error.
     """
     # 1. Hacer la solicitud GET al endpoint que simula éxito con error
-    response = requests.get(f"{BASE_URL}/glitch-examples/success-but-error")
+    response = api_client.get("/glitch-examples/success-but-error")
 
     # 2. Verificar el código de estado.
     # Este endpoint está diseñado para devolver 200 OK
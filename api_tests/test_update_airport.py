@@ -1,9 +1,7 @@
-import requests
 import pytest
 import time
 import random
 import string
-from conftest import BASE_URL
 from jsonschema import validate
 
 """
@@ -15,7 +13,7 @@ Objetivo: Verificar que un usuario autenticado como admin pueda actualizar la in
 @pytest.mark.airports
 @pytest.mark.positive
 @pytest.mark.api
-def test_update_airport_as_admin(admin_token, airport_iata_code):
+def test_update_airport_as_admin(api_client, admin_token, airport_iata_code):
     """
     TC-API-13: Actualizar aeropuerto.
     Este test recibe 'admin_token' y 'airport_iata' de los fixtures.
@@ -31,7 +29,7 @@ def test_update_airport_as_admin(admin_token, airport_iata_code):
     }
 
     # 4. Hacer la solicitud PUT a /airports/{iata_code}
-    response = requests.put(f"{BASE_URL}/airports/{iata_code_to_update}", json=updated_data, headers=headers)
+    response = api_client.put(f"/airports/{iata_code_to_update}", json=updated_data, headers=headers)
 
     # 5. Verificar el código de estado.
     # Manejar errores comunes
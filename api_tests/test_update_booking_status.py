@@ -1,6 +1,4 @@
-import requests
 import pytest
-from conftest import BASE_URL
 
 """
 Caso de prueba: TC-API-34: Actualizar estado de reserva (PATCH /bookings/{booking_id})
@@ -11,7 +9,7 @@ Objetivo: Verificar que un usuario autenticado como admin pueda actualizar el es
 @pytest.mark.bookings
 @pytest.mark.positive
 @pytest.mark.api
-def test_update_booking_status_as_admin(admin_token, booking_id):
+def test_update_booking_status_as_admin(api_client, admin_token, booking_id):
     """
     TC-API-34: Actualizar estado de reserva.
     Este test recibe 'admin_token' y 'test_booking_id' de los fixtures.
@@ -28,7 +26,7 @@ def test_update_booking_status_as_admin(admin_token, booking_id):
     }
 
     # 4. Hacer la solicitud PATCH a /bookings/{booking_id}
-    response = requests.patch(f"{BASE_URL}/bookings/{booking_id_to_update}", json=updated_status_data,
+    response = api_client.patch(f"/bookings/{booking_id_to_update}", json=updated_status_data,
                               headers=headers)
 
     # 5. Verificar el código de estado.
@@ -1,7 +1,5 @@
-import requests
 import pytest
 import time
-from conftest import BASE_URL
 from datetime import datetime, timedelta, timezone
 from jsonschema import validate
 
@@ -14,7 +12,7 @@ Objetivo: Confirmar que el un vuelo creado siga existiendo con los mismos datos
 @pytest.mark.flights
 @pytest.mark.positive
 @pytest.mark.api
-def test_update_flight_as_admin(admin_token, flight_id):
+def test_update_flight_as_admin(api_client, admin_token, flight_id):
     """
     TC-API-18: Actualizar vuelo.
     Este test ahora recibe 'admin_token' y 'flight_id' de los fixtures.
@@ -36,7 +34,7 @@ def test_update_flight_as_admin(admin_token, flight_id):
     }
 
     # 4. Hacer la solicitud PUT a /flights/{flight_id}
-    get_response = requests.get(f"{BASE_URL}/flights/{flight_id_to_update}", headers=headers)
+    get_response = api_client.get(f"/flights/{flight_id_to_update}", headers=headers)
     assert get_response.status_code == 200, (
         f"Error al obtener el vuelo original para actualizar. "
         f"Esperaba 200, obtuvo {get_response.status_code}. "
@@ -46,7 +44,7 @@ def test_update_flight_as_admin(admin_token, flight_id):
     # Actualizar el aircraft_id en los datos a enviar
     updated_flight_data["aircraft_id"] = original_flight_data["aircraft_id"]
 
-    response = requests.put(f"{BASE_URL}/flights/{flight_id_to_update}", json=updated_flight_data, headers=headers)
+    response = api_client.put(f"/flights/{flight_id_to_update}", json=updated_flight_data, headers=headers)
 
     # 5. Verificar el código de estado.
     # Manejar errores comunes
@@ -1,6 +1,4 @@
-import requests
 import pytest
-from conftest import BASE_URL
 
 """
 Caso de prueba: TC-API-08: Actualizar usuario (PUT /users/{user_id})
@@ -11,7 +9,7 @@ Objetivo: Verificar que un usuario autenticado como admin pueda actualizar la in
 @pytest.mark.users
 @pytest.mark.positive
 @pytest.mark.api
-def test_update_user_as_admin(admin_token, new_user_data):
+def test_update_user_as_admin(api_client, admin_token, new_user_data):
     """
     TC-API-08: Actualizar usuario.
     Este test recibe 'admin_token' y 'new_user_data' de los fixtures.
@@ -19,7 +17,7 @@ def test_update_user_as_admin(admin_token, new_user_data):
     headers = {"Authorization": f"Bearer {admin_token}"}
 
     # 1. Crear un usuario de prueba para actualizar usando los datos del fixture
-    response = requests.post(f"{BASE_URL}/users/", json=new_user_data, headers=headers)
+    response = api_client.post("/users/", json=new_user_data, headers=headers)
 
     # Manejar errores comunes durante la creación
     if response.status_code == 500:
@@ -48,7 +46,7 @@ def test_update_user_as_admin(admin_token, new_user_data):
     }
 
     # 3. Hacer la solicitud PUT a /users/{user_id}
-    response = requests.put(f"{BASE_URL}/users/{user_id_to_update}", json=updated_data, headers=headers)
+    response = api_client.put(f"/users/{user_id_to_update}", json=updated_data, headers=headers)
 
     # 4. Verificar el código de estado.
     # Manejar posible error 500 del servidor de la API
@@ -1,6 +1,4 @@
-import requests
 import pytest
-from conftest import BASE_URL
 
 """
 Caso de prueba: TC-API-04: Login con contraseña incorrecta
@@ -11,7 +9,7 @@ Objetivo: Verificar que la API devuelva un error 401 cuando se intenta iniciar s
 @pytest.mark.auth
 @pytest.mark.negative
 @pytest.mark.api
-def test_login_with_invalid_password():
+def test_login_with_invalid_password(api_client):
     """
     TC-API-04: Login con contraseña incorrecta.
     """
@@ -22,7 +20,7 @@ def test_login_with_invalid_password():
     }
 
     # 2. Hacer la solicitud POST a /auth/login
-    response = requests.post(f"{BASE_URL}/auth/login", data=login_data)
+    response = api_client.post("/auth/login", data=login_data)
 
     # 3. Verificar el código de estado.
     # Manejar errores comunes
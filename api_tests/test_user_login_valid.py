@@ -1,6 +1,4 @@
-import requests
 import pytest
-from conftest import BASE_URL
 
 """
 Caso de prueba: TC-API-03: Iniciar sesión con credenciales válidas.
@@ -11,7 +9,7 @@ Objetivo: Verificar que un usuario registrado pueda iniciar sesión correctament
 @pytest.mark.auth
 @pytest.mark.positive
 @pytest.mark.api
-def test_login_with_valid_credentials():
+def test_login_with_valid_credentials(api_client):
     """
     TC-API-03: Iniciar sesión con credenciales válidas.
     """
@@ -22,7 +20,7 @@ def test_login_with_valid_credentials():
     }
 
     # Realizar la solicitud POST para iniciar sesión
-    response = requests.post(f"{BASE_URL}/auth/login", data=login_data)
+    response = api_client.post("/auth/login", data=login_data)
 
     # Verificar que la respuesta sea exitosa (200 OK)
     assert response.status_code == 200, (
@@ -1,8 +1,6 @@
-import requests
 import pytest
-from jsonschema import validate, ValidationError
-from schemas.user_schema import USER_SCHEMA
-from conftest import BASE_URL
+from jsonschema import ValidationError
+from schemas import registry
 import time
 
 """
@@ -17,7 +15,7 @@ Tipo: Positivo
 @pytest.mark.auth
 @pytest.mark.positive
 @pytest.mark.api
-def test_signup_returns_valid_schema():
+def test_signup_returns_valid_schema(api_client):
     """
     TC-API-01: Registrar usuario válido
 
@@ -47,7 +45,7 @@ def test_signup_returns_valid_schema():
     }
 
     # Usar el endpoint correcto para registro público
-    response = requests.post(f"{BASE_URL}/auth/signup", json=user_data)
+    response = api_client.post("/auth/signup", json=user_data)
 
     # Manejar error 500 del servidor de la API
     if response.status_code == 500:
@@ -65,6 +63,6 @@ def test_signup_returns_valid_schema():
 
     # Validar que el esquema sea correcto
     try:
-        validate(instance=user, schema=USER_SCHEMA)
+        registry.validate("user", user)
     except ValidationError as e:
         pytest.fail(f"El esquema no es válido: {e.message}")
\ No newline at end of file
@@ -1,6 +1,4 @@
-import requests
 import pytest
-from conftest import BASE_URL
 
 """
 Caso de prueba: TC-API-02: Registrar con email inválido (Negativo)
@@ -11,7 +9,7 @@ Objetivo: Verificar que la API devuelva un error 422 cuando se intenta registrar
 @pytest.mark.auth
 @pytest.mark.negative
 @pytest.mark.api
-def test_signup_with_invalid_email():
+def test_signup_with_invalid_email(api_client):
     """
     TC-API-02: Registrar con email inválido (Negativo).
     """
@@ -24,7 +22,7 @@ def test_signup_with_invalid_email():
     }
 
     # Intentar registrar el usuario
-    response = requests.post(f"{BASE_URL}/auth/signup", json=user_data)
+    response = api_client.post("/auth/signup", json=user_data)
 
     # Verificar que la respuesta sea un error 422
     assert response.status_code == 422, f"Esperaba 422, obtuvo {response.status_code}. Cuerpo: {response.text}"
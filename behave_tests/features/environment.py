@@ -1,28 +1,78 @@
-import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
-import uuid
+import os
+
+from browser import DriverPool, create_managed_driver
+from browser.blocking import DEFAULT_BLOCKING, BlockingProfile, ResourceSizes, apply_blocking, collect_blocking
+from pages import performance
+from pages.locators import LocatorCache
+from pages.shophub.session import ShopHubSessions
+
+# Alcance de la reutilización del navegador: 'feature' (se cierra al terminar cada feature)
+# o 'run' (uno para toda la ejecución). Se elige con -D browser_scope=run o BEHAVE_BROWSER_SCOPE.
+BROWSER_SCOPES = ("feature", "run")
+# Escenarios con este tag reciben un navegador recién lanzado que se cierra al terminar
+FRESH_BROWSER_TAG = "fresh_browser"
+
+
+def before_all(context):
+    """Se ejecuta una vez: prepara el pool de navegadores (BROWSER elige chrome, firefox o edge)"""
+    scope = context.config.userdata.get("browser_scope", os.getenv("BEHAVE_BROWSER_SCOPE", "feature")).lower()
+    context.browser_scope = scope if scope in BROWSER_SCOPES else "feature"
+    # Recursos que el navegador no descarga (browser/blocking.py): -D block_resources=... o WEB_BLOCK_RESOURCES
+    spec = context.config.userdata.get("block_resources", os.getenv("WEB_BLOCK_RESOURCES", DEFAULT_BLOCKING))
+    context.blocking = BlockingProfile.parse(spec)
+    context.resource_sizes = ResourceSizes()
+    context.blocked_totals = {"requests": 0, "bytes": 0}
+    # Presupuestos de carga de página (pages/performance.py): -D perf_budgets=1 o WEB_PERF_BUDGETS=1
+    performance.enforce_budgets = context.config.userdata.get("perf_budgets", os.getenv("WEB_PERF_BUDGETS", "0")) == "1"
+    # Login de ShopHub por UI una vez por usuario y sesión inyectada después (pages/shophub/session.py);
+    # -D ui_login=1 o SHOPHUB_UI_LOGIN=1 hace el login por UI en cada escenario
+    ui_login = context.config.userdata.get("ui_login", os.getenv("SHOPHUB_UI_LOGIN", "0")) == "1"
+    context.shophub_sessions = ShopHubSessions(force_ui=ui_login)
+    # El driver se resuelve con webdriver-manager una sola vez y su ruta queda cacheada (browser/drivers.py)
+    context.driver_pool = DriverPool(factory=lambda browser: create_managed_driver(browser, blocking=context.blocking))
+
 
 def before_scenario(context, scenario):
     """Se ejecuta antes de cada escenario"""
     print("✅ before_scenario ejecutado")
-    options = Options()
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--headless")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
-
-    # Usar webdriver-manager para obtener el driver automáticamente
-    service = Service(ChromeDriverManager().install())
-    context.driver = webdriver.Chrome(service=service, options=options)
-    context.driver.implicitly_wait(10)
+    context.fresh_browser = FRESH_BROWSER_TAG in scenario.effective_tags
+    context.driver = context.driver_pool.acquire(fresh=context.fresh_browser)
+    context.blocking_active = apply_blocking(context.driver, context.blocking)
 
 
 def after_scenario(context, scenario):
     """Se ejecuta después de cada escenario"""
     print("✅ after_scenario ejecutado")
     if hasattr(context, 'driver'):
-        context.driver.quit()
\ No newline at end of file
+        try:
+            if context.blocking_active:
+                stats = collect_blocking(context.driver, context.resource_sizes)
+                context.blocked_totals["requests"] += stats.blocked
+                context.blocked_totals["bytes"] += stats.bytes_saved
+                if stats.blocked:
+                    print(f"🚫 {stats.blocked} peticiones bloqueadas (~{stats.bytes_saved / 1024:.0f} KB ahorrados)")
+            for metrics in performance.take(context.driver):
+                print(f"⏱️  {metrics.page} ({metrics.kind}): TTFB {metrics.ttfb_ms} ms | LCP {metrics.lcp_ms} ms | "
+                      f"duración {metrics.duration_ms} ms | CLS {metrics.cls}")
+        finally:
+            # Reinicia cookies, almacenamiento y ventanas para el siguiente escenario, o cierra el navegador
+            # (también si el escenario lo cerró y las lecturas anteriores fallaron)
+            context.driver_pool.release(context.driver, discard=context.fresh_browser)
+
+
+def after_feature(context, feature):
+    """Se ejecuta después de cada feature"""
+    if context.browser_scope == "feature":
+        context.driver_pool.close()
+
+
+def after_all(context):
+    """Se ejecuta al final de la ejecución"""
+    context.driver_pool.close()
+    print(f"🌐 Pool de navegadores {context.driver_pool.summary()}")
+    print(f"🔑 Sesiones de ShopHub: {context.shophub_sessions.summary()}")
+    context.resource_sizes.save()
+    print(f"🚫 Recursos bloqueados ({context.blocking.describe()}): {context.blocked_totals['requests']} peticiones, "
+          f"~{context.blocked_totals['bytes'] / 1024:.0f} KB ahorrados")
+    for line in LocatorCache().stale_strategies():
+        print(f"⚠️  Localizador obsoleto: {line}")
@@ -1,25 +1,18 @@
 from behave import given, when, then
 import time
 from pages.shophub.shophub_home_page import HomePage
-from pages.shophub.shophub_login_page import LoginPage
 from data import Users, Waits
 
 
 @given('que el usuario inicia sesión con credenciales válidas')
 def step_user_logs_in_with_valid_credentials(context):
-    """Usuario inicia sesión con credenciales válidas"""
-    if not hasattr(context, 'home_page'):
-        context.home_page = HomePage(context.driver)
-        context.home_page.go_to()
-
-    login_page = context.home_page.click_login()
-    login_page.enter_email(Users.Admin.EMAIL)
-    login_page.enter_password(Users.Admin.PASSWORD)
-    login_page.click_sign_in()
-
-    # Manejar página de éxito del login
-    login_page.handle_login_success_page()
-    login_page.verify_login_success()
+    """
+    Usuario con sesión iniciada: el login por UI se hace una vez y los escenarios siguientes
+    reciben la sesión inyectada (pages/shophub/session.py). El login en sí se verifica en login.feature.
+    """
+    context.shophub_sessions.login(context.driver, Users.Admin.EMAIL, Users.Admin.PASSWORD)
+    context.home_page = HomePage(context.driver)
+    context.home_page.go_to()
 
 
 @when('el usuario navega a la categoría "{category_name}"')
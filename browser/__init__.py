@@ -0,0 +1,14 @@
+from .factory import BROWSERS, IMPLICIT_WAIT, browser_name, create_driver
+from .drivers import create_managed_driver, resolve_driver_path
+from .pool import DriverPool, PoolStats
+
+__all__ = [
+    "BROWSERS",
+    "IMPLICIT_WAIT",
+    "DriverPool",
+    "PoolStats",
+    "browser_name",
+    "create_driver",
+    "create_managed_driver",
+    "resolve_driver_path",
+]
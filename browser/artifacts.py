@@ -0,0 +1,204 @@
+"""
+Evidencias de las pruebas de Web UI que fallan, escritas en segundo plano.
+
+Al fallar una prueba sólo se le piden al navegador los datos: screenshot en base64,
+URL, DOM y logs de consola. Decodificar, convertir y escribir en disco lo hace un pool
+de hilos, así que la limpieza de la prueba no espera al disco. Los screenshots se
+guardan por hash de contenido: si varias pruebas fallan en la misma pantalla (un lote
+flaky contra la misma página de error) se escribe una sola imagen.
+
+capture() devuelve las estadísticas del lado de la prueba (captura y su tiempo), que van en
+el reporte de la prueba; las de escritura se suman en segundo plano y flush() las entrega
+al final de la sesión, cuando ya se puede esperar al disco. Con xdist el escritor sólo
+existe en los workers: cada uno envía las suyas al proceso principal (ver conftest.py).
+
+Con Pillow instalado los screenshots pueden reducirse a un ancho máximo y guardarse en
+JPEG o WebP; sin Pillow se guardan los PNG tal cual. Por cada fallo quedan
+<prueba>_<timestamp>.json (URL, logs de consola y ruta del screenshot) y
+<prueba>_<timestamp>.html (DOM).
+"""
+import base64
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from selenium.common.exceptions import WebDriverException
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow está en requirements.txt; sin él no hay conversión ni reducción
+    Image = None
+
+FORMATS = ("png", "jpeg", "webp")
+# Hilos que escriben las evidencias
+DEFAULT_WORKERS = 2
+# Calidad de los screenshots en JPEG y WebP
+IMAGE_QUALITY = 80
+
+
+@dataclass
+class ArtifactStats:
+    """Fallos capturados, screenshots escritos y repetidos, y tiempos en la prueba y en segundo plano."""
+    captured: int = 0
+    screenshots: int = 0
+    duplicates: int = 0
+    errors: int = 0
+    bytes_written: int = 0
+    capture_s: float = 0.0
+    write_s: float = 0.0
+    degraded: bool = False
+
+    def add(self, other: "ArtifactStats"):
+        for stat in fields(self):
+            if stat.name != "degraded":
+                setattr(self, stat.name, getattr(self, stat.name) + getattr(other, stat.name))
+        self.degraded = self.degraded or other.degraded
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def summary(self) -> str:
+        line = (f"{self.captured} fallos capturados | {self.screenshots} screenshots "
+                f"({self.duplicates} repetidos sin escribir) | {self.bytes_written / 1024:.0f} KB | "
+                f"{self.capture_s:.2f} s en las pruebas, {self.write_s:.2f} s en segundo plano")
+        if self.errors:
+            line += f" | {self.errors} con errores de escritura"
+        if self.degraded:
+            line += " | Pillow no está instalado: screenshots en PNG sin convertir ni reducir"
+        return line
+
+
+def _safe(read):
+    """Resultado de una lectura del navegador, o None si el navegador ya no responde."""
+    try:
+        return read()
+    except WebDriverException:
+        return None
+
+
+def console_logs(driver) -> List[dict]:
+    """
+    Logs de consola del navegador desde la última lectura (sólo Chrome y Edge exponen
+    get_log; en Firefox devuelve una lista vacía).
+    """
+    get_log = getattr(driver, "get_log", None)
+    if get_log is None:
+        return []
+    return _safe(lambda: get_log("browser")) or []
+
+
+class ArtifactWriter:
+    """Captura evidencias en el hilo de la prueba y las escribe en disco en segundo plano."""
+
+    def __init__(self, directory: str, image_format: str = "png", max_width: int = 0,
+                 workers: int = DEFAULT_WORKERS):
+        if image_format not in FORMATS:
+            raise ValueError(f"Formato de screenshot no soportado: {image_format} (usar {', '.join(FORMATS)})")
+        self.directory = directory
+        # Sin Pillow se guardan los PNG originales
+        self.degraded = Image is None and (image_format != "png" or bool(max_width))
+        self.image_format = image_format if Image is not None else "png"
+        self.max_width = max_width if Image is not None else 0
+        self._lock = threading.Lock()
+        self._images: Dict[str, str] = {}
+        self._futures = []
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="artifacts")
+
+    def capture(self, driver, name: str) -> Tuple[str, ArtifactStats]:
+        """
+        Lee del navegador screenshot, URL, DOM y consola, y encola su escritura. Devuelve la
+        ruta base (sin extensión) de los archivos que se van a escribir y las estadísticas de
+        la captura (las de escritura las devuelve flush()).
+        """
+        start = time.perf_counter()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        safe_name = "".join(c for c in name if c.isalnum() or c in (" ", "_")).rstrip()
+        base_path = os.path.join(self.directory, f"{safe_name}_{timestamp}")
+        screenshot = _safe(driver.get_screenshot_as_base64)
+        details = {
+            "test": name,
+            "url": _safe(lambda: driver.current_url),
+            "console": console_logs(driver),
+        }
+        dom = _safe(lambda: driver.page_source)
+        with self._lock:
+            self._futures.append(self._executor.submit(self._write, base_path, details, screenshot, dom))
+        return base_path, ArtifactStats(captured=1, capture_s=time.perf_counter() - start, degraded=self.degraded)
+
+    def _write(self, base_path: str, details: dict, screenshot: Optional[str], dom: Optional[str]) -> ArtifactStats:
+        start = time.perf_counter()
+        stats = ArtifactStats()
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            if screenshot:
+                details["screenshot"] = self._write_image(base64.b64decode(screenshot), stats)
+            if dom is not None:
+                details["dom"] = self._write_file(f"{base_path}.html", dom.encode("utf-8"), stats)
+            self._write_file(f"{base_path}.json", json.dumps(details, indent=2, ensure_ascii=False).encode("utf-8"),
+                             stats)
+        except (OSError, ValueError) as e:
+            stats.errors += 1
+            print(f"\n❌ Error al escribir las evidencias de {details['test']}: {e}")
+        finally:
+            stats.write_s += time.perf_counter() - start
+        return stats
+
+    def _write_image(self, png: bytes, stats: ArtifactStats) -> str:
+        """
+        Escribe el screenshot una sola vez por contenido y devuelve su ruta. Se registra
+        recién cuando quedó escrito: si la escritura falla, el próximo fallo igual lo intenta.
+        """
+        digest = hashlib.sha256(png).hexdigest()[:16]
+        with self._lock:
+            path = self._images.get(digest)
+        if path is not None:
+            stats.duplicates += 1
+            return path
+        path = self._write_file(os.path.join(self.directory, f"screenshot_{digest}.{self.image_format}"),
+                                self._encode(png), stats)
+        with self._lock:
+            self._images[digest] = path
+        stats.screenshots += 1
+        return path
+
+    def _encode(self, png: bytes) -> bytes:
+        if Image is None or (self.image_format == "png" and not self.max_width):
+            return png
+        image = Image.open(io.BytesIO(png))
+        if self.max_width and image.width > self.max_width:
+            height = round(image.height * self.max_width / image.width)
+            image = image.resize((self.max_width, height), Image.LANCZOS)
+        output = io.BytesIO()
+        if self.image_format == "jpeg":
+            image.convert("RGB").save(output, "JPEG", quality=IMAGE_QUALITY, optimize=True)
+        elif self.image_format == "webp":
+            image.save(output, "WEBP", quality=IMAGE_QUALITY)
+        else:
+            image.save(output, "PNG", optimize=True)
+        return output.getvalue()
+
+    def _write_file(self, path: str, content: bytes, stats: ArtifactStats) -> str:
+        with open(path, "wb") as file:
+            file.write(content)
+        stats.bytes_written += len(content)
+        return path
+
+    def flush(self) -> ArtifactStats:
+        """Espera a que terminen las escrituras encoladas y devuelve sus estadísticas de escritura sumadas."""
+        with self._lock:
+            futures, self._futures = self._futures, []
+        total = ArtifactStats()
+        for future in futures:
+            total.add(future.result())
+        return total
+
+    def close(self):
+        self.flush()
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,186 @@
+"""
+Bloqueo de recursos que ninguna verificación necesita (fuentes, video, analítica, imágenes).
+
+El perfil se arma con una lista separada por comas de categorías (ver CATEGORIES) y
+patrones de URL propios con '*' (p. ej. "fonts,analytics,*hotjar*"); "none" (el valor
+por defecto) no bloquea nada y CI usa RECOMMENDED_BLOCKING. En Chrome y Edge se aplica por prueba con CDP (Network.setBlockedURLs), que sólo
+admite patrones de URL: cada categoría es una lista de patrones por extensión o dominio.
+En Firefox, que no expone CDP, las categorías se traducen a preferencias del navegador
+al lanzarlo (firefox_prefs) y los patrones propios no se aplican.
+
+Las peticiones bloqueadas se cuentan leyendo el log 'performance' de Chrome/Edge, que
+sólo se activa cuando hay algo que bloquear (browser/factory.py). Los
+bytes ahorrados se estiman con el tamaño de cada URL bloqueada aprendido cuando se
+descargó en una ejecución anterior (ResourceSizes, .pytest_cache/resource_sizes.json o
+RESOURCE_SIZES); una ejecución con "none" los aprende todos.
+"""
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from selenium.common.exceptions import WebDriverException
+
+from storage.json_files import read_json, update_json
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_SIZES_PATH = Path(os.getenv("RESOURCE_SIZES", ROOT_DIR / ".pytest_cache" / "resource_sizes.json"))
+
+
+def _extensions(*extensions: str) -> List[str]:
+    # Con y sin query string: el patrón tiene que cubrir la URL completa
+    return [pattern for ext in extensions for pattern in (f"*.{ext}", f"*.{ext}?*")]
+
+
+CATEGORIES: Dict[str, List[str]] = {
+    "images": _extensions("png", "jpg", "jpeg", "gif", "webp", "avif", "ico") + ["*/_next/image*"],
+    "fonts": _extensions("woff", "woff2", "ttf", "otf", "eot") + ["*fonts.googleapis.com*", "*fonts.gstatic.com*"],
+    "media": _extensions("mp4", "webm", "mp3", "ogg", "m3u8"),
+    "analytics": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*connect.facebook.net*",
+        "*hotjar.com*", "*clarity.ms*", "*segment.io*", "*/_vercel/insights/*", "*/_vercel/speed-insights/*",
+    ],
+}
+NO_BLOCKING = "none"
+# Sin bloqueo por defecto: el navegador carga la página completa, como la ve un usuario
+DEFAULT_BLOCKING = NO_BLOCKING
+# Perfil recomendado (el que usa CI). Las imágenes quedan fuera: hay escenarios que verifican que carguen
+RECOMMENDED_BLOCKING = "fonts,media,analytics"
+
+# Equivalentes en preferencias de Firefox de cada categoría
+_FIREFOX_PREFS = {
+    "images": {"permissions.default.image": 2},
+    "fonts": {"gfx.downloadable_fonts.enabled": False},
+    "media": {"media.autoplay.default": 5},
+    "analytics": {"privacy.trackingprotection.enabled": True},
+}
+
+
+@dataclass(frozen=True)
+class BlockingProfile:
+    """Categorías y patrones de URL propios a bloquear."""
+    categories: Tuple[str, ...] = ()
+    patterns: Tuple[str, ...] = ()
+
+    @classmethod
+    def parse(cls, spec: Optional[str]) -> "BlockingProfile":
+        """'fonts,analytics,*hotjar*' -> categorías conocidas y el resto como patrones de URL."""
+        items = [item.strip() for item in (spec or "").split(",") if item.strip()]
+        if not items or items == [NO_BLOCKING]:
+            return cls()
+        return cls(categories=tuple(item for item in items if item in CATEGORIES),
+                   patterns=tuple(item for item in items if item not in CATEGORIES))
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.categories or self.patterns)
+
+    def url_patterns(self) -> List[str]:
+        return [pattern for category in self.categories for pattern in CATEGORIES[category]] + list(self.patterns)
+
+    def firefox_prefs(self) -> Dict[str, object]:
+        prefs = {}
+        for category in self.categories:
+            prefs.update(_FIREFOX_PREFS[category])
+        return prefs
+
+    def describe(self) -> str:
+        return ", ".join(self.categories + self.patterns) or NO_BLOCKING
+
+
+@dataclass
+class BlockingStats:
+    """Peticiones bloqueadas en una prueba y bytes que habrían descargado (si se conoce su tamaño)."""
+    blocked: int = 0
+    bytes_saved: int = 0
+    unknown_sizes: int = 0
+    transferred: int = 0
+    blocked_urls: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class ResourceSizes:
+    """Tamaño descargado (bytes) por URL, persistido entre ejecuciones."""
+
+    def __init__(self, path: Optional[Path] = DEFAULT_SIZES_PATH):
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self.sizes: Dict[str, int] = read_json(self.path, {}) if self.path else {}
+
+    def save(self):
+        """Escribe los tamaños fusionándolos con lo que otros procesos (workers de xdist) hayan guardado."""
+        if not self.path:
+            return
+        def merge(content):
+            # El mayor tamaño visto de cada URL, como en collect_blocking()
+            for url, size in self.sizes.items():
+                content[url] = max(size, content.get(url, 0))
+            return content
+
+        with self._lock:
+            # Si falla el disco sólo se pierde la estimación de bytes ahorrados
+            update_json(self.path, merge, indent=2, sort_keys=True)
+
+
+def apply_blocking(driver, profile: BlockingProfile) -> bool:
+    """
+    Activa el bloqueo del perfil en el navegador (Chrome/Edge) y descarta el log de red
+    acumulado, para que collect_blocking() cuente sólo lo de esta prueba. Devuelve False sin
+    tocar el navegador con un perfil vacío y en Firefox, donde el bloqueo ya viene de las
+    preferencias de lanzamiento.
+    """
+    if not profile.enabled or not hasattr(driver, "execute_cdp_cmd"):
+        return False
+    _performance_events(driver)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": profile.url_patterns()})
+    return True
+
+
+def _performance_events(driver) -> List[dict]:
+    """Eventos CDP del log 'performance' desde la última lectura (lo vacía)."""
+    try:
+        entries = driver.get_log("performance")
+    except (AttributeError, WebDriverException):
+        return []
+    events = []
+    for entry in entries:
+        try:
+            events.append(json.loads(entry["message"])["message"])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return events
+
+
+def collect_blocking(driver, sizes: ResourceSizes) -> BlockingStats:
+    """
+    Cuenta las peticiones bloqueadas desde apply_blocking() y aprende el tamaño de las que
+    sí se descargaron, para estimar los bytes ahorrados en próximas ejecuciones.
+    """
+    stats = BlockingStats()
+    urls: Dict[str, str] = {}
+    for event in _performance_events(driver):
+        method, params = event.get("method"), event.get("params", {})
+        if method == "Network.requestWillBeSent":
+            urls[params.get("requestId")] = params.get("request", {}).get("url", "")
+        elif method == "Network.loadingFinished":
+            url = urls.get(params.get("requestId"))
+            size = int(params.get("encodedDataLength") or 0)
+            stats.transferred += size
+            if url and size > sizes.sizes.get(url, 0):
+                # El mayor tamaño visto: desde la caché HTTP del navegador se descarga menos o nada
+                sizes.sizes[url] = size
+        elif method == "Network.loadingFailed" and params.get("blockedReason") == "inspector":
+            # 'inspector': bloqueada por Network.setBlockedURLs (no por CORS, contenido mixto, etc.)
+            url = urls.get(params.get("requestId"), "")
+            stats.blocked += 1
+            stats.blocked_urls.append(url)
+            if url in sizes.sizes:
+                stats.bytes_saved += sizes.sizes[url]
+            else:
+                stats.unknown_sizes += 1
+    return stats
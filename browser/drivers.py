@@ -0,0 +1,94 @@
+"""
+Resolución del binario del driver (chromedriver, geckodriver, msedgedriver) con caché.
+
+webdriver-manager consulta la red para saber qué versión del driver corresponde al
+navegador instalado cada vez que se llama a install(). La ruta resuelta se guarda en
+memoria (una consulta por proceso) y en un archivo JSON junto a los binarios que
+descarga webdriver-manager (~/.wdm), de modo que las ejecuciones siguientes no tocan
+la red mientras el binario siga en disco. Si el navegador se actualiza y el driver
+cacheado ya no le sirve, create_driver() invalida la entrada y vuelve a resolver.
+"""
+import json
+import os
+from typing import Dict
+
+from selenium.common.exceptions import SessionNotCreatedException
+
+from .factory import browser_name, create_driver
+
+# Archivo con la ruta resuelta de cada driver (WEBDRIVER_CACHE para cambiarlo)
+DRIVER_CACHE = os.getenv("WEBDRIVER_CACHE", os.path.join(os.path.expanduser("~"), ".wdm", "resolved_drivers.json"))
+
+_resolved: Dict[str, str] = {}
+
+
+def _manager(browser: str):
+    if browser == "firefox":
+        from webdriver_manager.firefox import GeckoDriverManager
+        return GeckoDriverManager()
+    if browser == "edge":
+        from webdriver_manager.microsoft import EdgeChromiumDriverManager
+        return EdgeChromiumDriverManager()
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager()
+
+
+def _read_cache() -> Dict[str, str]:
+    try:
+        with open(DRIVER_CACHE, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(cache: Dict[str, str]):
+    try:
+        os.makedirs(os.path.dirname(DRIVER_CACHE), exist_ok=True)
+        with open(DRIVER_CACHE, "w", encoding="utf-8") as file:
+            json.dump(cache, file, indent=2)
+    except OSError:
+        # Sin caché en disco sólo se pierde el ahorro en la próxima ejecución
+        pass
+
+
+def _usable(path) -> bool:
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def resolve_driver_path(browser: str = None) -> str:
+    """Ruta del driver del navegador: de la memoria, del archivo de caché o de webdriver-manager."""
+    browser = browser_name(browser)
+    path = _resolved.get(browser)
+    if _usable(path):
+        return path
+
+    cache = _read_cache()
+    path = cache.get(browser)
+    if not _usable(path):
+        path = _manager(browser).install()
+        cache[browser] = path
+        _write_cache(cache)
+    _resolved[browser] = path
+    return path
+
+
+def forget_driver_path(browser: str = None):
+    """Descarta la ruta cacheada (p. ej. el driver ya no es compatible con el navegador)."""
+    browser = browser_name(browser)
+    _resolved.pop(browser, None)
+    cache = _read_cache()
+    if cache.pop(browser, None) is not None:
+        _write_cache(cache)
+
+
+def create_managed_driver(browser: str = None, blocking=None):
+    """
+    create_driver() con el driver resuelto por webdriver-manager (y cacheado). Si el driver
+    cacheado no puede abrir el navegador instalado, se resuelve de nuevo una sola vez.
+    """
+    browser = browser_name(browser)
+    try:
+        return create_driver(browser, driver_path=resolve_driver_path(browser), blocking=blocking)
+    except SessionNotCreatedException:
+        forget_driver_path(browser)
+        return create_driver(browser, driver_path=resolve_driver_path(browser), blocking=blocking)
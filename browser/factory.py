@@ -0,0 +1,83 @@
+"""
+Creación de instancias de WebDriver para las pruebas de Web UI.
+
+El navegador se elige con la variable de entorno BROWSER (chrome, firefox o edge;
+chrome por defecto) y siempre se lanza en modo headless a 1920x1080. Sin 'driver_path'
+Selenium Manager localiza el driver; con él se usa ese binario (ver browser/drivers.py).
+"""
+import os
+
+from selenium import webdriver
+
+BROWSERS = ("chrome", "firefox", "edge")
+DEFAULT_BROWSER = "chrome"
+# Tiempo de espera implícito estándar de las pruebas de Web UI (segundos)
+IMPLICIT_WAIT = 10
+# Logs de Chrome/Edge: consola para las evidencias de los fallos (browser/artifacts.py) y, sólo
+# si hay bloqueo de recursos, eventos de red para contar lo bloqueado (browser/blocking.py)
+LOGGING_PREFS = {"browser": "ALL"}
+BLOCKING_LOGGING_PREFS = {**LOGGING_PREFS, "performance": "ALL"}
+
+
+def browser_name(browser: str = None) -> str:
+    """Navegador pedido (argumento o BROWSER); los valores desconocidos usan Chrome."""
+    name = (browser or os.getenv("BROWSER", DEFAULT_BROWSER)).lower()
+    return name if name in BROWSERS else DEFAULT_BROWSER
+
+
+def create_driver(browser: str = None, driver_path: str = None, blocking=None):
+    """
+    Lanza un navegador headless nuevo con el tiempo de espera implícito estándar. En Firefox,
+    'blocking' (browser.blocking.BlockingProfile) se aplica con preferencias del navegador;
+    en Chrome y Edge se aplica por prueba con CDP.
+    """
+    browser = browser_name(browser)
+    # El log 'performance' registra cada evento de red: cuesta memoria y tiempo en cada página
+    logging_prefs = BLOCKING_LOGGING_PREFS if blocking is not None and blocking.enabled else LOGGING_PREFS
+
+    if browser == "firefox":
+        from selenium.webdriver.firefox.options import Options as FirefoxOptions
+        options = FirefoxOptions()
+        options.add_argument("--headless")
+        options.add_argument("--width=1920")
+        options.add_argument("--height=1080")
+        if blocking is not None:
+            for name, value in blocking.firefox_prefs().items():
+                options.set_preference(name, value)
+        from selenium.webdriver.firefox.service import Service as FirefoxService
+        driver = webdriver.Firefox(service=FirefoxService(executable_path=driver_path), options=options)
+    elif browser == "edge":
+        from selenium.webdriver.edge.options import Options as EdgeOptions
+        options = EdgeOptions()
+        options.add_argument("--headless")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--window-size=1920,1080")
+        options.set_capability("ms:loggingPrefs", logging_prefs)
+        from selenium.webdriver.edge.service import Service as EdgeService
+        driver = webdriver.Edge(service=EdgeService(executable_path=driver_path), options=options)
+    else:  # chrome por defecto
+        options = webdriver.ChromeOptions()
+        # ✅ Opciones para entornos locales y CI (GitHub Actions)
+        options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-plugins")
+        options.add_argument("--disable-infobars")
+        options.add_argument("--disable-notifications")
+        options.add_argument("--disable-features=VizDisplayCompositor")
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-background-timer-throttling")
+        options.add_argument("--disable-renderer-backgrounding")
+        # Opción adicional para evitar problemas de zona horaria en CI
+        options.add_argument("--timezone=UTC")
+        options.set_capability("goog:loggingPrefs", logging_prefs)
+        from selenium.webdriver.chrome.service import Service as ChromeService
+        driver = webdriver.Chrome(service=ChromeService(executable_path=driver_path), options=options)
+
+    driver.implicitly_wait(IMPLICIT_WAIT)
+    return driver
@@ -0,0 +1,154 @@
+"""
+Pool de navegadores reutilizables entre pruebas.
+
+Lanzar Chrome, Firefox o Edge en headless cuesta 1-3 s por prueba. El pool mantiene
+los navegadores calientes durante toda la sesión de pytest (uno por worker de xdist,
+porque cada worker es un proceso con su propia sesión) y, al devolver uno, lo deja
+como nuevo: cierra las ventanas extra, descarta alertas, borra cookies, localStorage
+y sessionStorage y navega a about:blank. Chrome y Edge borran por CDP los datos de
+todos los orígenes visitados; Firefox no tiene CDP, así que se carga cada origen
+(CLEAR_PATH, un recurso liviano) para borrar allí cookies y almacenamiento. Si el
+reinicio falla por cualquier motivo (p. ej. la prueba hizo driver.quit() y selenium
+lanza MaxRetryError de urllib3) el navegador se descarta y la siguiente prueba recibe
+uno nuevo.
+"""
+from dataclasses import dataclass, field
+from typing import List, Set
+
+from selenium.common.exceptions import NoAlertPresentException
+
+from .artifacts import console_logs
+from .factory import IMPLICIT_WAIT, browser_name, create_driver
+
+# Reutilizaciones por navegador antes de reemplazarlo (acota fugas de memoria del proceso)
+DEFAULT_MAX_USES = 50
+
+# Tipos de almacenamiento que se borran por origen en Chrome/Edge (Storage.clearDataForOrigin)
+CDP_STORAGE_TYPES = "cookies,local_storage,session_storage,indexeddb,websql,service_workers,cache_storage"
+# Recurso del mismo origen que se carga en los navegadores sin CDP para borrar sus datos sin cargar la app
+CLEAR_PATH = "/robots.txt"
+
+_CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+return window.location.origin;
+"""
+
+
+@dataclass
+class PoolStats:
+    """Navegadores lanzados, préstamos servidos por un navegador ya abierto y descartes."""
+    launched: int = 0
+    reused: int = 0
+    discarded: int = 0
+
+
+@dataclass
+class _PooledDriver:
+    driver: object
+    uses: int = 0
+    origins: Set[str] = field(default_factory=set)
+
+
+class DriverPool:
+    """
+    Navegadores de un mismo tipo prestados a las pruebas.
+
+    Uso:
+        driver = pool.acquire()                  # caliente si hay uno libre
+        ...
+        pool.release(driver)                     # se reinicia y vuelve al pool
+        pool.release(driver, discard=True)       # se cierra (proceso limpio para la siguiente)
+    """
+
+    def __init__(self, browser: str = None, max_uses: int = DEFAULT_MAX_USES, factory=create_driver):
+        self.browser = browser_name(browser)
+        self.max_uses = max_uses
+        # Función que lanza un navegador dado su nombre (create_driver o drivers.create_managed_driver)
+        self._factory = factory
+        self.stats = PoolStats()
+        self._idle: List[_PooledDriver] = []
+        self._in_use = {}
+
+    def acquire(self, fresh: bool = False):
+        """Presta un navegador; con fresh=True siempre lanza uno nuevo."""
+        if self._idle and not fresh:
+            entry = self._idle.pop()
+            self.stats.reused += 1
+        else:
+            entry = _PooledDriver(self._factory(self.browser))
+            self.stats.launched += 1
+        entry.uses += 1
+        self._in_use[id(entry.driver)] = entry
+        return entry.driver
+
+    def release(self, driver, discard: bool = False):
+        """Devuelve el navegador al pool reiniciado, o lo cierra si se pide o no se puede reiniciar."""
+        entry = self._in_use.pop(id(driver), None) or _PooledDriver(driver)
+        reusable = not discard and (not self.max_uses or entry.uses < self.max_uses)
+        if reusable:
+            try:
+                self.reset(entry)
+            except Exception:
+                # Cualquier fallo (sesión cerrada, conexión rechazada...) deja el navegador en estado desconocido
+                reusable = False
+        if reusable:
+            self._idle.append(entry)
+        else:
+            self.stats.discarded += 1
+            _quit(driver)
+
+    def reset(self, entry: _PooledDriver):
+        """Deja el navegador como recién lanzado, salvo la caché HTTP (que se conserva a propósito)."""
+        driver = entry.driver
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
+
+        origin = driver.execute_script(_CLEAR_STORAGE_SCRIPT)
+        if origin and origin != "null":
+            entry.origins.add(origin)
+            driver.delete_all_cookies()
+        if hasattr(driver, "execute_cdp_cmd"):
+            # Chrome/Edge: cookies y almacenamiento de todos los orígenes visitados, no sólo el actual
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            for visited in entry.origins:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin",
+                                       {"origin": visited, "storageTypes": CDP_STORAGE_TYPES})
+        else:
+            # Firefox: WebDriver sólo borra los datos del origen actual, así que se visita cada uno
+            for visited in entry.origins - {origin}:
+                driver.get(visited + CLEAR_PATH)
+                driver.execute_script(_CLEAR_STORAGE_SCRIPT)
+                driver.delete_all_cookies()
+
+        driver.get("about:blank")
+        driver.implicitly_wait(IMPLICIT_WAIT)
+        # Los logs de consola se leen y vacían: la próxima prueba sólo ve los suyos (browser/artifacts.py)
+        console_logs(driver)
+
+    def close(self):
+        """Cierra todos los navegadores del pool, también los que sigan prestados."""
+        entries = self._idle + list(self._in_use.values())
+        self._idle.clear()
+        self._in_use.clear()
+        for entry in entries:
+            _quit(entry.driver)
+
+    def summary(self) -> str:
+        return (f"{self.browser}: {self.stats.launched} navegador(es) lanzado(s), "
+                f"{self.stats.reused} reutilizado(s), {self.stats.discarded} descartado(s)")
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except Exception:
+        # Silenciar errores al cerrar (la sesión pudo cerrarse ya)
+        pass
@@ -1,14 +1,35 @@
-import time
-import uuid
+import asyncio
+import glob
+import inspect
+import json
+import allure
 import requests
 import pytest
-from selenium import webdriver
 import os
-from datetime import datetime, timezone, timedelta
+from dataclasses import asdict
+from datetime import timedelta
+from html import escape
 from jsonschema import validate
-import random
-import string
-from selenium.webdriver.chrome.options import Options
+from api_client import (ApiClient, AsyncApiClient, AsyncResources, Cassette, ParallelResolver, ProvisioningError,
+                        ResourceGraph, ResourceProvisioner, TokenBroker, TokenError)
+from api_client import cassettes
+from api_client.client import DEFAULT_POOL_SIZE
+from api_client.timing import format_summary, merge_summaries, summarize
+from api_client.payloads import (aircraft_payload, airport_payload, booking_payload, flight_payload,
+                                 payment_payload, user_payload)
+from browser import DriverPool, create_driver
+from browser.artifacts import FORMATS as ARTIFACT_FORMATS, ArtifactStats, ArtifactWriter
+from browser.blocking import (DEFAULT_BLOCKING, RECOMMENDED_BLOCKING, BlockingProfile, ResourceSizes, apply_blocking,
+                              collect_blocking)
+from browser.pool import DEFAULT_MAX_USES
+from pages import performance, waits
+from pages.locators import LocatorCache
+from pages.shophub.session import ShopHubSessions
+from page_snapshots import SnapshotServer, available_snapshots, check_locators, check_seat_states
+from fake_airline_api import FakeAirlineApi
+from schemas import registry as schema_registry
+from scheduling import DurationStore
+from scheduling.durations import DEFAULT_STORE_PATH
 
 """
 Archivo de configuración global para pytest.
@@ -17,21 +38,471 @@ Contiene fixtures reutilizables y hooks personalizados.
 
 # --- Configuración Global ---
 BASE_URL = "https://cf-automation-airline-api.onrender.com"
+# Valor de --api-base-url / API_BASE_URL que levanta la API local en memoria (fake_airline_api)
+LOCAL_API = "local"
+# Directorio de los cassettes de la suite de API (--api-cassette=record|replay)
+CASSETTES_DIR = os.path.join("api_tests", "cassettes")
+
+# Grafo de dependencias de las fixtures de recursos (ver 'resource_resolver')
+RESOURCE_GRAPH = ResourceGraph()
 
 SCREENSHOTS_DIR = "screenshots"
 os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
+# Métricas de carga de página de las pruebas de Web UI, un JSON por navegador (ver pages/performance.py);
+# en la caché de pytest para que no queden archivos sin versionar en la raíz
+PAGE_METRICS_DIR = os.getenv("PAGE_METRICS_DIR", os.path.join(".pytest_cache", "page_metrics"))
 
 
 # --- Hooks de Pytest ---
+def pytest_addoption(parser):
+    """
+    Opciones de línea de comandos para las pruebas de API.
+    """
+    group = parser.getgroup("api", "API de aerolínea")
+    group.addoption(
+        "--api-base-url",
+        default=os.getenv("API_BASE_URL", BASE_URL),
+        help="URL de la API de aerolínea, o '%s' para usar la API local en memoria "
+             "(por defecto: API_BASE_URL o %s)." % (LOCAL_API, BASE_URL),
+    )
+    group.addoption(
+        "--api-cassette",
+        choices=cassettes.MODES,
+        default=os.getenv("API_CASSETTE", cassettes.OFF),
+        help="'record' graba todas las peticiones de la API en cassettes; 'replay' las sirve desde disco "
+             "sin red (por defecto: API_CASSETTE u off).",
+    )
+    group.addoption(
+        "--api-cassette-dir",
+        default=os.getenv("API_CASSETTE_DIR", CASSETTES_DIR),
+        help="Directorio de los cassettes (por defecto: API_CASSETTE_DIR o %s)." % CASSETTES_DIR,
+    )
+    group.addoption(
+        "--api-pool-size",
+        type=int,
+        default=int(os.getenv("API_POOL_SIZE", DEFAULT_POOL_SIZE)),
+        help="Conexiones keep-alive por worker de xdist para el cliente HTTP compartido "
+             "(por defecto: API_POOL_SIZE o %d)." % DEFAULT_POOL_SIZE,
+    )
+    group.addoption(
+        "--token-pool-size",
+        type=int,
+        default=int(os.getenv("API_TOKEN_POOL_SIZE", 3)),
+        help="Pasajeros pre-registrados por worker cuyos tokens se reparten en round-robin "
+             "(por defecto: API_TOKEN_POOL_SIZE o 3).",
+    )
+    group.addoption(
+        "--no-token-cache",
+        action="store_true",
+        default=False,
+        help="No leer ni guardar los tokens en la caché de pytest (.pytest_cache).",
+    )
+    group.addoption(
+        "--no-provision",
+        action="store_true",
+        default=os.getenv("API_PROVISION", "1") == "0",
+        help="No aprovisionar recursos en bloque al inicio; cada fixture crea los suyos bajo demanda.",
+    )
+    group.addoption(
+        "--provision-workers",
+        type=int,
+        default=8,
+        help="Hilos usados para crear en paralelo los recursos aprovisionados (por defecto: 8).",
+    )
+    group.addoption(
+        "--no-parallel-fixtures",
+        action="store_true",
+        default=os.getenv("API_PARALLEL_FIXTURES", "1") == "0",
+        help="Resolver las fixtures de recursos de cada prueba en serie en lugar de en paralelo.",
+    )
+    group.addoption(
+        "--benchmark-samples",
+        type=int,
+        default=int(os.getenv("API_BENCHMARK_SAMPLES", 20)),
+        help="Muestras por endpoint en las pruebas de tiempo de respuesta (por defecto: 20).",
+    )
+    group.addoption(
+        "--benchmark-warmup",
+        type=int,
+        default=3,
+        help="Peticiones de calentamiento descartadas antes de medir (por defecto: 3).",
+    )
+
+    web = parser.getgroup("web", "Pruebas de Web UI")
+    web.addoption(
+        "--no-browser-pool",
+        action="store_true",
+        default=os.getenv("BROWSER_POOL", "1") == "0",
+        help="Lanzar y cerrar un navegador por prueba en lugar de reutilizarlos entre pruebas.",
+    )
+    web.addoption(
+        "--browser-max-uses",
+        type=int,
+        default=int(os.getenv("BROWSER_MAX_USES", DEFAULT_MAX_USES)),
+        help="Pruebas que atiende cada navegador del pool antes de reemplazarlo; 0 sin límite "
+             "(por defecto: BROWSER_MAX_USES o %d)." % DEFAULT_MAX_USES,
+    )
+    web.addoption(
+        "--audit-sleeps",
+        action="store_true",
+        default=os.getenv("WEB_AUDIT_SLEEPS", "0") == "1",
+        help="Medir el tiempo dormido con time.sleep en cada prueba de Web UI y listarlo en el resumen final.",
+    )
+    web.addoption(
+        "--block-resources",
+        default=os.getenv("WEB_BLOCK_RESOURCES", DEFAULT_BLOCKING),
+        help="Recursos que el navegador no descarga: categorías (images, fonts, media, analytics) y patrones "
+             "de URL con '*', separados por comas; 'none' no bloquea nada. CI usa '%s' "
+             "(por defecto: WEB_BLOCK_RESOURCES o %s)." % (RECOMMENDED_BLOCKING, DEFAULT_BLOCKING),
+    )
+    web.addoption(
+        "--no-page-metrics",
+        action="store_true",
+        default=os.getenv("WEB_PAGE_METRICS", "1") == "0",
+        help="No medir la carga de página (Navigation Timing, LCP, CLS, long tasks) en los Page Objects.",
+    )
+    web.addoption(
+        "--perf-budgets",
+        action="store_true",
+        default=os.getenv("WEB_PERF_BUDGETS", "0") == "1",
+        help="Fallar las pruebas cuyas páginas superen su presupuesto de LCP, TTFB o duración de transición "
+             "(ver pages/performance.py).",
+    )
+    web.addoption(
+        "--ui-login",
+        action="store_true",
+        default=os.getenv("SHOPHUB_UI_LOGIN", "0") == "1",
+        help="Iniciar sesión en ShopHub por la UI en cada prueba en lugar de inyectar la sesión capturada "
+             "en el primer login (ver pages/shophub/session.py).",
+    )
+    web.addoption(
+        "--artifact-format",
+        choices=ARTIFACT_FORMATS,
+        default=os.getenv("WEB_ARTIFACT_FORMAT", "png"),
+        help="Formato de los screenshots de las pruebas que fallan; jpeg y webp requieren Pillow "
+             "(por defecto: WEB_ARTIFACT_FORMAT o png).",
+    )
+    web.addoption(
+        "--artifact-max-width",
+        type=int,
+        default=int(os.getenv("WEB_ARTIFACT_MAX_WIDTH", 0)),
+        help="Ancho máximo (px) de los screenshots de las pruebas que fallan; 0 sin reducir. Requiere Pillow "
+             "(por defecto: WEB_ARTIFACT_MAX_WIDTH o 0).",
+    )
+
+    durations = parser.getgroup("durations", "Reparto de pruebas por duración (pytest-xdist)")
+    durations.addoption(
+        "--no-duration-schedule",
+        action="store_true",
+        default=os.getenv("TEST_DURATION_SCHEDULE", "1") == "0",
+        help="Con -n, usar el reparto 'load' de xdist en lugar de los lotes por duración prevista.",
+    )
+    durations.addoption(
+        "--no-duration-store",
+        action="store_true",
+        default=False,
+        help="No leer ni actualizar el historial de duraciones (.pytest_cache/durations.json o TEST_DURATIONS).",
+    )
+
+
+# Pruebas con la preparación de recursos más lenta que se listan en el resumen final
+SLOWEST_SETUPS = 10
+# Endpoints con más tiempo acumulado que se listan en el resumen final
+SLOWEST_ENDPOINTS = 15
+# Líneas que más duermen que se listan por prueba con --audit-sleeps
+SLEEP_SITES = 3
+# Pruebas con más bytes ahorrados por el bloqueo de recursos que se listan en el resumen final
+MOST_BLOCKED = 10
+
+# Fixtures cuya demanda se aprovisiona en bloque, agrupadas por pool
+PROVISIONED_FIXTURES = {
+    "aircraft": ("aircraft_id", "aircraft_id_for_get"),
+    "flights": ("flight_id",),
+    "bookings": ("booking_id", "create_test_booking_for_listing"),
+    "payments": ("payment_id",),
+}
+
+
+def pytest_configure(config):
+    """
+    Al grabar cassettes, el proceso principal descarta los de la grabación anterior
+    (con xdist cada worker escribe luego el suyo).
+    """
+    if config.getoption("api_cassette") == cassettes.RECORD and not os.getenv("PYTEST_XDIST_WORKER"):
+        for path in glob.glob(os.path.join(config.getoption("api_cassette_dir"), "*.jsonl")):
+            os.remove(path)
+    performance.enabled = not config.getoption("no_page_metrics")
+    performance.enforce_budgets = config.getoption("perf_budgets")
+    # Sólo el proceso principal lleva el historial de duraciones: recibe los reportes de todos los workers
+    if not os.getenv("PYTEST_XDIST_WORKER"):
+        store_path = None if config.getoption("no_duration_store") else DEFAULT_STORE_PATH
+        config._duration_store = DurationStore(path=store_path)
+
+
+@pytest.hookimpl(optionalhook=True, tryfirst=True)
+def pytest_xdist_make_scheduler(config, log):
+    """
+    Con -n (reparto 'load'), reparte las pruebas entre los workers por duración prevista:
+    lotes LPT por worker y robo de trabajo al final (ver scheduling/xdist_scheduler.py).
+    """
+    if config.getvalue("dist") != "load" or config.getoption("no_duration_schedule"):
+        return None
+    from scheduling.xdist_scheduler import DurationScheduling
+    scheduler = DurationScheduling(config, log, store=config._duration_store)
+    config._duration_scheduler = scheduler
+    return scheduler
+
+
+def pytest_collection_modifyitems(session, config, items):
+    """
+    Cuenta cuántas pruebas seleccionadas piden cada recurso aprovisionable, para dimensionar
+    los pools. Con xdist la demanda se reparte entre los workers.
+    """
+    workers = int(os.getenv("PYTEST_XDIST_WORKER_COUNT", 1))
+    demand = {}
+    for pool, fixture_names in PROVISIONED_FIXTURES.items():
+        count = sum(1 for item in items if set(fixture_names) & set(getattr(item, "fixturenames", ())))
+        demand[pool] = -(-count // workers)
+    # Los aviones son compartibles: basta con uno si alguna prueba los pide
+    demand["aircraft"] = min(demand["aircraft"], 1)
+    config._provision_demand = demand
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """
+    Muestra al final de la ejecución el resumen de tiempos del cliente HTTP compartido,
+    los navegadores lanzados y reutilizados, el throughput de la validación de esquemas,
+    los localizadores alternativos que fallan siempre (pages/locators.py), el makespan
+    previsto y real del reparto por duración (con -n) y, con --audit-sleeps, el tiempo
+    dormido por prueba de Web UI. También actualiza el historial de duraciones por prueba.
+    """
+    client = getattr(config, "_api_client", None)
+    if client is not None and client.timings:
+        terminalreporter.write_sep("-", "Cliente HTTP de la API")
+        terminalreporter.write_line(client.summary())
+
+    pool = getattr(config, "_driver_pool", None)
+    if pool is not None and pool.stats.launched:
+        terminalreporter.write_sep("-", "Pool de navegadores")
+        terminalreporter.write_line(pool.summary())
+
+    if any(stats.instances for stats in schema_registry.stats.values()):
+        terminalreporter.write_sep("-", "Validación de esquemas JSON")
+        for line in schema_registry.summary():
+            terminalreporter.write_line(line)
+
+    # Preparación de recursos más lenta y tiempos HTTP por endpoint (también llegan desde los workers de xdist)
+    setups = []
+    http_timings = []
+    sleep_audits = []
+    blocked = []
+    page_metrics = []
+    artifacts = None
+    durations = {}
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) in ("setup", "call", "teardown"):
+                durations[report.nodeid] = durations.get(report.nodeid, 0.0) + report.duration
+            if getattr(report, "when", None) != "teardown":
+                continue
+            for name, value in getattr(report, "user_properties", ()):
+                if name == "resource_setup":
+                    setups.append((report.nodeid, value))
+                elif name == "http_timings":
+                    http_timings.append(value)
+                elif name == "sleep_audit":
+                    sleep_audits.append((report.nodeid, value))
+                elif name == "blocked_resources":
+                    blocked.append((report.nodeid, value))
+                elif name == "page_metrics":
+                    page_metrics.extend((report.nodeid, metrics) for metrics in value)
+                elif name == "failure_artifacts":
+                    artifacts = artifacts or ArtifactStats()
+                    artifacts.add(ArtifactStats(**value))
+    if setups:
+        terminalreporter.write_sep("-", "Preparación de recursos (camino crítico)")
+        setups.sort(key=lambda item: item[1]["wall_ms"], reverse=True)
+        for nodeid, setup in setups[:SLOWEST_SETUPS]:
+            terminalreporter.write_line(
+                f"{setup['wall_ms']:8.1f} ms real | {setup['critical_ms']:8.1f} ms crítico | "
+                f"{setup['serial_ms']:8.1f} ms en serie | {' -> '.join(setup['critical_path'])} | {nodeid}"
+            )
+    if http_timings:
+        terminalreporter.write_sep("-", "Tiempo HTTP por endpoint (ms)")
+        for line in format_summary(merge_summaries(http_timings), limit=SLOWEST_ENDPOINTS):
+            terminalreporter.write_line(line)
+    store = getattr(config, "_duration_store", None)
+    if store is not None and durations:
+        for nodeid, duration in durations.items():
+            store.record(nodeid, duration)
+        store.save()
+    scheduler = getattr(config, "_duration_scheduler", None)
+    if scheduler is not None and scheduler.summary():
+        terminalreporter.write_sep("-", "Reparto por duración (xdist)")
+        for line in scheduler.summary():
+            terminalreporter.write_line(line)
+    stale_locators = LocatorCache().stale_strategies()
+    if stale_locators:
+        terminalreporter.write_sep("-", "Localizadores que ya no encuentran su elemento")
+        for line in stale_locators:
+            terminalreporter.write_line(line)
+    if blocked:
+        terminalreporter.write_sep("-", "Recursos bloqueados (--block-resources %s)"
+                                   % BlockingProfile.parse(config.getoption("block_resources")).describe())
+        blocked.sort(key=lambda item: (item[1]["bytes_saved"], item[1]["blocked"]), reverse=True)
+        for nodeid, stats in blocked[:MOST_BLOCKED]:
+            terminalreporter.write_line(
+                f"{stats['blocked']:5d} peticiones | {stats['bytes_saved'] / 1024:8.0f} KB ahorrados "
+                f"({stats['unknown_sizes']} sin tamaño conocido) | {stats['transferred'] / 1024:8.0f} KB descargados "
+                f"| {nodeid}"
+            )
+        total_requests = sum(stats["blocked"] for _, stats in blocked)
+        total_bytes = sum(stats["bytes_saved"] for _, stats in blocked)
+        terminalreporter.write_line(f"Total: {total_requests} peticiones y {total_bytes / 1024:.0f} KB ahorrados "
+                                    f"en {len(blocked)} pruebas")
+    if page_metrics:
+        terminalreporter.write_sep("-", "Carga de páginas (mediana por página y navegador, ms)")
+        for line in _page_metrics_summary(page_metrics):
+            terminalreporter.write_line(line)
+        for path in _write_page_metrics(page_metrics):
+            terminalreporter.write_line(f"Métricas por prueba en {path}")
+    if artifacts is not None:
+        artifacts.add(getattr(config, "_artifact_writes", ArtifactStats()))
+        terminalreporter.write_sep("-", "Evidencias de fallos de Web UI (%s)" % SCREENSHOTS_DIR)
+        terminalreporter.write_line(artifacts.summary())
+    if sleep_audits:
+        terminalreporter.write_sep("-", "Tiempo dormido por prueba (--audit-sleeps)")
+        sleep_audits.sort(key=lambda item: item[1]["slept_s"], reverse=True)
+        for nodeid, audit in sleep_audits:
+            sites = ", ".join(f"{site} {seconds:.1f}s" for site, seconds in list(audit["by_site"].items())[:SLEEP_SITES])
+            terminalreporter.write_line(
+                f"{audit['slept_s']:7.1f} s dormido ({audit['sleeps']}) | {audit['waited_s']:7.1f} s en esperas "
+                f"({audit['waits']}) | {nodeid}" + (f" | {sites}" if sites else "")
+            )
+        total = sum(audit["slept_s"] for _, audit in sleep_audits)
+        terminalreporter.write_line(f"Total dormido: {total:.1f} s en {len(sleep_audits)} pruebas")
+
+
+def _page_metrics_summary(page_metrics):
+    """Una línea por página, tipo de medición y navegador con las medianas de sus métricas."""
+    groups = {}
+    for _, metrics in page_metrics:
+        groups.setdefault((metrics["page"], metrics["kind"], metrics["browser"]), []).append(metrics)
+
+    def median(values):
+        values = sorted(value for value in values if value is not None)
+        return f"{values[len(values) // 2]:7.0f}" if values else "      -"
+
+    lines = []
+    for (page, kind, browser), group in sorted(groups.items()):
+        cls = [m["cls"] for m in group if m["cls"] is not None]
+        lines.append(
+            f"{page:20s} {kind:10s} {browser:8s} n={len(group):3d} | TTFB {median(m['ttfb_ms'] for m in group)} | "
+            f"LCP {median(m['lcp_ms'] for m in group)} | duración {median(m['duration_ms'] for m in group)} | "
+            f"CLS máx {f'{max(cls):.3f}' if cls else '-':>6s} | long tasks {sum(m['long_tasks'] or 0 for m in group)}"
+        )
+    return lines
+
+
+def _write_page_metrics(page_metrics):
+    """Guarda las métricas por prueba en PAGE_METRICS_DIR/<navegador>.json; devuelve las rutas escritas."""
+    by_browser = {}
+    for nodeid, metrics in page_metrics:
+        by_browser.setdefault(metrics["browser"], {}).setdefault(nodeid, []).append(metrics)
+    os.makedirs(PAGE_METRICS_DIR, exist_ok=True)
+    paths = []
+    for browser, by_test in sorted(by_browser.items()):
+        path = os.path.join(PAGE_METRICS_DIR, f"{browser}.json")
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(by_test, file, indent=2)
+        paths.append(path)
+    return paths
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """
+    Indica al cassette de la API qué prueba está en curso, para grabar y reproducir
+    sus interacciones por prueba (ver api_client/cassettes.py), y al cliente compartido
+    a qué prueba y fase atribuir los tiempos de cada petición.
+    """
+    item.config._api_current_test = item.nodeid
+    cassette = getattr(item.config, "_api_cassette", None)
+    if cassette is not None:
+        cassette.current_test = item.nodeid
+    _set_api_stage(item, "setup")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_call(item):
+    _set_api_stage(item, "call")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_teardown(item):
+    _set_api_stage(item, "teardown")
+
+
+def _set_api_stage(item, stage):
+    """Atribuye las siguientes peticiones del cliente compartido a la prueba y su fase."""
+    client = getattr(item.config, "_api_client", None)
+    if client is not None:
+        client.current_test = item.nodeid
+        client.current_stage = stage
+
+
+def _api_event_loop(config):
+    """
+    Event loop compartido por todas las pruebas asíncronas del proceso (uno por worker de xdist).
+    """
+    loop = getattr(config, "_api_event_loop", None)
+    if loop is None:
+        loop = asyncio.new_event_loop()
+        config._api_event_loop = loop
+    return loop
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """
+    Ejecuta las pruebas definidas con 'async def' en el event loop compartido del worker.
+    Es el modo asíncrono opcional de las pruebas de API (ver fixtures 'async_api_client' y 'async_resources').
+    """
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    funcargs = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+    _api_event_loop(pyfuncitem.config).run_until_complete(pyfuncitem.obj(**funcargs))
+    return True
+
+
+def pytest_unconfigure(config):
+    loop = getattr(config, "_api_event_loop", None)
+    if loop is not None:
+        loop.close()
+    writer = getattr(config, "_artifact_writer", None)
+    if writer is not None:
+        writer.close()
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
-    Hook personalizado para tomar un screenshot automáticamente cuando una prueba de Selenium falla.
+    Hook personalizado para capturar evidencias automáticamente cuando una prueba de Selenium falla:
+    screenshot, DOM, URL y logs de consola. Sólo se leen del navegador; la escritura en disco se hace
+    en segundo plano (ver browser/artifacts.py) y la prueba no la espera: su reporte sólo lleva las
+    estadísticas de la captura en user_properties ('failure_artifacts'); las de escritura se juntan al
+    final de la sesión (pytest_sessionfinish y pytest_testnodedown).
+    También agrega al reporte de pytest-html los tiempos HTTP de la prueba (fixture '_http_timings').
     """
     # Ejecutar la prueba y obtener el resultado
     outcome = yield
     report = outcome.get_result()
 
+    table = getattr(item, "_http_timings_table", None)
+    if report.when == "teardown" and table and item.config.pluginmanager.hasplugin("html"):
+        from pytest_html import extras
+        report.extras = getattr(report, "extras", []) + [extras.html(f"<pre>{escape(table)}</pre>")]
+
     # Solo actuar si la prueba falló durante la fase de ejecución ("call")
     if report.when == "call" and report.failed:
         # Intentar obtener la instancia del driver de Selenium
@@ -48,273 +519,471 @@ def pytest_runtest_makereport(item, call):
             # Silenciar errores al intentar obtener el driver
             pass
 
-        # Si se encontró un driver válido, tomar el screenshot
+        # Si se encontró un driver válido, capturar las evidencias (se escriben en segundo plano)
         if driver is not None:
             try:
-                # Asegurarse de que la carpeta de screenshots exista
-                os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
-
-                # Generar un nombre de archivo único con timestamp y nombre de la prueba
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                safe_test_name = "".join(c for c in item.name if c.isalnum() or c in (' ', '_')).rstrip()
-                screenshot_filename = f"{safe_test_name}_{timestamp}.png"
-                screenshot_path = os.path.join(SCREENSHOTS_DIR, screenshot_filename)
-
-                # Tomar y guardar el screenshot
-                success = driver.save_screenshot(screenshot_path)
-
-                if success:
-                    print(f"\n📸 Screenshot guardado en: {screenshot_path}")
-                else:
-                    print(f"\n⚠️ No se pudo guardar el screenshot en: {screenshot_path}")
+                base_path, stats = _artifact_writer(item.config).capture(driver, item.name)
+                # Llega al resumen en el reporte de teardown, también desde los workers de xdist
+                item.user_properties.append(("failure_artifacts", stats.to_dict()))
+                print(f"\n📸 Evidencias del fallo en: {base_path}.json (screenshot, DOM, URL y consola)")
             except Exception as e:
-                # Silenciar errores al tomar el screenshot, pero registrarlos
-                print(f"\n❌ Error al intentar tomar screenshot: {e}")
+                # Silenciar errores al capturar las evidencias, pero registrarlos
+                print(f"\n❌ Error al intentar capturar las evidencias: {e}")
+
+
+def _artifact_writer(config):
+    """Escritor de evidencias de fallos del proceso, creado con el primer fallo (ver browser/artifacts.py)."""
+    writer = getattr(config, "_artifact_writer", None)
+    if writer is None:
+        writer = ArtifactWriter(SCREENSHOTS_DIR, image_format=config.getoption("artifact_format"),
+                                max_width=config.getoption("artifact_max_width"))
+        config._artifact_writer = writer
+    return writer
+
+
+def pytest_sessionfinish(session):
+    """
+    Espera las escrituras de evidencias pendientes (al final de la sesión, no en la limpieza de
+    cada prueba) y guarda sus estadísticas para el resumen; en un worker de xdist se envían al
+    proceso principal en workeroutput.
+    """
+    writer = getattr(session.config, "_artifact_writer", None)
+    if writer is None:
+        return
+    writes = writer.flush()
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["artifact_writes"] = writes.to_dict()
+    else:
+        session.config._artifact_writes = writes
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Suma las estadísticas de escritura de evidencias que envía cada worker de xdist al terminar."""
+    writes = getattr(node, "workeroutput", {}).get("artifact_writes")
+    if writes:
+        total = getattr(node.config, "_artifact_writes", None) or ArtifactStats()
+        total.add(ArtifactStats(**writes))
+        node.config._artifact_writes = total
 
 
 # --- Fixtures ---
 
-@pytest.fixture
-def auth_token():
+@pytest.fixture(scope="session")
+def fake_airline_api(request):
+    """
+    API de aerolínea local en memoria (una por worker de xdist), o None si las pruebas usan la API remota.
+    Se activa con --api-base-url=local o API_BASE_URL=local; FAKE_API_FAULTS activa fallos simulados.
+    """
+    if request.config.getoption("api_base_url") != LOCAL_API:
+        yield None
+        return
+    api = FakeAirlineApi(faults=os.getenv("FAKE_API_FAULTS", "")).start()
+    yield api
+    api.stop()
+
+
+@pytest.fixture(autouse=True)
+def _fake_api_faults(request):
     """
-    Fixture que registra un nuevo usuario de prueba y devuelve su token JWT.
+    Fuerza los fallos simulados del marker 'fake_api_fault' mientras dura la prueba.
+    Contra la API remota no hace nada: ahí los fallos los simula el propio servidor.
     """
-    # Generar email único usando uuid4 para evitar colisiones
-    email = f"user_{uuid.uuid4()}@test.com"
-    password = "SecurePass123!"
-    full_name = "Test User"
+    marker = request.node.get_closest_marker("fake_api_fault")
+    api = request.getfixturevalue("fake_airline_api") if marker else None
+    if api is None:
+        yield
+        return
+    with api.faults.forced(*marker.args):
+        yield
 
-    # 1. Registrar usuario
-    signup_data = {"email": email, "password": password, "full_name": full_name}
+
+@pytest.fixture(autouse=True)
+def _http_timings(request):
+    """
+    Desglose por fases (DNS, conexión, TLS, TTFB, descarga) de las peticiones HTTP de la prueba,
+    incluidas las de sus fixtures. Se adjunta a los reportes de Allure y pytest-html, por endpoint
+    y por fase de la prueba, y se suma por endpoint en el resumen final.
+    """
+    client = request.config.__dict__.get("_api_client")
+    first = len(client.timings) if client is not None else 0
+    yield
+    client = request.config.__dict__.get("_api_client")
+    if client is None:
+        return
+    records = [timing for timing in client.timings[first:] if timing.test == request.node.nodeid]
+    if not records:
+        return
+
+    request.node.user_properties.append(("http_timings", summarize(records)))
+    sections = []
+    for stage, title in (("setup", "Preparación (fixtures)"), ("call", "Prueba"), ("teardown", "Limpieza")):
+        stage_records = [timing for timing in records if timing.stage == stage]
+        if stage_records:
+            sections.append(f"{title}\n" + "\n".join(format_summary(summarize(stage_records))))
+    table = "\n\n".join(sections)
+    allure.attach(table, name="Tiempos HTTP por endpoint", attachment_type=allure.attachment_type.TEXT)
+    allure.attach(json.dumps([asdict(timing) for timing in records], indent=2),
+                  name="Tiempos HTTP por petición", attachment_type=allure.attachment_type.JSON)
+    request.node._http_timings_table = table
+
+
+@pytest.fixture(autouse=True)
+def _sleep_audit(request):
+    """
+    Con --audit-sleeps, mide en las pruebas de Web UI el tiempo dormido con time.sleep (por
+    línea que duerme) y el esperado por señales de pages/waits.py; se lista en el resumen final.
+    """
+    if not request.config.getoption("audit_sleeps") or "driver" not in request.fixturenames:
+        yield
+        return
+    waits.start_audit()
     try:
-        signup_response = requests.post(f"{BASE_URL}/auth/signup", json=signup_data)
-    except requests.exceptions.RequestException as e:
-        pytest.skip(f"Error de red al intentar registrar usuario: {e}")
+        yield
+    finally:
+        audit = waits.stop_audit()
+        request.node.user_properties.append(("sleep_audit", audit.to_dict()))
 
-    # Aceptar error 500 y saltar la prueba
-    if signup_response.status_code == 500:
-        error_detail = signup_response.text
-        pytest.skip(
-            f"El endpoint /auth/signup devolvió 500. "
-            f"Esto indica un posible fallo interno en el servidor de la API de prueba. "
-            f"Cuerpo de la respuesta: {error_detail}"
-        )
 
-    if signup_response.status_code != 201:
-        pytest.fail(
-            f"Error al registrar usuario de prueba en la fixture 'auth_token'. "
-            f"Esperaba 201, obtuvo {signup_response.status_code}. "
-            f"Payload enviado: {signup_data}. "
-            f"Cuerpo de la respuesta: {signup_response.text}"
-        )
+@pytest.fixture(scope="session")
+def api_client(request, fake_airline_api):
+    """
+    Fixture que proporciona un cliente HTTP compartido para la API de aerolínea.
+    Reutiliza las conexiones keep-alive durante toda la sesión (una por worker de xdist).
+    """
+    base_url = fake_airline_api.url if fake_airline_api else request.config.getoption("api_base_url")
+    client = ApiClient.from_env(base_url, pool_size=request.config.getoption("api_pool_size"),
+                                trust_env=fake_airline_api is None)
+    request.config._api_client = client
+    client.current_test = getattr(request.config, "_api_current_test", None)
+    client.current_stage = "setup"
+
+    cassette = None
+    mode = request.config.getoption("api_cassette")
+    if mode != cassettes.OFF:
+        cassette = Cassette(request.config.getoption("api_cassette_dir"),
+                            os.getenv("PYTEST_XDIST_WORKER", "master"))
+        if mode == cassettes.REPLAY:
+            cassette.load()
+            print(f"\n📼 Reproduciendo {len(cassette)} interacciones grabadas de {cassette.directory}")
+        cassette.current_test = getattr(request.config, "_api_current_test", None)
+        client.use_cassette(cassette, mode)
+    request.config._api_cassette = cassette
+
+    yield client
+    if cassette is not None and mode == cassettes.RECORD:
+        cassette.save()
+    client.close()
+
+@pytest.fixture(scope="session")
+def token_broker(api_client, fake_airline_api, request):
+    """
+    Fixture de sesión con el broker de tokens (uno por worker de xdist).
+    Mantiene un pool de pasajeros pre-registrados y guarda sus tokens en la caché de pytest,
+    de modo que las re-ejecuciones dentro de la vigencia del JWT no repiten registro ni login.
+    Con la API local no se usa la caché: sus cuentas desaparecen al terminar la sesión. Tampoco con
+    cassettes, para que el registro y el login queden grabados.
+    """
+    cache_path = None
+    config = request.config
+    if (fake_airline_api is None and config.getoption("api_cassette") == cassettes.OFF
+            and getattr(config, "cache", None) is not None and not config.getoption("no_token_cache")):
+        worker_id = os.getenv("PYTEST_XDIST_WORKER", "master")
+        cache_path = config.cache.mkdir("api_tokens") / f"{worker_id}.json"
+    return TokenBroker(api_client, pool_size=config.getoption("token_pool_size"), cache_path=cache_path)
+
+
+@pytest.fixture(scope="session")
+def resource_pool(api_client, token_broker, request):
+    """
+    Fixture de sesión que crea en paralelo, al primer uso, los aviones, vuelos, reservas y pagos
+    que piden las pruebas seleccionadas, y los entrega desde pools tipados.
+    Si el aprovisionamiento falla o el pool se agota, las fixtures crean el recurso bajo demanda.
+    Con cassettes no se aprovisiona: cada prueba crea (y graba) sus recursos, así la reproducción
+    no depende de qué pruebas se seleccionen ni de cuántos workers haya.
+    """
+    config = request.config
+    provisioner = ResourceProvisioner(api_client, token_broker, max_workers=config.getoption("provision_workers"))
+    demand = getattr(config, "_provision_demand", {})
+    if (config.getoption("no_provision") or config.getoption("api_cassette") != cassettes.OFF
+            or not any(demand.values())):
+        return provisioner
 
-    # 2. Hacer login
-    login_data = {"username": email, "password": password}
     try:
-        login_response = requests.post(f"{BASE_URL}/auth/login", data=login_data)
-    except requests.exceptions.RequestException as e:
-        pytest.skip(f"Error de red al intentar iniciar sesión: {e}")
+        created = provisioner.provision(**demand)
+        print(f"\n📦 Recursos aprovisionados: {created}")
+    except (requests.exceptions.RequestException, TokenError) as e:
+        print(f"\n⚠️  No se pudo aprovisionar recursos, se crearán bajo demanda: {e}")
+    if provisioner.errors:
+        print(f"⚠️  {len(provisioner.errors)} recursos no se pudieron aprovisionar. Primero: {provisioner.errors[0]}")
+    return provisioner
 
-    if login_response.status_code != 200:
-        pytest.fail(
-            f"Error al iniciar sesión con el usuario de prueba en la fixture 'auth_token'. "
-            f"Esperaba 200, obtuvo {login_response.status_code}. "
-            f"Payload enviado: {login_data}. "
-            f"Cuerpo de la respuesta: {login_response.text}"
-        )
 
-    token_data = login_response.json()
-    access_token = token_data.get("access_token")
-    if not access_token:
-        pytest.fail(
-            f"No se obtuvo 'access_token' al iniciar sesión en la fixture 'auth_token'. "
-            f"Datos del token recibidos: {token_data}"
-        )
+@pytest.fixture(scope="session")
+def async_api_client(api_client):
+    """
+    Versión awaitable del cliente compartido, para pruebas 'async def'.
+    Comparte conexiones y registro de tiempos con 'api_client'.
+    """
+    client = AsyncApiClient(api_client)
+    yield client
+    client.close()
+
+
+class _SkippingAsyncResources:
+    """
+    AsyncResources para las pruebas: traduce los errores al preparar un recurso a skip/fail
+    como las fixtures síncronas (error de red, 401/403 o 500 -> skip; el resto -> fail).
+    """
+
+    def __init__(self, resources: AsyncResources):
+        self._resources = resources
+
+    def __getattr__(self, name):
+        method = getattr(self._resources, name)
+
+        async def call(*args, **kwargs):
+            try:
+                return await method(*args, **kwargs)
+            except requests.exceptions.RequestException as e:
+                pytest.skip(f"Error de red al preparar '{name}' en 'async_resources': {e}")
+            except (ProvisioningError, TokenError) as e:
+                if e.response is not None and e.response.status_code in (401, 403, 500):
+                    pytest.skip(
+                        f"La API devolvió {e.response.status_code} al preparar '{name}' en 'async_resources'. "
+                        f"Detalle: {e}"
+                    )
+                pytest.fail(f"No se pudo preparar '{name}' en 'async_resources'. Detalle: {e}")
+
+        return call
+
+
+@pytest.fixture(scope="session")
+def async_resources(async_api_client, token_broker):
+    """
+    Versiones asíncronas de las fixtures de recursos (aircraft_id, flight_id, booking_id, payment_id...).
+    Los pasos independientes de cada recurso se resuelven en paralelo. Como en las fixtures
+    síncronas, un fallo de la API al preparar el recurso omite la prueba en vez de darla por errónea.
+    """
+    return _SkippingAsyncResources(AsyncResources(async_api_client, token_broker))
 
-    return access_token
 
 @pytest.fixture
-def user_token():
+def resource_resolver(request, api_client, token_broker, resource_pool):
     """
-    Fixture que crea un nuevo usuario de prueba y devuelve su token de acceso.
-    Se ejecuta una vez por prueba que lo requiere.
+    Resuelve las fixtures de recursos que pide la prueba según RESOURCE_GRAPH: las ramas
+    independientes (p. ej. el token del pasajero y la cadena avión -> vuelo) se crean a la vez.
+    Al terminar guarda en el reporte los tiempos de preparación y el camino crítico.
     """
-    # Generar un email único
-    timestamp = str(int(time.time()))[-5:]
-    random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=3))
-    test_email = f"fixture_user_{timestamp}_{random_suffix}@test.com"
-    test_password = "SecurePass123!"
+    resolver = ParallelResolver(
+        RESOURCE_GRAPH,
+        request.fixturenames,
+        parallel=not request.config.getoption("no_parallel_fixtures"),
+        api_client=api_client,
+        token_broker=token_broker,
+        resource_pool=resource_pool,
+    )
+    yield resolver
+    if resolver.timings:
+        request.node.user_properties.append(("resource_setup", resolver.report()))
 
-    user_data = {
-        "email": test_email,
-        "password": test_password,
-        "full_name": f"Fixture Tester {timestamp}"
-    }
 
-    # Registrar el nuevo usuario
+def _get_token(fixture_name, get_token):
+    """
+    Obtiene un token del broker traduciendo los errores a skip/fail como el resto de fixtures.
+    """
     try:
-        signup_response = requests.post(f"{BASE_URL}/auth/signup", json=user_data)
+        return get_token()
     except requests.exceptions.RequestException as e:
-        pytest.skip(f"Error de red al intentar registrar usuario en fixture 'user_token': {e}")
-
-    # Manejar posibles errores durante el registro
-    if signup_response.status_code == 201:
-        # Registro exitoso
-        print(f"✅ Usuario de prueba creado en fixture 'user_token': {test_email}")
-    elif signup_response.status_code == 400:
-        error_detail = signup_response.json().get("detail", "")
-        if "already registered" in str(error_detail).lower():
-            # Manejar errores
-            pytest.fail(
-                f"Error inesperado en fixture 'user_token': El email '{test_email}' ya estaba registrado. "
-                f"Esto es inusual con un email generado. "
-                f"Detalle: {error_detail}"
-            )
-        else:
-            pytest.fail(
-                f"Error 400 en fixture 'user_token' al crear usuario de prueba. "
-                f"Detalle: {error_detail}"
+        pytest.skip(f"Error de red al obtener token en la fixture '{fixture_name}': {e}")
+    except TokenError as e:
+        if e.response is not None and e.response.status_code == 500:
+            pytest.skip(
+                f"La API devolvió un error 500 en la fixture '{fixture_name}'. "
+                f"Esto indica un posible fallo interno en el servidor de la API de prueba. "
+                f"Detalle: {e}"
             )
-    elif signup_response.status_code == 500:
-         pytest.skip(
-            f"La API devolvió un error 500 en fixture 'user_token' al intentar crear un usuario de prueba. "
-            f"Esto indica un posible fallo interno en el servidor de la API. "
-            f"Cuerpo de la respuesta: {signup_response.text}"
-        )
-    else:
-        # Manejar otro error inesperado
-        pytest.fail(
-            f"Error inesperado en fixture 'user_token' al crear usuario de prueba. "
-            f"Status: {signup_response.status_code}, "
-            f"Body: {signup_response.text}"
-        )
+        pytest.fail(f"No se pudo obtener un token en la fixture '{fixture_name}'. Detalle: {e}")
 
-    # Iniciar sesión con el usuario recién creado
-    login_data = {
-        "username": test_email,
-        "password": test_password
-    }
-    try:
-        login_response = requests.post(f"{BASE_URL}/auth/login", data=login_data)
-    except requests.exceptions.RequestException as e:
-         pytest.skip(f"Error de red en fixture 'user_token' al intentar iniciar sesión: {e}")
 
-    if login_response.status_code == 200:
-        token_data = login_response.json()
-        return token_data["access_token"]
-    else:
-        # Indica si el login falla después de crear el usuario
-        pytest.fail(
-            f"Falló el login en fixture 'user_token' del usuario de prueba recién creado. "
-            f"Status: {login_response.status_code}, Body: {login_response.text}. "
-            f"Esto indica un problema inesperado después de la creación."
-        )
+@RESOURCE_GRAPH.node("auth_token", deps=())
+def _provide_auth_token(ctx):
+    return _get_token("auth_token", ctx.token_broker.passenger_token)
+
+
+@pytest.fixture
+def auth_token(resource_resolver):
+    """
+    Fixture que devuelve el token JWT de un pasajero de prueba.
+    Los pasajeros se registran una sola vez por sesión y se reparten en round-robin.
+    """
+    return resource_resolver.get("auth_token")
+
+
+@RESOURCE_GRAPH.node("user_token", deps=())
+def _provide_user_token(ctx):
+    return _get_token("user_token", ctx.token_broker.passenger_token)
+
 
 @pytest.fixture
-def driver():
+def user_token(resource_resolver):
     """
-    Fixture que configura y proporciona una instancia del driver de Selenium. Pruebas de Web UI.
+    Fixture que devuelve el token de acceso de un pasajero de prueba del pool de sesión.
+    El token se renueva automáticamente antes de que expire.
+    """
+    return resource_resolver.get("user_token")
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """
+    Navegadores reutilizables de la sesión (uno por worker de xdist), según la variable BROWSER.
+    Ver browser/pool.py. También carga los tamaños de recursos aprendidos (browser/blocking.py).
+    """
+    blocking = BlockingProfile.parse(request.config.getoption("block_resources"))
+    pool = DriverPool(max_uses=request.config.getoption("browser_max_uses"),
+                      factory=lambda browser: create_driver(browser, blocking=blocking))
+    request.config._driver_pool = pool
+    request.config._blocking = blocking
+    request.config._resource_sizes = ResourceSizes()
+    yield pool
+    pool.close()
+    request.config._resource_sizes.save()
+
+
+@pytest.fixture
+def driver(request, driver_pool):
+    """
+    Fixture que proporciona una instancia del driver de Selenium. Pruebas de Web UI.
     Soporta Chrome, Firefox y Edge según variable de entorno BROWSER.
+    El navegador sale del pool de la sesión y, al terminar, se reinicia (cookies, almacenamiento,
+    ventanas, about:blank) para la siguiente prueba. Las pruebas marcadas con 'fresh_browser'
+    (o toda la ejecución con --no-browser-pool) reciben un proceso nuevo que se cierra al final.
+    Los recursos de --block-resources no se descargan; lo bloqueado se lista en el resumen final.
+    Las métricas de carga que tomen los Page Objects (pages/performance.py) se adjuntan a la prueba.
     """
-    browser = os.getenv('BROWSER', 'chrome').lower()
-
-    if browser == 'firefox':
-        from selenium.webdriver.firefox.options import Options as FirefoxOptions
-        options = FirefoxOptions()
-        options.add_argument("--headless")
-        options.add_argument("--width=1920")
-        options.add_argument("--height=1080")
-        driver = webdriver.Firefox(options=options)
-    elif browser == 'edge':
-        from selenium.webdriver.edge.options import Options as EdgeOptions
-        options = EdgeOptions()
-        options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        driver = webdriver.Edge(options=options)
-    else:  # chrome por defecto
-        options = webdriver.ChromeOptions()
-        # ✅ Opciones para entornos locales y CI (GitHub Actions)
-        options.add_argument("--headless=new")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-plugins")
-        options.add_argument("--disable-infobars")
-        options.add_argument("--disable-notifications")
-        options.add_argument("--disable-features=VizDisplayCompositor")
-        options.add_argument("--disable-background-networking")
-        options.add_argument("--disable-background-timer-throttling")
-        options.add_argument("--disable-renderer-backgrounding")
-        # Opción adicional para evitar problemas de zona horaria en CI
-        options.add_argument("--timezone=UTC")
-        # Iniciar el driver
-        driver = webdriver.Chrome(options=options)
-    # Establecer un tiempo de espera implícito estándar
-    driver.implicitly_wait(10)
+    fresh = (request.node.get_closest_marker("fresh_browser") is not None
+             or request.config.getoption("no_browser_pool"))
+    driver = driver_pool.acquire(fresh=fresh)
+    blocking = apply_blocking(driver, request.config._blocking)
     yield driver
 
-    # Código de limpieza: cerrar el driver al finalizar la prueba
     try:
-        driver.quit()
-    except:
-        # Silenciar errores al cerrar
-        pass
+        if blocking:
+            stats = collect_blocking(driver, request.config._resource_sizes)
+            request.node.user_properties.append(("blocked_resources", stats.to_dict()))
+        page_metrics = [asdict(metrics) for metrics in performance.take(driver)]
+        if page_metrics:
+            request.node.user_properties.append(("page_metrics", page_metrics))
+            allure.attach(json.dumps(page_metrics, indent=2), name="Métricas de carga de página",
+                          attachment_type=allure.attachment_type.JSON)
+    finally:
+        # Código de limpieza: reiniciar el navegador para la siguiente prueba, o cerrarlo (también si
+        # la prueba lo cerró y las lecturas anteriores fallaron)
+        driver_pool.release(driver, discard=fresh)
+
+@pytest.fixture(scope="session")
+def shophub_sessions(request):
+    """
+    Sesiones de ShopHub de la sesión de pytest (una por worker de xdist): el primer login de
+    cada usuario se hace por la UI y las pruebas siguientes reciben la sesión inyectada. Se
+    guardan en la caché de pytest mientras su JWT siga vigente. Ver pages/shophub/session.py.
+    """
+    config = request.config
+    cache_path = None
+    if getattr(config, "cache", None) is not None:
+        worker_id = os.getenv("PYTEST_XDIST_WORKER", "master")
+        cache_path = config.cache.mkdir("shophub_sessions") / f"{worker_id}.json"
+    sessions = ShopHubSessions(cache_path=cache_path, force_ui=config.getoption("ui_login"))
+    yield sessions
+    print(f"\n🔑 Sesiones de ShopHub: {sessions.summary()}")
+
 
 @pytest.fixture
-def scenario_state():
-    return {}
+def shophub_login(driver, shophub_sessions):
+    """
+    Deja el navegador de la prueba autenticado en ShopHub: shophub_login(email, password).
+    Para las pruebas que necesitan un usuario con sesión iniciada, no para las que verifican
+    el login (esas usan LoginPage).
+    """
+    return lambda email, password: shophub_sessions.login(driver, email, password)
 
-# --- Fixtures para Recursos de Prueba Específicos ---
 
 @pytest.fixture(scope="session")
-def admin_token():
+def snapshot_locators(driver_pool):
     """
-    Fixture que obtiene un token JWT para el usuario administrador preexistente.
-    Se reutiliza para todas las pruebas que lo necesiten dentro de una sesión.
+    Localizadores de los Page Objects contados en los snapshots guardados, con un navegador del
+    pool y el servidor local de page_snapshots: {'Clase.ATRIBUTO': LocatorCheck}. Sin snapshots
+    capturados (python -m page_snapshots capture) las pruebas que lo usan se omiten.
     """
-    login_data = {
-        "username": "admin@demo.com",
-        "password": "admin123"
-    }
+    if not available_snapshots():
+        pytest.skip("No hay snapshots de páginas: capturarlos con 'python -m page_snapshots capture'.")
+    server = SnapshotServer().start()
+    driver = driver_pool.acquire()
     try:
-        response = requests.post(f"{BASE_URL}/auth/login", data=login_data)
+        checks = check_locators(driver, server)
+    finally:
+        driver_pool.release(driver)
+        server.stop()
+    return {check.key: check for check in checks}
+
+
+@pytest.fixture(scope="session")
+def snapshot_seat_states(driver_pool):
+    """
+    Asientos por estado que pages/fake_cinema/seat_map.py lee en el snapshot de la sala
+    (page_snapshots.check_seat_states). Sin ese snapshot las pruebas que lo usan se omiten.
+    """
+    if "cinema/seat_grid" not in available_snapshots():
+        pytest.skip("No hay snapshot de la sala: capturarlo con 'python -m page_snapshots capture --app cinema'.")
+    server = SnapshotServer().start()
+    driver = driver_pool.acquire()
+    try:
+        return check_seat_states(driver, server)
+    finally:
+        driver_pool.release(driver)
+        server.stop()
+
+
+@pytest.fixture
+def scenario_state():
+    return {}
+
+# --- Fixtures para Recursos de Prueba Específicos ---
+
+@RESOURCE_GRAPH.node("admin_token", deps=())
+def _provide_admin_token(ctx):
+    try:
+        return ctx.token_broker.admin_token()
     except requests.exceptions.RequestException as e:
         pytest.skip(f"Error de red al intentar iniciar sesión como admin: {e}")
-
-    if response.status_code == 200:
-        token_data = response.json()
-        return token_data["access_token"]
-    else:
+    except TokenError as e:
         pytest.skip(
-            f"No se pudo obtener el token de admin. "
-            f"Status: {response.status_code}, Body: {response.text}. "
+            f"No se pudo obtener el token de admin. {e}. "
             f"Esto puede deberse a credenciales incorrectas o a un fallo en la API de prueba."
         )
 
 
 @pytest.fixture
-def aircraft_id(admin_token):
+def admin_token(resource_resolver):
     """
-    Fixture que crea un avión de prueba y devuelve su ID.
+    Fixture que obtiene un token JWT para el usuario administrador preexistente.
+    El login se hace una sola vez por sesión; el broker renueva el token antes de que expire.
     """
+    return resource_resolver.get("admin_token")
+
+
+@RESOURCE_GRAPH.node("aircraft_id", deps=("admin_token",))
+def _provide_aircraft_id(ctx):
+    pooled_id = ctx.resource_pool.take("aircraft")
+    if pooled_id:
+        return pooled_id
+
+    admin_token = ctx.need("admin_token")
     headers = {"Authorization": f"Bearer {admin_token}"}
-    # Generar un tail_number único
-    timestamp = str(int(time.time()))[-5:]
-    random_suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=3))
-    tail_number = f"N{timestamp}{random_suffix}"[:6]  # Asegurar 6 caracteres
-
-    new_aircraft_data = {
-        "tail_number": tail_number,
-        "model": f"Test Model {timestamp}",
-        "capacity": 150
-    }
+    new_aircraft_data = aircraft_payload()
     try:
-        response = requests.post(f"{BASE_URL}/aircrafts", json=new_aircraft_data, headers=headers)
+        response = ctx.api_client.post("/aircrafts", json=new_aircraft_data, headers=headers)
     except requests.exceptions.RequestException as e:
         pytest.fail(f"Error de red al crear avión de prueba: {e}")
 
@@ -344,26 +1013,26 @@ def aircraft_id(admin_token):
 
 
 @pytest.fixture
-def flight_id(admin_token, aircraft_id):
+def aircraft_id(resource_resolver):
     """
-    Fixture que crea un vuelo de prueba y devuelve su ID.
-    Requiere las fixtures 'admin_token' y 'aircraft_id'.
+    Fixture que devuelve el ID de un avión de prueba.
+    Los aviones son compartibles: se toman del pool aprovisionado y sólo se crea uno si está vacío.
     """
-    headers = {"Authorization": f"Bearer {admin_token}"}
+    return resource_resolver.get("aircraft_id")
 
-    future_time = datetime.now(timezone.utc) + timedelta(hours=1)
-    arrival_time = future_time + timedelta(hours=2)
-
-    new_flight_data = {
-        "origin": "MEX",
-        "destination": "BCN",
-        "departure_time": future_time.isoformat(),
-        "arrival_time": arrival_time.isoformat(),
-        "base_price": 599.99,
-        "aircraft_id": aircraft_id
-    }
+
+@RESOURCE_GRAPH.node("flight_id", deps=("admin_token", "aircraft_id"))
+def _provide_flight_id(ctx):
+    pooled_id = ctx.resource_pool.take("flights")
+    if pooled_id:
+        return pooled_id
+
+    # Token de admin y avión se resuelven en paralelo
+    admin_token, aircraft_id = ctx.need("admin_token", "aircraft_id")
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    new_flight_data = flight_payload(aircraft_id)
     try:
-        response = requests.post(f"{BASE_URL}/flights", json=new_flight_data, headers=headers)
+        response = ctx.api_client.post("/flights", json=new_flight_data, headers=headers)
     except requests.exceptions.RequestException as e:
         pytest.fail(f"Error de red al crear vuelo de prueba: {e}")
 
@@ -411,29 +1080,34 @@ def flight_id(admin_token, aircraft_id):
     return created_flight["id"]
 
 
-# --- Fixture para crear una reserva de prueba ---
 @pytest.fixture
-def booking_id(user_token, flight_id):
+def flight_id(resource_resolver):
     """
-    Fixture que crea una reserva de prueba para un vuelo dado y un usuario autenticado.
-    Devuelve el ID de la reserva creada.
+    Fixture que devuelve el ID de un vuelo de prueba de uso exclusivo para la prueba.
+    Se toma del pool aprovisionado; si está vacío, se crea usando la fixture 'aircraft_id'.
     """
+    return resource_resolver.get("flight_id")
+
+
+# --- Fixture para crear una reserva de prueba ---
+@RESOURCE_GRAPH.node("booking_id", deps=("user_token", "flight_id"))
+def _provide_booking_id(ctx):
+    if ctx.resource_pool.available("bookings"):
+        user_token = ctx.need("user_token")
+        pooled_id = ctx.resource_pool.take("bookings", token=user_token)
+        if pooled_id:
+            return pooled_id
+
+    # Token de pasajero y vuelo (con su avión) se resuelven en paralelo
+    user_token, flight_id = ctx.need("user_token", "flight_id")
     headers = {"Authorization": f"Bearer {user_token}"}
 
     # Datos para la nueva reserva
-    new_booking_data = {
-        "flight_id": flight_id,
-        "passengers": [
-            {
-                "full_name": "Pasajero de Prueba Fixture",
-                "passport": "P12345678"
-            }
-        ]
-    }
+    new_booking_data = booking_payload(flight_id)
 
     # Crear la reserva
     try:
-        response = requests.post(f"{BASE_URL}/bookings", json=new_booking_data, headers=headers)
+        response = ctx.api_client.post("/bookings", json=new_booking_data, headers=headers)
     except requests.exceptions.RequestException as e:
         pytest.fail(f"Error de red al crear reserva de prueba: {e}")
 
@@ -467,26 +1141,27 @@ def booking_id(user_token, flight_id):
     assert "id" in created_booking, "Falta 'id' en la respuesta de la reserva creada por la fixture."
     return created_booking["id"]
 
+
 @pytest.fixture
-def airport_iata_code(admin_token):
+def booking_id(resource_resolver):
     """
-    Fixture que crea un aeropuerto de prueba y devuelve su código IATA.
+    Fixture que devuelve el ID de una reserva de prueba del usuario autenticado ('user_token').
+    Se toma del pool aprovisionado; si está vacío, se crea sobre la fixture 'flight_id'.
     """
-    headers = {"Authorization": f"Bearer {admin_token}"}
-    # Generar un código IATA único (3 letras mayúsculas)
-    prefix = "T"  # Letra fija para el primer carácter
-    suffix = ''.join(random.choices(string.ascii_uppercase, k=2))  # 2 letras aleatorias
-    iata_code = f"{prefix}{suffix}"  # Resultado: "T" + 2 letras aleatorias = 3 letras
+    return resource_resolver.get("booking_id")
 
-    new_airport_data = {
-        "iata_code": iata_code,
-        "city": f"Test City {int(time.time())}",
-        "country": "Test Country"
-    }
+
+@RESOURCE_GRAPH.node("airport_iata_code", deps=("admin_token",))
+def _provide_airport_iata_code(ctx):
+    admin_token = ctx.need("admin_token")
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    # Código IATA único: "T" + 2 letras aleatorias
+    new_airport_data = airport_payload()
+    iata_code = new_airport_data["iata_code"]
 
     # Crear el aeropuerto
     try:
-        response = requests.post(f"{BASE_URL}/airports", json=new_airport_data, headers=headers)
+        response = ctx.api_client.post("/airports", json=new_airport_data, headers=headers)
     except requests.exceptions.RequestException as e:
         pytest.fail(f"Error de red al crear aeropuerto de prueba: {e}")
 
@@ -524,32 +1199,25 @@ def airport_iata_code(admin_token):
     )
     return created_airport["iata_code"]
 
+
 @pytest.fixture
-def user_id_to_delete(admin_token):
+def airport_iata_code(resource_resolver):
     """
-    Fixture que crea un usuario de prueba específico para ser eliminado.
-    Devuelve el ID del usuario creado.
+    Fixture que crea un aeropuerto de prueba y devuelve su código IATA.
     """
+    return resource_resolver.get("airport_iata_code")
+
+
+@RESOURCE_GRAPH.node("user_id_to_delete", deps=("admin_token",))
+def _provide_user_id_to_delete(ctx):
+    admin_token = ctx.need("admin_token")
     headers = {"Authorization": f"Bearer {admin_token}"}
-    # Generar un email único
-    import random
-    import string
-    timestamp = str(int(time.time()))[-5:]
-    random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=3))
-    test_email = f"user_to_delete_{timestamp}_{random_suffix}@test.com"
-    test_password = "ToDeletePass123!"
-    full_name = f"User to Delete {timestamp}"
-
-    user_data = {
-        "email": test_email,
-        "password": test_password,
-        "full_name": full_name,
-        "role": "passenger" # Rol opcional, por defecto es passenger
-    }
+    # Generar un usuario con email único (rol opcional, por defecto es passenger)
+    user_data = user_payload("user_to_delete", "ToDeletePass123!", "User to Delete")
 
     # Crear el usuario
     try:
-        response = requests.post(f"{BASE_URL}/users/", json=user_data, headers=headers)
+        response = ctx.api_client.post("/users/", json=user_data, headers=headers)
     except requests.exceptions.RequestException as e:
         pytest.fail(f"Error de red al crear usuario de prueba para eliminar: {e}")
 
@@ -584,50 +1252,41 @@ def user_id_to_delete(admin_token):
 
     return created_user["id"]
 
+
 @pytest.fixture
-def new_user_data():
+def user_id_to_delete(resource_resolver):
     """
-    Fixture que genera un diccionario con datos únicos para crear un nuevo usuario.
-    Devuelve un diccionario con 'email', 'password', 'full_name' y 'role'.
+    Fixture que crea un usuario de prueba específico para ser eliminado.
+    Devuelve el ID del usuario creado.
     """
-    # Generar un email único
-    timestamp = str(int(time.time()))[-5:]
-    random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=3))
-    test_email = f"new_user_{timestamp}_{random_suffix}@test.com"
-    test_password = "SecureNewPass123!"
-    full_name = f"New User {timestamp}"
-
-    # Especificar un rol
-    role = "passenger"
+    return resource_resolver.get("user_id_to_delete")
 
-    user_data = {
-        "email": test_email,
-        "password": test_password,
-        "full_name": full_name,
-        "role": role
-    }
-
-    return user_data
 
 @pytest.fixture
-def payment_id(user_token, booking_id):
+def new_user_data():
     """
-    Fixture que crea un pago de prueba y devuelve su ID.
-    Requiere las fixtures 'user_token' y 'test_booking_id'.
+    Fixture que genera un diccionario con datos únicos para crear un nuevo usuario.
+    Devuelve un diccionario con 'email', 'password', 'full_name' y 'role'.
     """
+    return user_payload("new_user", "SecureNewPass123!", "New User", role="passenger")
+
+@RESOURCE_GRAPH.node("payment_id", deps=("user_token", "booking_id"))
+def _provide_payment_id(ctx):
+    if ctx.resource_pool.available("payments"):
+        user_token = ctx.need("user_token")
+        pooled_id = ctx.resource_pool.take("payments", token=user_token)
+        if pooled_id:
+            return pooled_id
+
+    user_token, booking_id_to_pay = ctx.need("user_token", "booking_id")
     headers = {"Authorization": f"Bearer {user_token}"}
-    booking_id_to_pay = booking_id
 
     # 1. Preparar datos para el nuevo pago.
-    new_payment_data = {
-        "booking_id": booking_id_to_pay,
-        "amount": 299.99,
-        "payment_method": "credit_card" # Método de pago de ejemplo
-    }
+    new_payment_data = payment_payload(booking_id_to_pay)
 
     # 2. Crear el pago
     try:
-        response = requests.post(f"{BASE_URL}/payments", json=new_payment_data, headers=headers)
+        response = ctx.api_client.post("/payments", json=new_payment_data, headers=headers)
     except requests.exceptions.RequestException as e:
          pytest.fail(f"Error de red al crear pago de prueba: {e}")
 
@@ -670,30 +1329,28 @@ def payment_id(user_token, booking_id):
 
 
 @pytest.fixture
-def aircraft_id_for_get(admin_token):
+def payment_id(resource_resolver):
     """
-    Fixture que crea una aeronave de prueba específica para la prueba de obtención por ID.
-    Recibe la fixture 'admin_token'.
-    Devuelve el ID de la aeronave creada.
+    Fixture que devuelve el ID de un pago de prueba del usuario autenticado ('user_token').
+    Se toma del pool aprovisionado; si está vacío, se paga una reserva de la fixture 'booking_id'.
     """
-    headers = {"Authorization": f"Bearer {admin_token}"}
+    return resource_resolver.get("payment_id")
+
 
-    # Generar un tail_number único
-    import random
-    import string
-    timestamp = str(int(time.time()))[-5:]
-    random_suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=3))
-    tail_number = f"N{timestamp}AG"  # Asegurar 6 caracteres
+@RESOURCE_GRAPH.node("aircraft_id_for_get", deps=("admin_token",))
+def _provide_aircraft_id_for_get(ctx):
+    pooled_id = ctx.resource_pool.take("aircraft")
+    if pooled_id:
+        return pooled_id
 
-    new_aircraft_data = {
-        "tail_number": tail_number,
-        "model": f"Test Model Get {timestamp}",
-        "capacity": 180
-    }
+    admin_token = ctx.need("admin_token")
+    headers = {"Authorization": f"Bearer {admin_token}"}
+    new_aircraft_data = aircraft_payload(capacity=180, model_prefix="Test Model Get")
+    tail_number = new_aircraft_data["tail_number"]
 
     # Crear la aeronave
     try:
-        response = requests.post(f"{BASE_URL}/aircrafts", json=new_aircraft_data, headers=headers)
+        response = ctx.api_client.post("/aircrafts", json=new_aircraft_data, headers=headers)
     except requests.exceptions.RequestException as e:
         pytest.fail(f"Error de red al crear aeronave de prueba para obtención: {e}")
 
@@ -731,31 +1388,42 @@ def aircraft_id_for_get(admin_token):
 
     return created_aircraft["id"]
 
+
 @pytest.fixture
-def create_test_booking_for_listing(user_token, admin_token, aircraft_id):
+def aircraft_id_for_get(resource_resolver):
     """
-    Crea una reserva de prueba para luego listarla.
-    Requiere 'user_token', 'admin_token' y 'aircraft_id' de las fixtures.
-    Devuelve el ID de la reserva creada.
+    Fixture que devuelve una aeronave de prueba para la prueba de obtención por ID.
+    La prueba sólo la lee, así que se toma del pool compartible; si está vacío se crea una.
+    Recibe la fixture 'admin_token'.
     """
+    return resource_resolver.get("aircraft_id_for_get")
+
+
+@RESOURCE_GRAPH.node("create_test_booking_for_listing", deps=("user_token", "admin_token", "aircraft_id"))
+def _provide_create_test_booking_for_listing(ctx):
+    if ctx.resource_pool.available("bookings"):
+        user_token = ctx.need("user_token")
+        pooled_id = ctx.resource_pool.take("bookings", token=user_token)
+        if pooled_id:
+            return pooled_id
+
+    # Tokens y avión se resuelven en paralelo
+    user_token, admin_token, aircraft_id = ctx.need("user_token", "admin_token", "aircraft_id")
     user_headers = {"Authorization": f"Bearer {user_token}"}
     admin_headers = {"Authorization": f"Bearer {admin_token}"}
 
     # 1. Crear un vuelo de prueba usando el avión proporcionado por la fixture
-    future_time = datetime.now(timezone.utc) + timedelta(hours=12)
-    arrival_time = future_time + timedelta(hours=13)
-
-    new_flight_data = {
-        "origin": "MAD",  # Código IATA válido
-        "destination": "FCO",  # Código IATA válido
-        "departure_time": future_time.isoformat(),
-        "arrival_time": arrival_time.isoformat(),
-        "base_price": 399.99,
-        "aircraft_id": aircraft_id  # ID del avión viene del fixture
-    }
+    new_flight_data = flight_payload(
+        aircraft_id,
+        origin="MAD",  # Código IATA válido
+        destination="FCO",  # Código IATA válido
+        departs_in=timedelta(hours=12),
+        duration=timedelta(hours=13),
+        base_price=399.99,
+    )
 
     # Crear el vuelo
-    create_flight_response = requests.post(f"{BASE_URL}/flights", json=new_flight_data, headers=admin_headers)
+    create_flight_response = ctx.api_client.post("/flights", json=new_flight_data, headers=admin_headers)
 
     # Manejar errores comunes durante la creación del vuelo
     if create_flight_response.status_code == 500:
@@ -788,18 +1456,10 @@ def create_test_booking_for_listing(user_token, admin_token, aircraft_id):
     flight_id = created_flight["id"]
 
     # 2. Preparar datos para la nueva reserva.
-    new_booking_data = {
-        "flight_id": flight_id,
-        "passengers": [
-            {
-                "full_name": "Pasajero Para Listar",
-                "passport": "P11111111"
-            }
-        ]
-    }
+    new_booking_data = booking_payload(flight_id, [{"full_name": "Pasajero Para Listar", "passport": "P11111111"}])
 
     # 3. Crear la reserva
-    create_booking_response = requests.post(f"{BASE_URL}/bookings", json=new_booking_data, headers=user_headers)
+    create_booking_response = ctx.api_client.post("/bookings", json=new_booking_data, headers=user_headers)
 
     # Manejar errores comunes durante la creación de la reserva
     if create_booking_response.status_code == 500:
@@ -829,4 +1489,16 @@ def create_test_booking_for_listing(user_token, admin_token, aircraft_id):
 
     created_booking = create_booking_response.json()
     assert "id" in created_booking, "Falta 'id' en la respuesta de la reserva creada."
-    return created_booking["id"]
\ No newline at end of file
+    return created_booking["id"]
+
+
+@pytest.fixture
+def create_test_booking_for_listing(resource_resolver):
+    """
+    Devuelve una reserva de prueba del usuario ('user_token') para luego listarla.
+    Se toma del pool aprovisionado; si está vacío, se crean un vuelo (sobre 'aircraft_id') y la reserva.
+    """
+    return resource_resolver.get("create_test_booking_for_listing")
+
+
+RESOURCE_GRAPH.validate()
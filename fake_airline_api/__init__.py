@@ -0,0 +1,18 @@
+"""
+Sustituto local, en memoria, de la API de aerolínea (https://cf-automation-airline-api.onrender.com).
+
+Implementa los endpoints que ejercita api_tests/ para poder correr la suite sin red y
+en segundos. Ver README, sección "Ejecutar pruebas de API".
+"""
+from .faults import SIMULATED_FAULTS, FaultInjector, FaultRule
+from .server import FakeAirlineApi
+from .store import AirlineStore, ApiError
+
+__all__ = [
+    "AirlineStore",
+    "ApiError",
+    "FakeAirlineApi",
+    "FaultInjector",
+    "FaultRule",
+    "SIMULATED_FAULTS",
+]
@@ -0,0 +1,29 @@
+"""
+Levanta el servidor local de forma independiente:
+
+    python -m fake_airline_api --port 8000 --faults "flight_5xx:0.1"
+"""
+import argparse
+import os
+
+from .server import FakeAirlineApi
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API de aerolínea local en memoria.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--faults", default=os.getenv("FAKE_API_FAULTS", ""),
+                        help='Fallos simulados activos, p. ej. "flight_5xx:0.1,flight_timeout:0.05".')
+    args = parser.parse_args()
+
+    api = FakeAirlineApi(args.host, args.port, faults=args.faults)
+    print(f"✈️  API de aerolínea local escuchando en {api.url}")
+    try:
+        api.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Inyección de fallos del servidor local.
+
+La API real simula errores del servidor (signup que devuelve 500, "Simulated 5xx bug"
+y "Simulated timeout" al consultar vuelos...). Aquí cada fallo conocido es una regla
+con nombre que se puede activar con una probabilidad, ya sea para toda la ejecución
+(FAKE_API_FAULTS="flight_5xx:0.1,flight_timeout:0.05") o forzada durante una prueba
+con el marker 'fake_api_fault'.
+"""
+import random
+import re
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class FaultRule:
+    """Fallo que se devuelve en lugar de la respuesta normal de un endpoint."""
+    method: str
+    path: str
+    status: int
+    detail: str
+
+    def matches(self, method: str, path: str) -> bool:
+        return self.method == method and re.fullmatch(self.path, path) is not None
+
+
+# Fallos que simula la API real
+SIMULATED_FAULTS = {
+    "signup_500": FaultRule("POST", r"/auth/signup", 500, "Simulated 5xx bug: signup temporarily unavailable"),
+    "flight_5xx": FaultRule("GET", r"/flights/[^/]+", 500, "Simulated 5xx bug"),
+    "flight_timeout": FaultRule("GET", r"/flights/[^/]+", 504, "Simulated timeout"),
+    "create_500": FaultRule("POST", r"/(aircrafts|airports|users)", 500, "Simulated 5xx bug"),
+}
+
+
+class FaultInjector:
+    """
+    Decide, para cada petición, si se responde con alguno de los fallos activos.
+
+    Es seguro usarlo desde los hilos del servidor. Con 'seed' los fallos aleatorios
+    son reproducibles.
+    """
+
+    def __init__(self, spec: str = "", seed: Optional[int] = None):
+        self.active: Dict[str, float] = {}
+        self._forced: Dict[str, float] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.configure(spec)
+
+    def configure(self, spec: str):
+        """
+        Activa los fallos de una especificación "nombre[:probabilidad],...".
+        Sin probabilidad el fallo se produce siempre.
+        """
+        for item in filter(None, (part.strip() for part in (spec or "").split(","))):
+            name, _, rate = item.partition(":")
+            self.activate(name, float(rate) if rate else 1.0)
+
+    def activate(self, name: str, rate: float = 1.0):
+        if name not in SIMULATED_FAULTS:
+            raise ValueError(f"Fallo desconocido '{name}'. Disponibles: {sorted(SIMULATED_FAULTS)}.")
+        with self._lock:
+            self.active[name] = rate
+
+    @contextmanager
+    def forced(self, *names: str):
+        """Fuerza los fallos indicados mientras dure el bloque."""
+        for name in names:
+            if name not in SIMULATED_FAULTS:
+                raise ValueError(f"Fallo desconocido '{name}'. Disponibles: {sorted(SIMULATED_FAULTS)}.")
+        with self._lock:
+            previous = dict(self._forced)
+            self._forced.update({name: 1.0 for name in names})
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._forced = previous
+
+    def check(self, method: str, path: str) -> Optional[Tuple[int, dict]]:
+        """Devuelve (status, cuerpo) del fallo a inyectar, o None para responder con normalidad."""
+        with self._lock:
+            candidates = {**self.active, **self._forced}
+            for name, rate in candidates.items():
+                rule = SIMULATED_FAULTS[name]
+                if rule.matches(method, path) and self._random.random() < rate:
+                    return rule.status, {"detail": rule.detail}
+        return None
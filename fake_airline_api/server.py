@@ -0,0 +1,322 @@
+"""
+Servidor HTTP local que sustituye a la API de aerolínea en las pruebas.
+
+Corre en un hilo del mismo proceso (uno por worker de xdist) sobre 127.0.0.1 con
+conexiones keep-alive: sin red ni cold starts, cada petición tarda del orden de un
+milisegundo.
+Se activa con API_BASE_URL=local o --api-base-url=local.
+"""
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .faults import FaultInjector
+from .store import AirlineStore, ApiError
+
+ROOT_MESSAGE = "Airline API up & running"
+
+# (método, ruta, handler). Los handlers reciben (api, request, *grupos de la ruta)
+ROUTES: List[Tuple[str, re.Pattern, Callable]] = []
+
+
+def route(method: str, pattern: str):
+    def decorator(func):
+        ROUTES.append((method, re.compile(pattern), func))
+        return func
+    return decorator
+
+
+class Request:
+    """Datos de la petición que necesitan los handlers."""
+
+    def __init__(self, method: str, path: str, query: dict, headers, body: bytes):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+    def json(self):
+        try:
+            return json.loads(self.body or b"null")
+        except ValueError:
+            raise ApiError(422, [{"loc": ["body"], "msg": "JSON decode error", "type": "json_invalid"}])
+
+    def form(self) -> dict:
+        return {key: values[0] for key, values in parse_qs(self.body.decode()).items()}
+
+    @property
+    def authorization(self) -> Optional[str]:
+        return self.headers.get("Authorization")
+
+
+# --- Endpoints ---
+
+@route("GET", r"/")
+def root(api, request):
+    return 200, {"msg": ROOT_MESSAGE}
+
+
+@route("POST", r"/auth/signup")
+def signup(api, request):
+    return 201, api.store.create_user(request.json())
+
+
+@route("POST", r"/auth/login")
+def login(api, request):
+    form = request.form()
+    if "username" not in form or "password" not in form:
+        raise ApiError(422, [{"loc": ["body", "username"], "msg": "Field required", "type": "missing"}])
+    return 200, api.store.login(form["username"], form["password"])
+
+
+@route("GET", r"/users")
+def list_users(api, request):
+    api.store.authenticate(request.authorization)
+    return 200, api.store.list_users()
+
+
+@route("POST", r"/users")
+def create_user(api, request):
+    api.store.authenticate(request.authorization, admin=True)
+    return 201, api.store.create_user(request.json(), allow_role=True)
+
+
+@route("GET", r"/users/me")
+def my_profile(api, request):
+    return 200, dict(api.store.authenticate(request.authorization))
+
+
+@route("PUT", r"/users/([^/]+)")
+def update_user(api, request, user_id):
+    api.store.authenticate(request.authorization, admin=True)
+    return 200, api.store.update_user(user_id, request.json())
+
+
+@route("DELETE", r"/users/([^/]+)")
+def delete_user(api, request, user_id):
+    api.store.authenticate(request.authorization, admin=True)
+    api.store.delete_user(user_id)
+    return 204, None
+
+
+@route("GET", r"/airports")
+def list_airports(api, request):
+    return 200, api.store.list_airports()
+
+
+@route("POST", r"/airports")
+def create_airport(api, request):
+    api.store.authenticate(request.authorization, admin=True)
+    return 201, api.store.create_airport(request.json())
+
+
+@route("GET", r"/airports/([^/]+)")
+def get_airport(api, request, iata_code):
+    return 200, api.store.get_airport(iata_code)
+
+
+@route("PUT", r"/airports/([^/]+)")
+def update_airport(api, request, iata_code):
+    api.store.authenticate(request.authorization, admin=True)
+    return 200, api.store.update_airport(iata_code, request.json())
+
+
+@route("DELETE", r"/airports/([^/]+)")
+def delete_airport(api, request, iata_code):
+    api.store.authenticate(request.authorization, admin=True)
+    api.store.delete_airport(iata_code)
+    return 204, None
+
+
+@route("GET", r"/aircrafts")
+def list_aircrafts(api, request):
+    api.store.authenticate(request.authorization, admin=True)
+    return 200, api.store.list_aircrafts()
+
+
+@route("POST", r"/aircrafts")
+def create_aircraft(api, request):
+    api.store.authenticate(request.authorization, admin=True)
+    return 201, api.store.create_aircraft(request.json())
+
+
+@route("GET", r"/aircrafts/([^/]+)")
+def get_aircraft(api, request, aircraft_id):
+    api.store.authenticate(request.authorization, admin=True)
+    return 200, api.store.get_aircraft(aircraft_id)
+
+
+@route("GET", r"/flights")
+def list_flights(api, request):
+    return 200, api.store.list_flights(request.query.get("origin"), request.query.get("destination"))
+
+
+@route("POST", r"/flights")
+def create_flight(api, request):
+    api.store.authenticate(request.authorization, admin=True)
+    return 201, api.store.create_flight(request.json())
+
+
+@route("GET", r"/flights/([^/]+)")
+def get_flight(api, request, flight_id):
+    return 200, api.store.get_flight(flight_id)
+
+
+@route("PUT", r"/flights/([^/]+)")
+def update_flight(api, request, flight_id):
+    api.store.authenticate(request.authorization, admin=True)
+    return 200, api.store.update_flight(flight_id, request.json())
+
+
+@route("DELETE", r"/flights/([^/]+)")
+def delete_flight(api, request, flight_id):
+    api.store.authenticate(request.authorization, admin=True)
+    api.store.delete_flight(flight_id)
+    return 204, None
+
+
+@route("GET", r"/bookings")
+def list_bookings(api, request):
+    return 200, api.store.list_bookings(api.store.authenticate(request.authorization))
+
+
+@route("POST", r"/bookings")
+def create_booking(api, request):
+    user = api.store.authenticate(request.authorization)
+    return 201, api.store.create_booking(user, request.json())
+
+
+@route("GET", r"/bookings/([^/]+)")
+def get_booking(api, request, booking_id):
+    return 200, api.store.get_booking(api.store.authenticate(request.authorization), booking_id)
+
+
+@route("PATCH", r"/bookings/([^/]+)")
+def update_booking_status(api, request, booking_id):
+    user = api.store.authenticate(request.authorization)
+    return 200, api.store.update_booking_status(user, booking_id, request.json())
+
+
+@route("DELETE", r"/bookings/([^/]+)")
+def cancel_booking(api, request, booking_id):
+    api.store.cancel_booking(api.store.authenticate(request.authorization), booking_id)
+    return 204, None
+
+
+@route("POST", r"/payments")
+def create_payment(api, request):
+    user = api.store.authenticate(request.authorization)
+    return 201, api.store.create_payment(user, request.json())
+
+
+@route("GET", r"/payments/([^/]+)")
+def get_payment(api, request, payment_id):
+    return 200, api.store.get_payment(api.store.authenticate(request.authorization), payment_id)
+
+
+@route("GET", r"/glitch-examples/client-error")
+def client_error(api, request):
+    raise ApiError(400, "Simulated client error: bad request")
+
+
+@route("GET", r"/glitch-examples/success-but-error")
+def success_but_error(api, request):
+    return 200, {"error": "Simulated error inside a 200 OK response"}
+
+
+# --- Servidor ---
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Sin Nagle: las respuestas pequeñas salen de inmediato por loopback
+    disable_nagle_algorithm = True
+    server_version = "FakeAirlineAPI/1.0"
+
+    def _dispatch(self):
+        split = urlsplit(self.path)
+        # La API acepta las rutas con y sin barra final ("/users/" y "/users")
+        path = split.path.rstrip("/") or "/"
+        length = int(self.headers.get("Content-Length") or 0)
+        request = Request(self.command, path, {k: v[0] for k, v in parse_qs(split.query).items()},
+                          self.headers, self.rfile.read(length) if length else b"")
+        api = self.server.api
+
+        status, body = self._handle(api, request)
+        payload = b"" if body is None else json.dumps(body).encode()
+        self.send_response(status)
+        if body is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _handle(self, api, request):
+        fault = api.faults.check(request.method, request.path)
+        if fault is not None:
+            return fault
+        allowed = False
+        for method, pattern, handler in ROUTES:
+            match = pattern.fullmatch(request.path)
+            if match is None:
+                continue
+            if method != request.method:
+                allowed = True
+                continue
+            try:
+                return handler(api, request, *match.groups())
+            except ApiError as e:
+                return e.status, {"detail": e.detail}
+        if allowed:
+            return 405, {"detail": "Method Not Allowed"}
+        return 404, {"detail": "Not Found"}
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+    def log_message(self, format, *args):
+        # Silencioso: el cliente de las pruebas ya registra cada petición
+        pass
+
+
+class FakeAirlineApi:
+    """
+    API de aerolínea en memoria servida desde un hilo del proceso actual.
+
+    Uso:
+        api = FakeAirlineApi(faults="flight_5xx:0.1").start()
+        client = ApiClient(api.url)
+        ...
+        api.stop()
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, faults: str = "", seed: Optional[int] = None):
+        self.store = AirlineStore()
+        self.faults = FaultInjector(faults, seed=seed)
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._server.daemon_threads = True
+        self._server.api = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeAirlineApi":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-airline-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self):
+        """Sirve en el hilo actual (lo usa 'python -m fake_airline_api')."""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
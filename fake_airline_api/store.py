@@ -0,0 +1,346 @@
+"""
+Almacenamiento en memoria y reglas de negocio del servidor local.
+
+Reproduce el contrato que ejercitan las pruebas de api_tests/: códigos de estado,
+campos de cada recurso y mensajes de error ('detail') de la API real. Los errores de
+validación usan el formato de FastAPI: {"detail": [{"loc": [...], "msg": ..., "type": ...}]}.
+"""
+import re
+import threading
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .tokens import DEFAULT_SECRET, decode_token, issue_token
+
+ADMIN_EMAIL = "admin@demo.com"
+ADMIN_PASSWORD = "admin123"
+
+# Aeropuertos precargados (la búsqueda y el listado esperan que exista al menos uno)
+SEED_AIRPORTS = [
+    ("MEX", "Mexico City", "Mexico"),
+    ("BCN", "Barcelona", "Spain"),
+    ("MAD", "Madrid", "Spain"),
+    ("FCO", "Rome", "Italy"),
+    ("NYC", "New York", "United States"),
+    ("LAX", "Los Angeles", "United States"),
+    ("LON", "London", "United Kingdom"),
+    ("DXB", "Dubai", "United Arab Emirates"),
+    ("SIN", "Singapore", "Singapore"),
+]
+
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+IATA_PATTERN = re.compile(r"^[A-Z]{3}$")
+BOOKING_STATUSES = ("draft", "paid", "checked_in", "cancelled")
+
+
+class ApiError(Exception):
+    """Error que el servidor devuelve como {"detail": ...} con el status indicado."""
+
+    def __init__(self, status: int, detail):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+def _validation_error(field: str, msg: str, error_type: str = "value_error") -> ApiError:
+    return ApiError(422, [{"loc": ["body", field], "msg": msg, "type": error_type}])
+
+
+def _require(body: dict, schema: Dict[str, tuple]) -> dict:
+    """
+    Valida que 'body' traiga los campos de 'schema' ({campo: tipos}) con el tipo correcto.
+    """
+    if not isinstance(body, dict):
+        raise ApiError(422, [{"loc": ["body"], "msg": "Input should be a valid dictionary", "type": "dict_type"}])
+    for field, types in schema.items():
+        if field not in body:
+            raise _validation_error(field, "Field required", "missing")
+        if not isinstance(body[field], types) or isinstance(body[field], bool):
+            raise _validation_error(field, f"Input should be of type {types[0].__name__}", "type_error")
+    return body
+
+
+def _require_datetime(body: dict, field: str) -> str:
+    try:
+        datetime.fromisoformat(body[field].replace("Z", "+00:00"))
+    except ValueError:
+        raise _validation_error(field, "Input should be a valid datetime", "datetime_parsing")
+    return body[field]
+
+
+class AirlineStore:
+    """Usuarios, aeropuertos, aeronaves, vuelos, reservas y pagos en memoria."""
+
+    def __init__(self, secret: str = DEFAULT_SECRET):
+        self.secret = secret
+        self.users: Dict[str, dict] = {}
+        self.passwords: Dict[str, str] = {}
+        self.airports: Dict[str, dict] = {}
+        self.aircrafts: Dict[str, dict] = {}
+        self.flights: Dict[str, dict] = {}
+        self.bookings: Dict[str, dict] = {}
+        self.payments: Dict[str, dict] = {}
+        self._lock = threading.RLock()
+        self._add_user(ADMIN_EMAIL, ADMIN_PASSWORD, "Admin", "admin")
+        for iata_code, city, country in SEED_AIRPORTS:
+            self.airports[iata_code] = {"id": str(uuid.uuid4()), "iata_code": iata_code, "city": city,
+                                        "country": country}
+
+    # --- Autenticación ---
+
+    def login(self, username: str, password: str) -> dict:
+        with self._lock:
+            user = next((u for u in self.users.values() if u["email"] == username), None)
+            if user is None or self.passwords[user["id"]] != password:
+                raise ApiError(401, "Incorrect username or password")
+            return {"access_token": issue_token(user["id"], user["role"], self.secret), "token_type": "bearer"}
+
+    def authenticate(self, authorization: Optional[str], admin: bool = False) -> dict:
+        """Usuario dueño del header 'Authorization: Bearer <token>'."""
+        if not authorization or not authorization.startswith("Bearer "):
+            raise ApiError(401, "Not authenticated")
+        claims = decode_token(authorization[len("Bearer "):], self.secret)
+        user = self.users.get(claims["sub"]) if claims else None
+        if user is None:
+            raise ApiError(401, "Could not validate credentials")
+        if admin and user["role"] != "admin":
+            raise ApiError(403, "Not enough permissions")
+        return user
+
+    # --- Usuarios ---
+
+    def _add_user(self, email: str, password: str, full_name: str, role: str) -> dict:
+        user = {"id": str(uuid.uuid4()), "email": email, "full_name": full_name, "role": role}
+        self.users[user["id"]] = user
+        self.passwords[user["id"]] = password
+        return user
+
+    def create_user(self, body: dict, allow_role: bool = False) -> dict:
+        _require(body, {"email": (str,), "password": (str,), "full_name": (str,)})
+        if not EMAIL_PATTERN.match(body["email"]):
+            raise _validation_error("email", "value is not a valid email address: An email address must have an @-sign.")
+        role = body.get("role", "passenger") if allow_role else "passenger"
+        if role not in ("passenger", "admin"):
+            raise _validation_error("role", "Input should be 'passenger' or 'admin'", "enum")
+        with self._lock:
+            if any(u["email"] == body["email"] for u in self.users.values()):
+                raise ApiError(400, "Email already registered")
+            return dict(self._add_user(body["email"], body["password"], body["full_name"], role))
+
+    def list_users(self) -> List[dict]:
+        with self._lock:
+            return [dict(u) for u in self.users.values()]
+
+    def update_user(self, user_id: str, body: dict) -> dict:
+        _require(body, {"email": (str,), "password": (str,), "full_name": (str,)})
+        with self._lock:
+            user = self._get(self.users, user_id, "User not found")
+            if any(u["email"] == body["email"] and u["id"] != user_id for u in self.users.values()):
+                raise ApiError(400, "Email already registered")
+            user.update(email=body["email"], full_name=body["full_name"])
+            self.passwords[user_id] = body["password"]
+            return dict(user)
+
+    def delete_user(self, user_id: str):
+        with self._lock:
+            self._get(self.users, user_id, "User not found")
+            del self.users[user_id]
+            del self.passwords[user_id]
+
+    # --- Aeropuertos ---
+
+    def create_airport(self, body: dict) -> dict:
+        _require(body, {"iata_code": (str,), "city": (str,), "country": (str,)})
+        if not IATA_PATTERN.match(body["iata_code"]):
+            raise _validation_error("iata_code", "String should match pattern '^[A-Z]{3}$'", "string_pattern_mismatch")
+        with self._lock:
+            if body["iata_code"] in self.airports:
+                raise ApiError(400, "Airport already exists")
+            # Forma AirportOut del contrato (docs/Schemas.docx), con su id
+            airport = {"id": str(uuid.uuid4()), "iata_code": body["iata_code"], "city": body["city"],
+                       "country": body["country"]}
+            self.airports[airport["iata_code"]] = airport
+            return dict(airport)
+
+    def list_airports(self) -> List[dict]:
+        with self._lock:
+            return [dict(a) for a in self.airports.values()]
+
+    def get_airport(self, iata_code: str) -> dict:
+        with self._lock:
+            return dict(self._get(self.airports, iata_code, "Airport not found"))
+
+    def update_airport(self, iata_code: str, body: dict) -> dict:
+        _require(body, {"city": (str,), "country": (str,)})
+        with self._lock:
+            airport = self._get(self.airports, iata_code, "Airport not found")
+            airport.update(city=body["city"], country=body["country"])
+            return dict(airport)
+
+    def delete_airport(self, iata_code: str):
+        with self._lock:
+            self._get(self.airports, iata_code, "Airport not found")
+            del self.airports[iata_code]
+
+    # --- Aeronaves ---
+
+    def create_aircraft(self, body: dict) -> dict:
+        _require(body, {"tail_number": (str,), "model": (str,), "capacity": (int,)})
+        if body["capacity"] <= 0:
+            raise _validation_error("capacity", "Input should be greater than 0", "greater_than")
+        with self._lock:
+            if any(a["tail_number"] == body["tail_number"] for a in self.aircrafts.values()):
+                raise ApiError(400, "Tail number already exists")
+            aircraft = {"id": str(uuid.uuid4()), "tail_number": body["tail_number"],
+                        "model": body["model"], "capacity": body["capacity"]}
+            self.aircrafts[aircraft["id"]] = aircraft
+            return dict(aircraft)
+
+    def list_aircrafts(self) -> List[dict]:
+        with self._lock:
+            return [dict(a) for a in self.aircrafts.values()]
+
+    def get_aircraft(self, aircraft_id: str) -> dict:
+        with self._lock:
+            return dict(self._get(self.aircrafts, aircraft_id, "Aircraft not found"))
+
+    # --- Vuelos ---
+
+    def _flight_fields(self, body: dict) -> dict:
+        _require(body, {"origin": (str,), "destination": (str,), "departure_time": (str,),
+                        "arrival_time": (str,), "base_price": (int, float), "aircraft_id": (str,)})
+        for field in ("origin", "destination"):
+            if not IATA_PATTERN.match(body[field]):
+                raise _validation_error(field, "String should match pattern '^[A-Z]{3}$'", "string_pattern_mismatch")
+        return {
+            "origin": body["origin"],
+            "destination": body["destination"],
+            "departure_time": _require_datetime(body, "departure_time"),
+            "arrival_time": _require_datetime(body, "arrival_time"),
+            "base_price": body["base_price"],
+            "aircraft_id": body["aircraft_id"],
+        }
+
+    def create_flight(self, body: dict) -> dict:
+        fields = self._flight_fields(body)
+        with self._lock:
+            aircraft = self._get(self.aircrafts, fields["aircraft_id"], "Aircraft not found")
+            flight = {"id": str(uuid.uuid4()), **fields, "available_seats": aircraft["capacity"]}
+            self.flights[flight["id"]] = flight
+            return dict(flight)
+
+    def list_flights(self, origin: Optional[str] = None, destination: Optional[str] = None) -> List[dict]:
+        with self._lock:
+            return [dict(f) for f in self.flights.values()
+                    if (not origin or f["origin"] == origin) and (not destination or f["destination"] == destination)]
+
+    def get_flight(self, flight_id: str) -> dict:
+        with self._lock:
+            return dict(self._get(self.flights, flight_id, "Flight not found"))
+
+    def update_flight(self, flight_id: str, body: dict) -> dict:
+        fields = self._flight_fields(body)
+        with self._lock:
+            flight = self._get(self.flights, flight_id, "Flight not found")
+            self._get(self.aircrafts, fields["aircraft_id"], "Aircraft not found")
+            flight.update(fields)
+            return dict(flight)
+
+    def delete_flight(self, flight_id: str):
+        with self._lock:
+            self._get(self.flights, flight_id, "Flight not found")
+            del self.flights[flight_id]
+
+    # --- Reservas ---
+
+    def create_booking(self, user: dict, body: dict) -> dict:
+        _require(body, {"flight_id": (str,), "passengers": (list,)})
+        passengers = []
+        for index, passenger in enumerate(body["passengers"]):
+            if not isinstance(passenger, dict) or not all(isinstance(passenger.get(k), str)
+                                                          for k in ("full_name", "passport")):
+                raise _validation_error(f"passengers.{index}", "full_name and passport are required", "missing")
+            passengers.append({"full_name": passenger["full_name"], "passport": passenger["passport"],
+                               "seat": passenger.get("seat")})
+        if not passengers:
+            raise _validation_error("passengers", "List should have at least 1 item", "too_short")
+        with self._lock:
+            flight = self._get(self.flights, body["flight_id"], "Flight not found")
+            if flight["available_seats"] < len(passengers):
+                raise ApiError(400, "Not enough seats available")
+            flight["available_seats"] -= len(passengers)
+            booking = {"id": str(uuid.uuid4()), "flight_id": flight["id"], "user_id": user["id"],
+                       "status": "draft", "passengers": passengers}
+            self.bookings[booking["id"]] = booking
+            return self._copy_booking(booking)
+
+    def list_bookings(self, user: dict) -> List[dict]:
+        with self._lock:
+            return [self._copy_booking(b) for b in self.bookings.values()
+                    if user["role"] == "admin" or b["user_id"] == user["id"]]
+
+    def get_booking(self, user: dict, booking_id: str) -> dict:
+        with self._lock:
+            return self._copy_booking(self._owned_booking(user, booking_id))
+
+    def update_booking_status(self, user: dict, booking_id: str, body: dict) -> dict:
+        _require(body, {"status": (str,)})
+        if body["status"] not in BOOKING_STATUSES:
+            raise _validation_error("status", f"Input should be one of {list(BOOKING_STATUSES)}", "enum")
+        with self._lock:
+            booking = self._owned_booking(user, booking_id)
+            booking["status"] = body["status"]
+            return self._copy_booking(booking)
+
+    def cancel_booking(self, user: dict, booking_id: str):
+        with self._lock:
+            booking = self._owned_booking(user, booking_id)
+            if booking["status"] != "cancelled":
+                flight = self.flights.get(booking["flight_id"])
+                if flight is not None:
+                    flight["available_seats"] += len(booking["passengers"])
+            booking["status"] = "cancelled"
+
+    def _owned_booking(self, user: dict, booking_id: str) -> dict:
+        booking = self._get(self.bookings, booking_id, "Booking not found")
+        if user["role"] != "admin" and booking["user_id"] != user["id"]:
+            raise ApiError(403, "Not allowed to access this booking")
+        return booking
+
+    @staticmethod
+    def _copy_booking(booking: dict) -> dict:
+        return {**booking, "passengers": [dict(p) for p in booking["passengers"]]}
+
+    # --- Pagos ---
+
+    def create_payment(self, user: dict, body: dict) -> dict:
+        _require(body, {"booking_id": (str,), "amount": (int, float), "payment_method": (str,)})
+        if body["amount"] <= 0:
+            raise _validation_error("amount", "Input should be greater than 0", "greater_than")
+        with self._lock:
+            booking = self._owned_booking(user, body["booking_id"])
+            if booking["status"] == "cancelled":
+                raise ApiError(400, "Booking is cancelled")
+            payment = {"id": str(uuid.uuid4()), "booking_id": booking["id"], "status": "success",
+                       "amount": body["amount"], "payment_method": body["payment_method"]}
+            self.payments[payment["id"]] = payment
+            booking["status"] = "paid"
+            return dict(payment)
+
+    def get_payment(self, user: dict, payment_id: str) -> dict:
+        with self._lock:
+            payment = self._get(self.payments, payment_id, "Payment not found")
+            booking = self.bookings.get(payment["booking_id"])
+            if user["role"] != "admin" and (booking is None or booking["user_id"] != user["id"]):
+                raise ApiError(403, "Not allowed to access this payment")
+            return dict(payment)
+
+    # --- Utilidades ---
+
+    @staticmethod
+    def _get(collection: dict, key: str, detail: str) -> dict:
+        item = collection.get(key)
+        if item is None:
+            raise ApiError(404, detail)
+        return item
@@ -0,0 +1,56 @@
+"""
+Emisión y verificación de tokens JWT (HS256) del servidor local.
+
+Sólo usa la librería estándar. Los tokens llevan los claims 'sub' (ID del usuario),
+'role' y 'exp', igual que los de la API real, de modo que el TokenBroker de las
+pruebas puede leer su vigencia.
+"""
+import base64
+import hashlib
+import hmac
+import json
+import time
+from typing import Optional
+
+DEFAULT_SECRET = "fake-airline-api-secret"
+# Vigencia de los tokens emitidos (segundos)
+DEFAULT_EXPIRES_IN = 30 * 60
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def encode_token(claims: dict, secret: str = DEFAULT_SECRET) -> str:
+    header = _b64encode(json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode())
+    payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+    signature = hmac.new(secret.encode(), f"{header}.{payload}".encode(), hashlib.sha256).digest()
+    return f"{header}.{payload}.{_b64encode(signature)}"
+
+
+def issue_token(user_id: str, role: str, secret: str = DEFAULT_SECRET,
+                expires_in: int = DEFAULT_EXPIRES_IN) -> str:
+    """Token de acceso para el usuario indicado."""
+    return encode_token({"sub": user_id, "role": role, "exp": int(time.time()) + expires_in}, secret)
+
+
+def decode_token(token: str, secret: str = DEFAULT_SECRET) -> Optional[dict]:
+    """
+    Devuelve los claims del token o None si la firma no es válida, está mal formado
+    o ya expiró.
+    """
+    try:
+        header, payload, signature = token.split(".")
+        expected = hmac.new(secret.encode(), f"{header}.{payload}".encode(), hashlib.sha256).digest()
+        if not hmac.compare_digest(expected, _b64decode(signature)):
+            return None
+        claims = json.loads(_b64decode(payload))
+    except (ValueError, TypeError):
+        return None
+    if claims.get("exp", 0) < time.time():
+        return None
+    return claims
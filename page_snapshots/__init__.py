@@ -0,0 +1,28 @@
+"""
+Snapshots del DOM de ShopHub y Fake Cinema para revisar los Page Objects sin las aplicaciones.
+
+capture_pages guarda el DOM renderizado de las páginas clave recorriéndolas con los Page
+Objects; SnapshotServer los replica desde un servidor local; check_locators cuenta, en
+cada snapshot, los elementos que encuentra cada localizador declarado en los Page
+Objects, y check_seat_states comprueba que seat_map reconozca los asientos seleccionados
+de la sala. Ver README, sección "Revisar los localizadores sin las aplicaciones".
+"""
+from .capture import DEFAULT_SNAPSHOTS_DIR, PAGES, SnapshotWriter, capture_pages
+from .locators import (LocatorCheck, available_snapshots, broken, check_locators, check_seat_states,
+                       declared_locators, seat_states_problem)
+from .server import SnapshotServer
+
+__all__ = [
+    "DEFAULT_SNAPSHOTS_DIR",
+    "LocatorCheck",
+    "PAGES",
+    "SnapshotServer",
+    "SnapshotWriter",
+    "available_snapshots",
+    "broken",
+    "capture_pages",
+    "check_locators",
+    "check_seat_states",
+    "declared_locators",
+    "seat_states_problem",
+]
@@ -0,0 +1,84 @@
+"""
+Captura, replica y revisa los snapshots de las páginas:
+
+    python -m page_snapshots capture [--app shophub|cinema]   # recorre las aplicaciones reales
+    python -m page_snapshots serve --port 8100                 # sirve los snapshots guardados
+    python -m page_snapshots check                             # revisa los localizadores de los Page Objects
+
+'capture' y 'check' lanzan un navegador headless (BROWSER elige chrome, firefox o edge).
+'check' termina con código 1 si algún localizador no encuentra nada en sus snapshots o si
+seat_map no reconoce los asientos seleccionados en el snapshot de la sala.
+"""
+import argparse
+import sys
+
+from browser import create_managed_driver
+from pages import performance
+
+from .capture import CAPTURES, DEFAULT_SNAPSHOTS_DIR, capture_pages
+from .locators import available_snapshots, broken, check_locators, check_seat_states, seat_states_problem
+from .server import SnapshotServer
+
+
+def _check(directory) -> int:
+    if not available_snapshots(directory):
+        print(f"⚠️  No hay snapshots en {directory}: capturarlos con 'python -m page_snapshots capture'.")
+        return 1
+    server = SnapshotServer(directory).start()
+    driver = create_managed_driver()
+    try:
+        checks = check_locators(driver, server)
+        seat_states = check_seat_states(driver, server)
+    finally:
+        driver.quit()
+        server.stop()
+    for check in checks:
+        if check.skip_reason:
+            print(f"⏭️  {check.key}: {check.skip_reason}")
+        elif not check.checked:
+            print(f"➖ {check.key}: sin snapshots capturados de {', '.join(check.snapshots)}")
+        else:
+            counts = ", ".join(f"{snapshot}={count}" for snapshot, count in check.matches.items())
+            print(f"{'✅' if check.found and not check.invalid else '❌'} {check.key}: {counts}")
+    problem = seat_states_problem(seat_states) if seat_states is not None else None
+    if seat_states is not None:
+        print(f"{'❌' if problem else '✅'} seat_map en cinema/seat_grid: {problem or seat_states}")
+    failed = broken(checks)
+    print(f"\n{len(failed)} localizador(es) roto(s) de {sum(check.checked for check in checks)} revisados")
+    return 1 if failed or problem else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=("capture", "serve", "check"))
+    parser.add_argument("--dir", default=str(DEFAULT_SNAPSHOTS_DIR),
+                        help="Directorio de los snapshots (por defecto: PAGE_SNAPSHOTS_DIR o page_snapshots/html).")
+    parser.add_argument("--app", action="append", choices=list(CAPTURES), dest="apps",
+                        help="Aplicación a capturar. Repetible. Por defecto: todas.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        server = SnapshotServer(args.dir, args.host, args.port)
+        print(f"📂 Snapshots de {args.dir} en {server.url}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        return 0
+    if args.command == "check":
+        return _check(args.dir)
+
+    # Las métricas de carga no interesan al capturar
+    performance.enabled = False
+    driver = create_managed_driver()
+    try:
+        capture_pages(driver, args.apps, args.dir)
+    finally:
+        driver.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
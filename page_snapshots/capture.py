@@ -0,0 +1,143 @@
+"""
+Captura del DOM renderizado de las páginas clave de ShopHub y Fake Cinema.
+
+Cada página se alcanza con los propios Page Objects (el mismo camino que las pruebas)
+y, cuando queda quieta (waits.page_quiet), se guarda su DOM tal como lo dejó la
+aplicación: sin <script> (la réplica no debe volver a hidratarse ni pedir datos) y con
+las hojas de estilo del mismo origen copiadas en un <style>, para que la visibilidad de
+los elementos sea la de la aplicación real. Los archivos quedan en
+<directorio>/<app>/<página>.html y manifest.json registra URL, título y fecha de cada uno.
+"""
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from data import Products, Users
+from pages import waits
+from pages.fake_cinema.cinema_home_page import CinemaHomePage
+from pages.shophub.session import ShopHubSessions
+from pages.shophub.shophub_home_page import HomePage
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_SNAPSHOTS_DIR = Path(os.getenv("PAGE_SNAPSHOTS_DIR", ROOT_DIR / "page_snapshots" / "html"))
+MANIFEST = "manifest.json"
+
+# Páginas que se capturan, por aplicación (en el orden en que se recorren)
+PAGES: Dict[str, List[str]] = {
+    "shophub": ["home", "cart_empty", "category", "product", "cart"],
+    "cinema": ["home", "movie_detail", "seat_grid", "ticket_modal", "cart", "checkout"],
+}
+# Asientos seleccionados en el snapshot de la sala (los reconoce seat_map al revisarlo)
+SEAT_GRID_SELECTED = 2
+
+_SNAPSHOT_SCRIPT = """
+const clone = document.documentElement.cloneNode(true);
+const links = Array.from(document.querySelectorAll('link[rel="stylesheet"]'));
+const cloneLinks = Array.from(clone.querySelectorAll('link[rel="stylesheet"]'));
+const css = [];
+links.forEach((link, i) => {
+    try {
+        css.push(Array.from(link.sheet.cssRules).map(rule => rule.cssText).join('\\n'));
+        cloneLinks[i].remove();
+    } catch (e) {
+        // Hoja de otro origen (no legible): queda su <link>
+    }
+});
+clone.querySelectorAll('script, link[rel="preload"], link[rel="modulepreload"], link[rel="prefetch"]')
+    .forEach(e => e.remove());
+const style = document.createElement('style');
+style.setAttribute('data-snapshot', 'stylesheets');
+style.textContent = css.join('\\n');
+clone.querySelector('head').appendChild(style);
+return {url: location.href, title: document.title, html: '<!DOCTYPE html>\\n' + clone.outerHTML};
+"""
+
+
+def snapshot_html(driver) -> dict:
+    """DOM actual sin scripts y con los estilos incrustados: {url, title, html}."""
+    waits.page_quiet(driver)
+    return driver.execute_script(_SNAPSHOT_SCRIPT)
+
+
+class SnapshotWriter:
+    """Escribe los snapshots de una captura y su manifest."""
+
+    def __init__(self, directory: Path = DEFAULT_SNAPSHOTS_DIR):
+        self.directory = Path(directory)
+        manifest_path = self.directory / MANIFEST
+        try:
+            self.manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+        except (OSError, ValueError):
+            self.manifest = {}
+
+    def save(self, driver, app: str, page: str):
+        snapshot = snapshot_html(driver)
+        path = self.directory / app / f"{page}.html"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(snapshot["html"], encoding="utf-8")
+        self.manifest[f"{app}/{page}"] = {
+            "url": snapshot["url"],
+            "title": snapshot["title"],
+            "captured_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "bytes": path.stat().st_size,
+        }
+        (self.directory / MANIFEST).write_text(json.dumps(self.manifest, indent=2, sort_keys=True))
+        print(f"📸 {app}/{page}: {snapshot['url']} ({path.stat().st_size / 1024:.0f} KB)")
+
+
+def capture_shophub(driver, writer: SnapshotWriter):
+    """Inicio y carrito vacío sin sesión; categoría, producto y carrito con un producto, con sesión."""
+    home_page = HomePage(driver)
+    home_page.go_to()
+    writer.save(driver, "shophub", "home")
+    home_page.go_to_cart_robust()
+    writer.save(driver, "shophub", "cart_empty")
+
+    ShopHubSessions().login(driver, Users.Admin.EMAIL, Users.Admin.PASSWORD)
+    home_page.go_to()
+    home_page.click_categories_dropdown()
+    category_page = home_page.click_mens_category()
+    writer.save(driver, "shophub", "category")
+    product_page = category_page.find_and_click_product_by_name(Products.MensClothes.DENIM_JEANS)
+    writer.save(driver, "shophub", "product")
+    product_page.click_add_to_cart()
+    home_page.go_to_cart_robust()
+    writer.save(driver, "shophub", "cart")
+
+
+def capture_cinema(driver, writer: SnapshotWriter):
+    """Inicio, detalle de película, sala con asientos elegidos, modal de boletos, carrito y checkout."""
+    cinema_page = CinemaHomePage(driver)
+    cinema_page.go_to()
+    writer.save(driver, "cinema", "home")
+    cinema_page.navigate_to_movie_detail(cinema_page.JURASSIC_WORLD_DETAIL_BUTTON)
+    writer.save(driver, "cinema", "movie_detail")
+    cinema_page.select_first_available_time_resilient()
+    # Dos asientos y dos boletos (adulto y adulto mayor): el carrito y el resumen muestran ambas líneas
+    cinema_page.select_multiple_seats(count=SEAT_GRID_SELECTED)
+    writer.save(driver, "cinema", "seat_grid")
+    cinema_page.click_buy_tickets_button()
+    cinema_page.wait_for_ticket_modal()
+    writer.save(driver, "cinema", "ticket_modal")
+    cinema_page.select_adult_ticket(quantity=1)
+    cinema_page.select_senior_ticket(quantity=1)
+    cinema_page.confirm_tickets_selection()
+    writer.save(driver, "cinema", "cart")
+    cinema_page.click_proceed_to_checkout()
+    writer.save(driver, "cinema", "checkout")
+
+
+CAPTURES: Dict[str, Callable] = {
+    "shophub": capture_shophub,
+    "cinema": capture_cinema,
+}
+
+
+def capture_pages(driver, apps: Optional[List[str]] = None, directory: Path = DEFAULT_SNAPSHOTS_DIR) -> SnapshotWriter:
+    """Recorre las aplicaciones pedidas (todas por defecto) guardando sus snapshots."""
+    writer = SnapshotWriter(directory)
+    for app in apps or list(CAPTURES):
+        CAPTURES[app](driver, writer)
+    return writer
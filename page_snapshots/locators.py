@@ -0,0 +1,166 @@
+"""
+Verificación de los localizadores de los Page Objects contra los snapshots.
+
+Se revisan los localizadores declarados como atributos (By, valor) de cada Page Object
+(y de los módulos auxiliares como seat_map) en los snapshots de las páginas donde se
+usan. Cada snapshot se carga una sola vez desde el servidor local y todos sus
+localizadores se cuentan en una única llamada dentro de la página, así que la revisión
+completa tarda milisegundos por localizador. Un localizador está sano si encuentra algún
+elemento en al menos uno de sus snapshots; los que dependen de un parámetro ('{...}') o
+de un estado transitorio se omiten con su motivo.
+
+check_seat_states lee además la sala del snapshot 'cinema/seat_grid' con SeatMap, que se
+capturó con SEAT_GRID_SELECTED asientos elegidos: así se comprueba que el modelo reconoce
+la selección con el marcado real de la aplicación.
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from selenium.webdriver.common.by import By
+
+from pages.elements import script_locator
+from pages.fake_cinema import seat_map
+from pages.fake_cinema.seat_map import STATES, SeatMap
+from pages.fake_cinema.cinema_home_page import CinemaHomePage
+from pages.shophub.shophub_cart_page import CartPage
+from pages.shophub.shophub_category_page import CategoryPage
+from pages.shophub.shophub_home_page import HomePage
+from pages.shophub.shophub_product_page import ProductPage
+
+from .capture import DEFAULT_SNAPSHOTS_DIR, PAGES, SEAT_GRID_SELECTED
+
+_SHOPHUB = tuple(f"shophub/{page}" for page in PAGES["shophub"])
+_CINEMA = tuple(f"cinema/{page}" for page in PAGES["cinema"])
+
+# Page Object (o módulo) -> snapshots donde deben encontrarse sus localizadores
+PAGE_OBJECTS = {
+    HomePage: _SHOPHUB,  # el header está en todas las páginas de ShopHub
+    CategoryPage: ("shophub/category",),
+    ProductPage: ("shophub/product",),
+    CartPage: ("shophub/cart_empty", "shophub/cart"),
+    CinemaHomePage: _CINEMA,
+    seat_map: ("cinema/seat_grid",),
+}
+
+# Localizadores que un DOM en reposo no puede mostrar, con el motivo
+NOT_IN_SNAPSHOTS = {
+    "CategoryPage.OVERLAY": "overlay de carga: sólo existe mientras hay peticiones en curso",
+    "ProductPage.OVERLAY": "overlay de carga: sólo existe mientras hay peticiones en curso",
+}
+
+_BY_VALUES = {value for name, value in vars(By).items() if not name.startswith("_")}
+
+_COUNT_SCRIPT = """
+return arguments[0].map(([using, value]) => {
+    try {
+        if (using === 'xpath') {
+            return document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null)
+                .snapshotLength;
+        }
+        return document.querySelectorAll(value).length;
+    } catch (e) {
+        return -1;  // selector inválido
+    }
+});
+"""
+
+
+@dataclass
+class LocatorCheck:
+    """Un localizador declarado y cuántos elementos encuentra en cada uno de sus snapshots."""
+    owner: str
+    name: str
+    locator: Tuple[str, str]
+    snapshots: Tuple[str, ...]
+    skip_reason: Optional[str] = None
+    matches: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return f"{self.owner}.{self.name}"
+
+    @property
+    def checked(self) -> bool:
+        return bool(self.matches)
+
+    @property
+    def found(self) -> bool:
+        return any(count > 0 for count in self.matches.values())
+
+    @property
+    def invalid(self) -> bool:
+        return any(count < 0 for count in self.matches.values())
+
+
+def _is_locator(value) -> bool:
+    return (isinstance(value, tuple) and len(value) == 2 and value[0] in _BY_VALUES
+            and isinstance(value[1], str))
+
+
+def declared_locators() -> List[LocatorCheck]:
+    """Localizadores de PAGE_OBJECTS, en el orden en que se declararon."""
+    checks = []
+    for page_object, snapshots in PAGE_OBJECTS.items():
+        owner = page_object.__name__.rsplit(".", 1)[-1]
+        for name, value in vars(page_object).items():
+            if not _is_locator(value):
+                continue
+            key = f"{owner}.{name}"
+            reason = NOT_IN_SNAPSHOTS.get(key)
+            if reason is None and "{" in value[1]:
+                reason = "localizador parametrizado: se completa en tiempo de ejecución"
+            checks.append(LocatorCheck(owner, name, value, snapshots, skip_reason=reason))
+    return checks
+
+
+def available_snapshots(directory: Path = DEFAULT_SNAPSHOTS_DIR) -> List[str]:
+    """Snapshots capturados ('app/página') de los que declara PAGES."""
+    return [f"{app}/{page}" for app, pages in PAGES.items() for page in pages
+            if (Path(directory) / app / f"{page}.html").exists()]
+
+
+def check_locators(driver, server, checks: Optional[List[LocatorCheck]] = None) -> List[LocatorCheck]:
+    """
+    Carga cada snapshot capturado desde 'server' (page_snapshots.SnapshotServer) y cuenta
+    los elementos de todos sus localizadores. Los snapshots que no se capturaron quedan sin
+    conteo (LocatorCheck.checked es False si no se capturó ninguno de los suyos).
+    """
+    checks = declared_locators() if checks is None else checks
+    for snapshot in available_snapshots(server.directory):
+        pending = [check for check in checks if snapshot in check.snapshots and check.skip_reason is None]
+        if not pending:
+            continue
+        app, page = snapshot.split("/")
+        driver.get(server.url_for(app, page))
+        counts = driver.execute_script(_COUNT_SCRIPT, [list(script_locator(check.locator)) for check in pending])
+        for check, count in zip(pending, counts):
+            check.matches[snapshot] = count
+    return checks
+
+
+def broken(checks: List[LocatorCheck]) -> List[LocatorCheck]:
+    """Localizadores revisados que no encuentran nada en ninguno de sus snapshots, o inválidos."""
+    return [check for check in checks if check.checked and (check.invalid or not check.found)]
+
+
+def check_seat_states(driver, server) -> Optional[Dict[str, int]]:
+    """
+    Asientos por estado que SeatMap lee en el snapshot de la sala; None si no se capturó.
+    Con el marcado bien interpretado hay SEAT_GRID_SELECTED seleccionados.
+    """
+    if "cinema/seat_grid" not in available_snapshots(server.directory):
+        return None
+    driver.get(server.url_for("cinema", "seat_grid"))
+    seats = SeatMap.snapshot(driver, timeout=2)
+    return {state: len(seats.by_state[state]) for state in STATES}
+
+
+def seat_states_problem(counts: Dict[str, int]) -> Optional[str]:
+    """Motivo por el que la lectura de la sala no coincide con la captura, o None si coincide."""
+    if not sum(counts.values()):
+        return "SeatMap no encontró asientos en cinema/seat_grid"
+    if counts["selected"] != SEAT_GRID_SELECTED:
+        return (f"SeatMap reconoce {counts['selected']} asiento(s) seleccionado(s) en cinema/seat_grid, "
+                f"capturado con {SEAT_GRID_SELECTED}: {counts}")
+    return None
@@ -0,0 +1,64 @@
+"""
+Servidor HTTP estático local que replica los snapshots capturados.
+
+Corre en un hilo del mismo proceso sobre 127.0.0.1 (como fake_airline_api) y sirve
+<directorio>/<app>/<página>.html en /<app>/<página>.html. Lo que los snapshots piden y
+no está guardado (imágenes, fuentes) responde 404 al instante, sin salir a la red.
+"""
+import functools
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+from .capture import DEFAULT_SNAPSHOTS_DIR
+
+
+class _Handler(SimpleHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        # Sin una línea por petición en la salida de las pruebas
+        pass
+
+
+class SnapshotServer:
+    """
+    Réplica local de los snapshots.
+
+    Uso:
+        server = SnapshotServer().start()
+        driver.get(server.url_for("shophub", "home"))
+        ...
+        server.stop()
+    """
+
+    def __init__(self, directory: Path = DEFAULT_SNAPSHOTS_DIR, host: str = "127.0.0.1", port: int = 0):
+        self.directory = Path(directory)
+        handler = functools.partial(_Handler, directory=str(self.directory))
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url_for(self, app: str, page: str) -> str:
+        return f"{self.url}/{app}/{page}.html"
+
+    def start(self) -> "SnapshotServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="page-snapshots", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self):
+        """Sirve en el hilo actual (lo usa 'python -m page_snapshots serve')."""
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
@@ -0,0 +1,123 @@
+"""
+Lectura en bloque de elementos para los Page Objects.
+
+Recorrer el resultado de find_elements leyendo .text, .is_displayed() y atributos cuesta
+una petición HTTP al driver por lectura y por elemento (300 para una grilla de 100
+asientos). read_elements() hace una sola llamada a execute_script que devuelve, para
+cada coincidencia, su texto, visibilidad, atributos, caja en pantalla y, opcionalmente,
+el texto de sub-elementos (p. ej. el nombre dentro de una tarjeta de producto). Cada
+resultado conserva además el WebElement para poder hacer clic sobre él.
+"""
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+
+from selenium.webdriver.common.by import By
+
+from pages.waits import until
+
+# Atributos que se leen si no se piden otros
+DEFAULT_ATTRIBUTES = ("id", "class", "href", "disabled", "aria-label")
+
+_READ_SCRIPT = """
+const [using, value, attributes, fields, root] = arguments;
+const scope = root || document;
+let matches;
+if (using === 'xpath') {
+    const result = document.evaluate(value, scope, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    matches = [];
+    for (let i = 0; i < result.snapshotLength; i++) { matches.push(result.snapshotItem(i)); }
+} else {
+    matches = Array.from(scope.querySelectorAll(value));
+}
+const isVisible = (e) => {
+    const style = window.getComputedStyle(e);
+    return style.display !== 'none' && style.visibility !== 'hidden' && style.opacity !== '0'
+        && e.getClientRects().length > 0;
+};
+return matches.map((e) => {
+    const rect = e.getBoundingClientRect();
+    const attrs = {};
+    for (const name of attributes) { attrs[name] = e.getAttribute(name); }
+    const texts = {};
+    for (const [name, selector] of Object.entries(fields)) {
+        texts[name] = Array.from(e.querySelectorAll(selector), (child) => child.innerText.trim());
+    }
+    return {
+        element: e,
+        tag: e.tagName.toLowerCase(),
+        text: (e.innerText || '').trim(),
+        visible: isVisible(e),
+        enabled: !e.disabled,
+        attributes: attrs,
+        rect: {x: rect.x, y: rect.y, width: rect.width, height: rect.height},
+        fields: texts,
+    };
+});
+"""
+
+
+@dataclass
+class ElementInfo:
+    """Foto de un elemento tomada en la misma llamada que el resto de coincidencias."""
+    element: object
+    tag: str
+    text: str
+    visible: bool
+    enabled: bool
+    attributes: Dict[str, Optional[str]] = field(default_factory=dict)
+    rect: Dict[str, float] = field(default_factory=dict)
+    fields: Dict[str, List[str]] = field(default_factory=dict)
+
+    @property
+    def clickable(self) -> bool:
+        """Equivalente a element_to_be_clickable: visible y habilitado."""
+        return self.visible and self.enabled
+
+
+def script_locator(locator):
+    """Traduce un localizador de Selenium a ('css', selector) o ('xpath', expresión)."""
+    by, value = locator
+    if by == By.XPATH:
+        return "xpath", value
+    if by == By.CSS_SELECTOR:
+        return "css", value
+    if by == By.TAG_NAME:
+        return "css", value
+    if by == By.ID:
+        return "css", f'[id="{value}"]'
+    if by == By.NAME:
+        return "css", f'[name="{value}"]'
+    if by == By.CLASS_NAME:
+        return "css", f".{value}"
+    if by == By.LINK_TEXT:
+        return "xpath", f'.//a[normalize-space()="{value}"]'
+    if by == By.PARTIAL_LINK_TEXT:
+        return "xpath", f'.//a[contains(normalize-space(), "{value}")]'
+    raise ValueError(f"Localizador no soportado para lectura en bloque: {by}")
+
+
+def read_elements(driver, locator, attributes: Sequence[str] = DEFAULT_ATTRIBUTES,
+                  fields: Dict[str, str] = None, root=None) -> List[ElementInfo]:
+    """
+    Texto, visibilidad, atributos, caja y los textos de los sub-elementos de cada selector
+    CSS de 'fields' ({nombre: selector}) de todas las coincidencias de 'locator' (dentro de 'root' si se indica), en una
+    sola llamada. Devuelve una lista vacía sin esperar el timeout implícito.
+    """
+    using, value = script_locator(locator)
+    rows = driver.execute_script(_READ_SCRIPT, using, value, list(attributes), fields or {}, root)
+    return [ElementInfo(**row) for row in rows]
+
+
+def wait_for_elements(driver, locator, timeout: float = 10,
+                      predicate: Callable[[ElementInfo], bool] = None, **kwargs) -> List[ElementInfo]:
+    """
+    Repite read_elements hasta que alguna coincidencia cumpla 'predicate' (por defecto,
+    que exista) y devuelve todas las que lo cumplen; lista vacía si se agota el timeout.
+    """
+    found = []
+
+    def matched(d):
+        found[:] = [info for info in read_elements(d, locator, **kwargs) if predicate is None or predicate(info)]
+        return bool(found)
+
+    return found if until(driver, matched, timeout) else []
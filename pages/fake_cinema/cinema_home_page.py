@@ -3,6 +3,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from datetime import datetime
+from pages import performance, waits
+from pages.elements import read_elements, wait_for_elements
+from pages.fake_cinema.seat_map import AVAILABLE, SELECTED, SeatMap
+from pages.locators import resolve
 import time
 import re
 import logging
@@ -132,6 +136,7 @@ class CinemaHomePage:
 
     def go_to(self):
         self.driver.get("https://fake-cinema.vercel.app/")
+        performance.capture(self.driver, "cinema.home")
 
     def click_movie_card(self):
         print("[USER FLOW] Seleccionando película: '¡El mismo héroe, como nunca antes!'...")
@@ -165,49 +170,33 @@ class CinemaHomePage:
 
     def click_choose_cinema_button(self):
         """Intenta hacer clic en el botón 'Elige tu cine' usando diferentes estrategias de localización."""
-        locators = [
-            self.CHOOSE_CINEMA_BUTTON_ARIA,
-            self.CHOOSE_CINEMA_BUTTON_HEADER_SPAN,
-            self.CHOOSE_CINEMA_BUTTON_XPATH,
-            self.CHOOSE_CINEMA_BUTTON_TEXT
-        ]
-
-        for locator in locators:
-            try:
-                element = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable(locator)
-                )
-                from selenium.webdriver.common.action_chains import ActionChains
-                actions = ActionChains(self.driver)
-                actions.move_to_element_with_offset(element, 74, 10).click().perform()
-                return
-            except Exception:
-                continue
+        # Todas las estrategias se prueban a la vez; la que funcionó la última vez tiene prioridad
+        element = resolve(self.driver, "cinema_home.choose_cinema_button", {
+            "CHOOSE_CINEMA_BUTTON_ARIA": self.CHOOSE_CINEMA_BUTTON_ARIA,
+            "CHOOSE_CINEMA_BUTTON_HEADER_SPAN": self.CHOOSE_CINEMA_BUTTON_HEADER_SPAN,
+            "CHOOSE_CINEMA_BUTTON_XPATH": self.CHOOSE_CINEMA_BUTTON_XPATH,
+            "CHOOSE_CINEMA_BUTTON_TEXT": self.CHOOSE_CINEMA_BUTTON_TEXT,
+        }, timeout=10)
 
         # Si ningún localizador funciona, lanzar una excepción
-        raise Exception("No se pudo encontrar o hacer clic en el botón 'Elige tu cine'")
+        if element is None:
+            raise Exception("No se pudo encontrar o hacer clic en el botón 'Elige tu cine'")
+
+        # Clic en el centro del botón que contiene el texto: un desplazamiento fijo en píxeles depende del
+        # ancho del texto, que cambia con la fuente (p. ej. si las fuentes web están bloqueadas)
+        # (leído con un script: sin botón no se paga la espera implícita del driver)
+        target = self.driver.execute_script("return arguments[0].closest('button') || arguments[0];", element)
+        ActionChains(self.driver).move_to_element(target).click().perform()
 
     def click_film_classification_tag(self, film_number):
         """
         Hace clic en la etiqueta de clasificación de la película especificada
         """
-        wait = WebDriverWait(self.driver, self.timeout)
-
-        # Localizadores para la etiqueta de clasificación de la película
-        locators = [
-            (By.CSS_SELECTOR, f'div.grid > div:nth-of-type({film_number}) div.border-transparent'),
-            (By.XPATH, f'/html/body/div[1]/main/section[2]/div[2]/div[{film_number}]/div/div/div[1]')
-        ]
-
-        # Intentar con cada localizador hasta que uno funcione
-        element = None
-        for locator in locators:
-            try:
-                element = wait.until(EC.element_to_be_clickable(locator))
-                if element:
-                    break
-            except:
-                continue
+        # Localizadores para la etiqueta de clasificación de la película (evaluados a la vez)
+        element = resolve(self.driver, "cinema_home.film_classification_tag", {
+            "grid_css": (By.CSS_SELECTOR, f'div.grid > div:nth-of-type({film_number}) div.border-transparent'),
+            "absolute_xpath": (By.XPATH, f'/html/body/div[1]/main/section[2]/div[2]/div[{film_number}]/div/div/div[1]'),
+        }, timeout=self.timeout)
 
         if element:
             element.click()
@@ -219,8 +208,10 @@ class CinemaHomePage:
         Verifica si una clasificación específica es visible en la página
         """
         try:
-            # Buscar elementos que contengan el texto de la clasificación
-            elements = self.driver.find_elements(By.XPATH, f"//*[contains(text(), '{classification}')]")
+            # Buscar elementos que contengan el texto de la clasificación (una sola lectura por sondeo,
+            # con el mismo margen que daba la espera implícita)
+            elements = wait_for_elements(self.driver, (By.XPATH, f"//*[contains(text(), '{classification}')]"),
+                                         timeout=10, attributes=())
             return len(elements) > 0
         except:
             return False
@@ -383,25 +374,13 @@ class CinemaHomePage:
             try:
                 logger.debug(f"[RETRY] Intento {attempt + 1}/{max_attempts} de seleccionar horario")
 
-                # Esperar que la página termine de cargar
-                WebDriverWait(self.driver, 10).until(
-                    lambda d: d.execute_script('return document.readyState') == 'complete'
-                )
-
-                try:
-                    WebDriverWait(self.driver, 15).until(
-                        lambda d: (
-                                      d.execute_script("return document.querySelectorAll('*').length;"),
-                                      time.sleep(0.3),
-                                      d.execute_script("return document.querySelectorAll('*').length;")
-                                  )[-1] == d.execute_script("return document.querySelectorAll('*').length;")
-                    )
-                except:
-                    pass
+                # Esperar que la página termine de cargar y el DOM deje de cambiar
+                # (se resuelve dentro de la página, ver pages/waits.py)
+                waits.page_quiet(self.driver, timeout=15)
 
-                # Scroll y espera
+                # Scroll y espera a que se estabilice lo que cargue al hacer scroll
                 self.driver.execute_script("window.scrollTo(0, 500);")
-                time.sleep(2)
+                waits.page_quiet(self.driver, timeout=5)
 
                 # Intentar eliminar loaders
                 try:
@@ -443,8 +422,7 @@ class CinemaHomePage:
                             logger.debug(f"   Probando fecha #{idx}...")
 
                             # Scroll al botón de fecha
-                            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", date_btn)
-                            time.sleep(0.5)
+                            waits.scroll_into_view(self.driver, date_btn)
 
                             # Click en la fecha
                             try:
@@ -452,7 +430,8 @@ class CinemaHomePage:
                             except:
                                 self.driver.execute_script("arguments[0].click();", date_btn)
 
-                            time.sleep(3)  # Esperar que carguen los horarios
+                            # Esperar que carguen los horarios
+                            waits.page_quiet(self.driver, timeout=5)
 
                             # Verificar si ahora hay horarios
                             time_buttons = self.driver.find_elements(
@@ -487,8 +466,7 @@ class CinemaHomePage:
                 # Seleccionar primer botón habilitado
                 for button in time_buttons:
                     if button.is_displayed() and button.is_enabled():
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                        time.sleep(0.5)
+                        waits.scroll_into_view(self.driver, button)
 
                         button_text = button.text.strip()
 
@@ -551,34 +529,42 @@ class CinemaHomePage:
 
     import re
 
+    def seat_map(self, refresh=False):
+        """
+        Foto de la sala (ver pages/fake_cinema/seat_map.py), tomada en una sola lectura del DOM.
+        Se reutiliza mientras sus elementos sigan en la página; refresh=True fuerza una nueva.
+        """
+        seat_map = getattr(self, "_seat_map", None)
+        if refresh or seat_map is None or not seat_map.is_attached():
+            seat_map = self._seat_map = SeatMap.snapshot(self.driver)
+            print(f"[DEBUG] Sala leída: {len(seat_map.seats)} asientos "
+                  f"({len(seat_map.available())} disponibles, {len(seat_map.occupied())} ocupados)")
+        return seat_map
+
     def select_first_available_seat(self):
         """
         Versión FINAL: selecciona el primer asiento basado en su texto (número).
         No depende de clases de color, que pueden cambiar o no cargarse.
         """
-        # Buscar cualquier botón que tenga un número como texto (asientos típicos: "1", "2", "3", etc.)
-        seat_locator = (By.XPATH, "//button[string-length(text()) = 1 and text() >= '1' and text() <= '9']")
-
         try:
-            print("[DEBUG] Buscando asientos por número (1-9)...")
-            seat = WebDriverWait(self.driver, 15).until(
-                EC.element_to_be_clickable(seat_locator)
-            )
-
-            seat_text = seat.text.strip()
-            print(f"[DEBUG] Encontré el asiento: {seat_text}")
-
-            # Hacer clic con JavaScript
-            self.driver.execute_script("arguments[0].click();", seat)
+            print("[DEBUG] Buscando asientos por número...")
+            seat_map = self.seat_map(refresh=True)
+            if not seat_map.available():
+                raise Exception("No hay asientos disponibles en la sala.")
+            seat = seat_map.available()[0]
+            print(f"[DEBUG] Encontré el asiento: {seat.number} (fila {seat.row})")
+
+            # Hacer clic con JavaScript (sólo se vuelve a leer la celda del asiento)
+            seat = seat_map.click(seat)
             print("[DEBUG] Clic ejecutado con JavaScript.")
 
             # Esperar a que el botón "Comprar boletos" esté habilitado
             WebDriverWait(self.driver, 10).until(
                 EC.element_to_be_clickable(self.BUY_TICKETS_BUTTON)
             )
-            print(f"[DEBUG] ✅ Asiento '{seat_text}' seleccionado. Botón de compra habilitado.")
+            print(f"[DEBUG] ✅ Asiento '{seat.number}' seleccionado. Botón de compra habilitado.")
 
-            return seat_text
+            return seat.number
 
         except Exception as e:
             self.driver.save_screenshot("debug_seat_by_number_failed.png")
@@ -591,31 +577,22 @@ class CinemaHomePage:
         :return: Lista de textos de los asientos seleccionados.
         """
         selected_seats = []
+        seat_map = self.seat_map(refresh=True)
 
         for i in range(count):
             try:
-                # XPath dinámico: busca asientos disponibles (fondo azul) que NO estén ya en selected_seats
-                xpath_condition = " and ".join([f"not(contains(text(), '{s}'))" for s in selected_seats]) \
-                    if selected_seats else "1=1"
-                seat_locator = (
-                    By.XPATH,
-                    f"//button[contains(@class, 'bg-blue') and string-length(text()) = 1 and text() >= '1' "
-                    f"and text() <= '9' and ({xpath_condition})]"
-                )
-
-                print(f"[POM DEBUG] Buscando asiento #{i + 1} con XPath: {seat_locator[1]}...")
-                seat = WebDriverWait(self.driver, 15).until(
-                    EC.element_to_be_clickable(seat_locator)
-                )
-
-                seat_text = seat.text.strip()
-                print(f"[POM DEBUG] Encontré el asiento: {seat_text}")
+                # Asientos disponibles según la foto de la sala, sin repetir número (se deseleccionan por número)
+                candidates = [seat for seat in seat_map.available() if seat.number not in selected_seats]
+                if not candidates:
+                    raise Exception("No quedan asientos disponibles en la sala.")
+                seat = candidates[0]
+                print(f"[POM DEBUG] Asiento #{i + 1}: {seat.number} (fila {seat.row})")
 
                 # Hacer clic con JavaScript
-                self.driver.execute_script("arguments[0].click();", seat)
-                print(f"[POM DEBUG] Clic ejecutado en asiento '{seat_text}' con JavaScript.")
+                seat = seat_map.click(seat)
+                print(f"[POM DEBUG] Clic ejecutado en asiento '{seat.number}' con JavaScript.")
 
-                selected_seats.append(seat_text)
+                selected_seats.append(seat.number)
 
                 # Esperar a que el contador de asientos en el carrito refleje la selección actual
                 WebDriverWait(self.driver, 5).until(
@@ -641,6 +618,9 @@ class CinemaHomePage:
         """
         Localiza el primer asiento ocupado (deshabilitado) en la sala.
         """
+        occupied = self.seat_map(refresh=True).occupied()
+        if occupied:
+            return occupied[0].element
         return WebDriverWait(self.driver, 10).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, "button[disabled]"))
         )
@@ -722,31 +702,24 @@ class CinemaHomePage:
         :return: Lista de textos de los asientos que fueron deseleccionados.
         """
         deselected_seats = []
+        seat_map = self.seat_map()
 
         for seat_text in seat_texts:
             try:
-                # Buscar el asiento POR TEXTO
-                seat_locator = (
-                    By.XPATH,
-                    f"//button[contains(@class, 'bg-blue') and normalize-space(text()) = '{seat_text}']"
-                )
-
+                # Buscar el asiento POR TEXTO entre los seleccionados de la foto de la sala
                 print(f"[POM DEBUG] Buscando asiento seleccionado '{seat_text}' para deseleccionar...")
-                seat = WebDriverWait(self.driver, 15).until(
-                    EC.element_to_be_clickable(seat_locator)
-                )
+                seat = seat_map.find(seat_text, SELECTED)
+                if seat is None:
+                    raise Exception("el asiento no figura como seleccionado en la sala")
 
-                # Hacer clic con JavaScript para deseleccionar
-                self.driver.execute_script("arguments[0].click();", seat)
+                # Hacer clic con JavaScript para deseleccionar y esperar a que vuelva a estar disponible
+                seat = seat_map.click(seat)
                 print(f"[POM DEBUG] Clic ejecutado en asiento '{seat_text}' para deseleccionar.")
+                if seat.state != AVAILABLE:
+                    raise Exception(f"el asiento quedó en estado '{seat.state}'")
 
                 deselected_seats.append(seat_text)
 
-                # Esperar a que el asiento vuelva a estar disponible (fondo azul)
-                WebDriverWait(self.driver, 5).until(
-                    lambda d: "bg-blue" in seat.get_attribute("class")
-                )
-
             except Exception as e:
                 print(f"[POM DEBUG] ❌ No se pudo deseleccionar el asiento '{seat_text}': {str(e)}")
                 continue  # Continuar con los siguientes, no fallar la prueba aún
@@ -796,7 +769,10 @@ class CinemaHomePage:
         confirm_button = WebDriverWait(self.driver, 10).until(
             EC.element_to_be_clickable(self.CONFIRM_BUTTON)
         )
-        confirm_button.click()
+        # La transición termina en el carrito o, sin salir del modal, en la alerta de cantidad que no coincide
+        with performance.transition(self.driver, "cinema.seats", ready=(self.PROCEED_TO_CHECKOUT_BUTTON,),
+                                    leaving=confirm_button, in_place=((By.XPATH, "//p[@role='alert']"),)):
+            confirm_button.click()
 
     def wait_for_ticket_modal(self):
         """Verifica si el modal de selección de boletos está visible."""
@@ -917,14 +893,12 @@ class CinemaHomePage:
             print(f"[DEBUG] Título de la página: {title}")
         except:
             pass
-        # Imprimir los primeros H1, H2 para ver qué hay en la página
+        # Imprimir los H1, H2 para ver qué hay en la página (leídos todos en una sola llamada)
         try:
-            h1s = self.driver.find_elements(By.TAG_NAME, "h1")
-            for i, h in enumerate(h1s):
-                print(f"[DEBUG] H1 #{i}: '{h.text}'")
-            h2s = self.driver.find_elements(By.TAG_NAME, "h2")
-            for i, h in enumerate(h2s):
-                print(f"[DEBUG] H2 #{i}: '{h.text}'")
+            headings = read_elements(self.driver, (By.CSS_SELECTOR, "h1, h2"), attributes=())
+            for tag in ("h1", "h2"):
+                for i, h in enumerate(info for info in headings if info.tag == tag):
+                    print(f"[DEBUG] {tag.upper()} #{i}: '{h.text if h.visible else ''}'")
         except:
             pass
 
@@ -934,7 +908,9 @@ class CinemaHomePage:
         proceed_button = WebDriverWait(self.driver, 20).until(
             EC.element_to_be_clickable(self.PROCEED_TO_CHECKOUT_BUTTON)
         )
-        proceed_button.click()
+        with performance.transition(self.driver, "cinema.checkout", ready=(self.FIRST_NAME_FIELD,),
+                                    leaving=proceed_button):
+            proceed_button.click()
         print("[POM DEBUG] Botón 'Proceder al pago' clickeado.")
 
     def fill_payment_form(self, first_name, last_name, email, card_name, card_number, cvv):
@@ -0,0 +1,168 @@
+"""
+Modelo en memoria de la sala de Fake Cinema.
+
+SeatMap.snapshot() lee todos los asientos de la sala en una sola llamada (ver
+pages/elements.py): fila, número, estado y WebElement de cada uno, con índices por
+estado. Al hacer clic en un asiento sólo se vuelve a leer esa celda, así que
+seleccionar N asientos cuesta N clics más N lecturas, no N búsquedas en todo el DOM.
+
+Estados: 'available' (habilitado), 'selected' (seleccionado) y 'occupied'
+(deshabilitado). La sala no expone la selección con un atributo propio, así que un
+asiento habilitado está seleccionado si lo marca aria-pressed/aria-selected o si sus
+clases difieren de las de la mayoría de los asientos habilitados (los disponibles):
+no depende de un color en particular. La fila se deduce de la posición en pantalla:
+los asientos a la misma altura forman una fila, numeradas desde 1 de arriba hacia abajo.
+"""
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+
+from pages.elements import ElementInfo, wait_for_elements
+from pages.waits import until
+
+AVAILABLE = "available"
+SELECTED = "selected"
+OCCUPIED = "occupied"
+STATES = (AVAILABLE, SELECTED, OCCUPIED)
+
+# Botones cuyo texto es sólo el número del asiento: dentro de la grilla de la sala ('seat-grid')
+# o, si la página no la tiene, en todo el documento. Una sola expresión, una sola lectura.
+_SEAT_CONDITION = ("normalize-space() != '' and string-length(normalize-space()) <= 2 "
+                   "and translate(normalize-space(), '0123456789', '') = ''")
+_SEAT_GRID = "//div[contains(@class, 'seat-grid')]"
+SEAT_BUTTON = (By.XPATH, f"{_SEAT_GRID}//button[{_SEAT_CONDITION}] "
+                         f"| //button[{_SEAT_CONDITION}][not({_SEAT_GRID})]")
+SEAT_ATTRIBUTES = ("class", "disabled", "aria-pressed", "aria-selected")
+
+_CELL_SCRIPT = """
+const e = arguments[0];
+return {class: e.getAttribute('class'), disabled: e.disabled,
+        pressed: e.getAttribute('aria-pressed') || e.getAttribute('aria-selected')};
+"""
+
+
+def _class_set(classes: Optional[str]) -> FrozenSet[str]:
+    return frozenset((classes or "").split())
+
+
+def _state(classes: str, disabled, pressed, available_classes: Optional[FrozenSet[str]] = None) -> str:
+    if disabled:
+        return OCCUPIED
+    if pressed in ("true", "false"):
+        return SELECTED if pressed == "true" else AVAILABLE
+    if available_classes is not None and _class_set(classes) != available_classes:
+        return SELECTED
+    return AVAILABLE
+
+
+def _available_classes(infos: List[ElementInfo]) -> Optional[FrozenSet[str]]:
+    """Clases más frecuentes entre los asientos habilitados: las de un asiento disponible."""
+    enabled = Counter(_class_set(info.attributes.get("class")) for info in infos
+                      if info.attributes.get("disabled") is None)
+    return enabled.most_common(1)[0][0] if enabled else None
+
+
+@dataclass
+class Seat:
+    row: int
+    number: str
+    state: str
+    element: object
+    classes: str = ""
+
+    @property
+    def label(self) -> str:
+        return f"F{self.row}-{self.number}"
+
+
+@dataclass
+class SeatMap:
+    """Asientos de la sala en orden de lectura (fila y luego columna) con índices por estado."""
+    driver: object
+    seats: List[Seat] = field(default_factory=list)
+    by_state: Dict[str, List[Seat]] = field(default_factory=dict)
+    # Clases de un asiento disponible en esta sala (ver _available_classes)
+    available_classes: Optional[FrozenSet[str]] = None
+
+    @classmethod
+    def snapshot(cls, driver, timeout: float = 15) -> "SeatMap":
+        """Lee la sala completa en una llamada (esperando hasta 'timeout' a que aparezca)."""
+        infos = wait_for_elements(driver, SEAT_BUTTON, timeout=timeout, attributes=SEAT_ATTRIBUTES)
+        seat_map = cls(driver, available_classes=_available_classes(infos))
+        seat_map.seats = cls._build(infos, seat_map.available_classes)
+        seat_map._reindex()
+        return seat_map
+
+    @staticmethod
+    def _build(infos: List[ElementInfo], available_classes: Optional[FrozenSet[str]] = None) -> List[Seat]:
+        rows = sorted({round(info.rect["y"]) for info in infos})
+        row_of = {y: index + 1 for index, y in enumerate(rows)}
+        infos = sorted(infos, key=lambda info: (row_of[round(info.rect["y"])], info.rect["x"]))
+        return [
+            Seat(
+                row=row_of[round(info.rect["y"])],
+                number=info.text,
+                state=_state(info.attributes.get("class"), info.attributes.get("disabled") is not None,
+                             info.attributes.get("aria-pressed") or info.attributes.get("aria-selected"),
+                             available_classes),
+                element=info.element,
+                classes=info.attributes.get("class") or "",
+            )
+            for info in infos
+        ]
+
+    def _reindex(self):
+        self.by_state = {state: [seat for seat in self.seats if seat.state == state] for state in STATES}
+
+    def available(self) -> List[Seat]:
+        return self.by_state[AVAILABLE]
+
+    def selected(self) -> List[Seat]:
+        return self.by_state[SELECTED]
+
+    def occupied(self) -> List[Seat]:
+        return self.by_state[OCCUPIED]
+
+    def find(self, number: str, state: Optional[str] = None) -> Optional[Seat]:
+        """Primer asiento con ese número (y estado, si se indica)."""
+        for seat in self.seats:
+            if seat.number == str(number) and (state is None or seat.state == state):
+                return seat
+        return None
+
+    def is_attached(self) -> bool:
+        """False si la sala se volvió a renderizar o se navegó (los WebElement ya no sirven)."""
+        if not self.seats:
+            return False
+        return bool(self.driver.execute_script("return arguments[0].isConnected;", self.seats[0].element))
+
+    def refresh(self, seat: Seat) -> Seat:
+        """Vuelve a leer sólo la celda del asiento y actualiza su estado y los índices."""
+        cell = self.driver.execute_script(_CELL_SCRIPT, seat.element)
+        seat.classes = cell["class"] or ""
+        seat.state = _state(seat.classes, cell["disabled"], cell["pressed"], self.available_classes)
+        self._reindex()
+        return seat
+
+    def click(self, seat: Seat, timeout: float = 5) -> Seat:
+        """
+        Hace clic en el asiento (con JavaScript) y espera a que su celda cambie. Si la foto no
+        tenía asientos disponibles de referencia, el estado se invierte igual (disponible <->
+        seleccionado) en cuanto la celda cambia.
+        """
+        before_classes, before_state = seat.classes, seat.state
+        self.driver.execute_script("arguments[0].click();", seat.element)
+        try:
+            changed = until(self.driver, lambda d: self.refresh(seat).classes != before_classes, timeout)
+        except StaleElementReferenceException:
+            # La sala se volvió a renderizar completa: nueva foto y el mismo asiento en ella
+            fresh = SeatMap.snapshot(self.driver, timeout)
+            self.seats, self.by_state, self.available_classes = fresh.seats, fresh.by_state, fresh.available_classes
+            return next(s for s in self.seats if (s.row, s.number) == (seat.row, seat.number))
+        if changed and seat.state == before_state and before_state in (AVAILABLE, SELECTED):
+            seat.state = SELECTED if before_state == AVAILABLE else AVAILABLE
+            self._reindex()
+        return seat
@@ -0,0 +1,188 @@
+"""
+Resolución de elementos con varios localizadores alternativos que aprende cuál funciona.
+
+Probar los localizadores de a uno con un WebDriverWait de 5 s cada uno cuesta 5-15 s
+cuando los primeros ya no sirven. resolve() evalúa todas las alternativas en una sola
+consulta dentro de la página (repetida hasta el timeout) y se queda con la primera
+que encuentra un elemento, empezando por la que ganó la última vez. El resultado de
+cada estrategia se guarda por elemento lógico en un JSON que persiste entre
+ejecuciones (.pytest_cache/locators.json, o LOCATOR_CACHE), y stale_strategies()
+lista las que fallan siempre, para limpiarlas de los Page Objects. Cada proceso suma
+al archivo sólo los resultados que registró desde su última escritura, así los workers
+de xdist acumulan sus conteos en vez de pisarse.
+"""
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Union
+
+from pages.elements import script_locator
+from pages.waits import until
+from storage.json_files import read_json, update_json
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_PATH = Path(os.getenv("LOCATOR_CACHE", ROOT_DIR / ".pytest_cache" / "locators.json"))
+# Fallos seguidos a partir de los que una estrategia se reporta como obsoleta
+STALE_AFTER = 3
+
+_RACE_SCRIPT = """
+const [candidates, clickable] = arguments;
+const usable = (e) => {
+    const style = window.getComputedStyle(e);
+    const visible = style.display !== 'none' && style.visibility !== 'hidden' && e.getClientRects().length > 0;
+    return visible && (!clickable || !e.disabled);
+};
+return candidates.map(([using, value]) => {
+    try {
+        if (using === 'xpath') {
+            const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (let i = 0; i < result.snapshotLength; i++) {
+                if (usable(result.snapshotItem(i))) { return result.snapshotItem(i); }
+            }
+            return null;
+        }
+        return Array.from(document.querySelectorAll(value)).find(usable) || null;
+    } catch (e) {
+        return null;  // selector inválido: cuenta como fallo de esa estrategia
+    }
+});
+"""
+
+
+@dataclass
+class StrategyStats:
+    """Resultados de una estrategia de localización de un elemento lógico."""
+    hits: int = 0
+    misses: int = 0
+    consecutive_misses: int = 0
+    last_hit: Optional[str] = None
+
+
+def _add(total: StrategyStats, delta: StrategyStats):
+    """Suma a 'total' los resultados de 'delta', registrados después de los suyos."""
+    total.hits += delta.hits
+    total.misses += delta.misses
+    # Si 'delta' tiene algún acierto, la racha de fallos es la que vino después de ese acierto
+    total.consecutive_misses = (delta.consecutive_misses if delta.hits
+                                else total.consecutive_misses + delta.consecutive_misses)
+    total.last_hit = max(filter(None, (total.last_hit, delta.last_hit)), default=None)
+
+
+def _merge(content: dict, pending: Dict[str, Dict[str, StrategyStats]], winners: Dict[str, str]) -> dict:
+    """Suma los resultados pendientes a los del archivo; la ganadora es la última de este proceso."""
+    for name, strategies in pending.items():
+        entry = content.setdefault(name, {"winner": None, "strategies": {}})
+        entry["winner"] = winners.get(name, entry.get("winner"))
+        saved = entry.setdefault("strategies", {})
+        for key, delta in strategies.items():
+            total = StrategyStats(**saved.get(key, {}))
+            _add(total, delta)
+            saved[key] = asdict(total)
+    return content
+
+
+class LocatorCache:
+    """Estadísticas por elemento lógico y estrategia, con la ganadora de la última resolución."""
+
+    def __init__(self, path: Optional[Path] = DEFAULT_CACHE_PATH):
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self.winners: Dict[str, str] = {}
+        self.stats: Dict[str, Dict[str, StrategyStats]] = {}
+        # Resultados registrados desde la última escritura (lo que este proceso suma al archivo)
+        self._pending: Dict[str, Dict[str, StrategyStats]] = {}
+        self._load()
+
+    def _load(self):
+        if self.path:
+            self._read(read_json(self.path, {}))
+
+    def _read(self, data: dict):
+        for name, entry in data.items():
+            self.winners[name] = entry.get("winner")
+            self.stats[name] = {key: StrategyStats(**value) for key, value in entry.get("strategies", {}).items()}
+
+    def save(self):
+        """
+        Suma al archivo los resultados pendientes de este proceso sobre lo que otros procesos
+        (workers de xdist) hayan guardado, y se queda con el total.
+        """
+        if not self.path:
+            return
+        with self._lock:
+            content = update_json(self.path, lambda content: _merge(content, self._pending, self.winners), indent=2)
+            if content is not None:
+                self._pending = {}
+                self._read(content)
+
+    def order(self, name: str, keys: Sequence[str]) -> List[str]:
+        """Las estrategias con la ganadora anterior primero y el resto en el orden declarado."""
+        winner = self.winners.get(name)
+        return sorted(keys, key=lambda key: key != winner)
+
+    def record(self, name: str, keys: Sequence[str], matched: Sequence[str], winner: str):
+        """Acierto para las estrategias que encontraron el elemento y fallo para las demás."""
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        with self._lock:
+            for key in keys:
+                hit = key in matched
+                delta = StrategyStats(hits=int(hit), misses=int(not hit), consecutive_misses=int(not hit),
+                                      last_hit=now if hit else None)
+                _add(self.stats.setdefault(name, {}).setdefault(key, StrategyStats()), delta)
+                _add(self._pending.setdefault(name, {}).setdefault(key, StrategyStats()), delta)
+            self.winners[name] = winner
+        self.save()
+
+    def stale_strategies(self, threshold: int = STALE_AFTER) -> List[str]:
+        """Estrategias que fallaron en las últimas 'threshold' resoluciones de su elemento."""
+        return [
+            f"{name} -> {key} ({stats.consecutive_misses} fallos seguidos, "
+            f"último acierto: {stats.last_hit or 'nunca'})"
+            for name, strategies in sorted(self.stats.items())
+            for key, stats in strategies.items()
+            if stats.consecutive_misses >= threshold
+        ]
+
+
+_default_cache: Optional[LocatorCache] = None
+
+
+def default_cache() -> LocatorCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = LocatorCache()
+    return _default_cache
+
+
+def _strategy_key(locator) -> str:
+    return f"{locator[0]}={locator[1]}"
+
+
+def resolve(driver, name: str, candidates: Union[Sequence, Mapping[str, tuple]], timeout: float = 5,
+            clickable: bool = True, cache: Optional[LocatorCache] = None):
+    """
+    Primer elemento visible (y habilitado, si 'clickable') que encuentre alguna de las
+    alternativas, evaluadas todas juntas en cada sondeo. 'candidates' es una lista de
+    localizadores o un dict {nombre de estrategia: localizador}; los nombres sirven cuando
+    el localizador cambia con un parámetro (p. ej. el número de película). Devuelve None
+    si ninguna encuentra el elemento dentro del timeout.
+    """
+    cache = cache or default_cache()
+    if not isinstance(candidates, Mapping):
+        candidates = {_strategy_key(locator): locator for locator in candidates}
+    keys = cache.order(name, list(candidates))
+    scripted = [list(script_locator(candidates[key])) for key in keys]
+    found = {}
+
+    def raced(d):
+        elements = d.execute_script(_RACE_SCRIPT, scripted, clickable)
+        found.update({key: element for key, element in zip(keys, elements) if element is not None})
+        return bool(found)
+
+    if not until(driver, raced, timeout):
+        return None
+    winner = next(key for key in keys if key in found)
+    cache.record(name, keys, list(found), winner)
+    return found[winner]
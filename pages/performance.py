@@ -0,0 +1,241 @@
+"""
+Métricas de carga de página tomadas del propio navegador para los Page Objects.
+
+capture() lee, en una sola llamada asíncrona, lo que el navegador ya midió al cargar la
+página: Navigation Timing (TTFB, DOMContentLoaded, load), Resource Timing (cantidad y
+bytes transferidos), Largest Contentful Paint, Cumulative Layout Shift y long tasks (los
+tres últimos con PerformanceObserver en modo 'buffered'). transition() mide lo mismo para
+una transición dentro de la aplicación (un clic que cambia de vista sin recargar): desde
+la acción hasta que la vista anterior se fue (cambió la URL o un elemento suyo quedó
+obsoleto) y aparece lo que el Page Object espera de la vista siguiente ('ready'), con los
+recursos, shifts y long tasks que ocurrieron en ese intervalo. Sin 'ready' la
+transición sólo se mide con --perf-budgets, hasta que la red queda inactiva
+(waits.network_idle): fuera de ese modo no se agrega ninguna espera a las pruebas.
+
+Las métricas quedan registradas por navegador (take() las entrega y las olvida; el fixture
+'driver' las adjunta a la prueba) y pueden verificarse contra un presupuesto de LCP, TTFB
+y duración de transición con assert_budget(); con enforce_budgets activo (--perf-budgets)
+cada captura lo verifica sola. Las métricas que un navegador no soporta quedan en None
+(p. ej. CLS en Firefox).
+"""
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support import expected_conditions as EC
+
+from pages import waits
+from pages.elements import read_elements
+
+# Capturar métricas en los Page Objects (--no-page-metrics lo desactiva)
+enabled = True
+# Verificar el presupuesto en cada captura (--perf-budgets)
+enforce_budgets = False
+
+_recorded: Dict[int, List["PageMetrics"]] = {}
+
+# Observadores de la página (una vez por documento); 'buffered' entrega también lo ocurrido antes de instalarlos
+_INSTRUMENT_SCRIPT = """
+if (!window.__perfMetrics) {
+    const supported = (window.PerformanceObserver && PerformanceObserver.supportedEntryTypes) || [];
+    const metrics = window.__perfMetrics = {
+        lcp: null,
+        cls: supported.includes('layout-shift') ? 0 : null,
+        longTasks: supported.includes('longtask') ? 0 : null,
+        longTaskMs: supported.includes('longtask') ? 0 : null,
+    };
+    const observe = (type, handle) => {
+        if (!supported.includes(type)) { return; }
+        new PerformanceObserver((list) => list.getEntries().forEach(handle)).observe({type: type, buffered: true});
+    };
+    observe('largest-contentful-paint', (e) => { metrics.lcp = e.renderTime || e.loadTime || e.startTime; });
+    observe('layout-shift', (e) => { if (!e.hadRecentInput) { metrics.cls += e.value; } });
+    observe('longtask', (e) => { metrics.longTasks++; metrics.longTaskMs += e.duration; });
+}
+"""
+
+# Da un cuadro a los observadores para entregar las entradas 'buffered' y devuelve la foto actual
+_COLLECT_SCRIPT = _INSTRUMENT_SCRIPT + """
+const done = arguments[arguments.length - 1];
+setTimeout(() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const resources = performance.getEntriesByType('resource');
+    const metrics = window.__perfMetrics;
+    done({
+        url: location.href,
+        timeOrigin: performance.timeOrigin,
+        now: performance.now(),
+        ttfb: nav ? nav.responseStart - nav.startTime : null,
+        domContentLoaded: nav ? nav.domContentLoadedEventEnd - nav.startTime : null,
+        load: nav && nav.loadEventEnd ? nav.loadEventEnd - nav.startTime : null,
+        lcp: metrics.lcp,
+        cls: metrics.cls,
+        longTasks: metrics.longTasks,
+        longTaskMs: metrics.longTaskMs,
+        resources: resources.length,
+        transferBytes: resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+    });
+}, 50);
+"""
+
+
+@dataclass
+class PageMetrics:
+    """Métricas de una carga ('navigation') o de una transición dentro de la aplicación ('transition')."""
+    page: str
+    kind: str
+    browser: str
+    url: str
+    duration_ms: Optional[float] = None
+    ttfb_ms: Optional[float] = None
+    dom_content_loaded_ms: Optional[float] = None
+    load_ms: Optional[float] = None
+    lcp_ms: Optional[float] = None
+    cls: Optional[float] = None
+    long_tasks: Optional[int] = None
+    long_task_ms: Optional[float] = None
+    resources: int = 0
+    transfer_kb: float = 0.0
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Límites en ms (None: sin límite). LCP y TTFB aplican a cargas; duration_ms a transiciones."""
+    lcp_ms: Optional[float] = None
+    ttfb_ms: Optional[float] = None
+    duration_ms: Optional[float] = None
+
+
+# Umbrales "pobre" de Web Vitals para LCP y TTFB
+DEFAULT_BUDGET = Budget(lcp_ms=4000, ttfb_ms=1800, duration_ms=8000)
+# Presupuestos propios por página (nombre usado en capture()/transition())
+BUDGETS: Dict[str, Budget] = {
+    "cinema.checkout": Budget(duration_ms=10000),
+}
+
+
+def _snapshot(driver) -> Optional[dict]:
+    try:
+        return driver.execute_async_script(_COLLECT_SCRIPT)
+    except WebDriverException:
+        # Página sin documento accesible (about:blank, alerta abierta) o que navegó durante la lectura
+        return None
+
+
+def _browser(driver) -> str:
+    return str(getattr(driver, "capabilities", {}).get("browserName", "unknown"))
+
+
+def _record(driver, metrics: PageMetrics) -> PageMetrics:
+    _recorded.setdefault(id(driver), []).append(metrics)
+    if enforce_budgets:
+        assert_budget(metrics)
+    return metrics
+
+
+def capture(driver, page: str) -> Optional[PageMetrics]:
+    """Métricas de la carga del documento actual, registradas bajo el nombre lógico 'page'."""
+    if not enabled:
+        return None
+    data = _snapshot(driver)
+    if data is None:
+        return None
+    return _record(driver, PageMetrics(
+        page=page, kind="navigation", browser=_browser(driver), url=data["url"],
+        duration_ms=data["load"], ttfb_ms=data["ttfb"], dom_content_loaded_ms=data["domContentLoaded"],
+        load_ms=data["load"], lcp_ms=data["lcp"], cls=data["cls"], long_tasks=data["longTasks"],
+        long_task_ms=data["longTaskMs"], resources=data["resources"],
+        transfer_kb=round(data["transferBytes"] / 1024, 1),
+    ))
+
+
+@contextmanager
+def transition(driver, page: str, ready: Sequence[tuple] = (), leaving=None, in_place: Sequence[tuple] = (),
+               timeout: float = 10):
+    """
+    Mide la acción del bloque 'with' hasta que la vista anterior se fue y aparece alguno de
+    los localizadores 'ready' (lo mismo que espera el Page Object para la vista siguiente).
+    Primero se espera a que cambie la URL o a que 'leaving' (un elemento de la vista que se
+    deja, p. ej. el botón clickeado) quede obsoleto: así 'ready' no se encuentra todavía en la
+    vista anterior. 'in_place' son los resultados que no cambian de vista (una alerta de
+    validación): si aparece uno, la transición termina ahí. Si la acción no deja la vista ni
+    muestra un resultado 'in_place' no se registra nada. Si carga un documento nuevo se registran además su TTFB y LCP; si no,
+    sólo lo ocurrido en el intervalo.
+    """
+    if not enabled or not (ready or enforce_budgets):
+        yield
+        return
+    before = _snapshot(driver)
+    before_url = driver.current_url
+    start = time.perf_counter()
+    yield
+    outcome = {}
+
+    def left_or_stayed(d):
+        if in_place and any(read_elements(d, locator, attributes=()) for locator in in_place):
+            outcome["stayed"] = True
+        elif d.current_url != before_url or (leaving is not None and EC.staleness_of(leaving)(d)):
+            outcome["left"] = True
+        return outcome
+
+    if not waits.until(driver, left_or_stayed, timeout):
+        # La acción no dejó la vista: no hay transición que medir
+        return
+    if "left" in outcome:
+        if ready:
+            waits.until(driver, lambda d: any(read_elements(d, locator, attributes=()) for locator in ready), timeout)
+        else:
+            waits.network_idle(driver, timeout=timeout)
+    duration_ms = (time.perf_counter() - start) * 1000
+    after = _snapshot(driver)
+    if after is None:
+        return
+    new_document = before is None or after["timeOrigin"] != before["timeOrigin"]
+    base = {"cls": 0, "longTasks": 0, "longTaskMs": 0, "resources": 0, "transferBytes": 0} if new_document else before
+
+    def delta(key):
+        return None if after[key] is None or base[key] is None else after[key] - base[key]
+
+    _record(driver, PageMetrics(
+        page=page, kind="transition", browser=_browser(driver), url=after["url"],
+        duration_ms=round(duration_ms, 1),
+        ttfb_ms=after["ttfb"] if new_document else None,
+        dom_content_loaded_ms=after["domContentLoaded"] if new_document else None,
+        load_ms=after["load"] if new_document else None,
+        lcp_ms=after["lcp"] if new_document else None,
+        cls=delta("cls"), long_tasks=delta("longTasks"), long_task_ms=delta("longTaskMs"),
+        resources=delta("resources") or 0,
+        transfer_kb=round((delta("transferBytes") or 0) / 1024, 1),
+    ))
+
+
+def recorded(driver) -> List[PageMetrics]:
+    """Métricas registradas con este navegador desde el último take()."""
+    return list(_recorded.get(id(driver), []))
+
+
+def take(driver) -> List[PageMetrics]:
+    """Entrega y olvida las métricas registradas con este navegador (al terminar cada prueba)."""
+    return _recorded.pop(id(driver), [])
+
+
+def violations(metrics: PageMetrics, budget: Optional[Budget] = None) -> List[str]:
+    """Métricas que superan el presupuesto (el de la página, o DEFAULT_BUDGET si no tiene uno propio)."""
+    budget = budget or BUDGETS.get(metrics.page, DEFAULT_BUDGET)
+    checks = [("LCP", metrics.lcp_ms, budget.lcp_ms), ("TTFB", metrics.ttfb_ms, budget.ttfb_ms)]
+    if metrics.kind == "transition":
+        checks.append(("duración", metrics.duration_ms, budget.duration_ms))
+    return [
+        f"{name} {value:.0f} ms > {limit:.0f} ms"
+        for name, value, limit in checks
+        if value is not None and limit is not None and value > limit
+    ]
+
+
+def assert_budget(metrics: PageMetrics, budget: Optional[Budget] = None):
+    """Falla (AssertionError) si la página superó su presupuesto de LCP, TTFB o duración."""
+    exceeded = violations(metrics, budget)
+    assert not exceeded, (f"Presupuesto de rendimiento excedido en {metrics.page} ({metrics.browser}, "
+                          f"{metrics.url}): {', '.join(exceeded)}")
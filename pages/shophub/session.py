@@ -0,0 +1,219 @@
+"""
+Sesión de ShopHub reutilizable entre pruebas: login por UI una vez, inyección después.
+
+La primera prueba que necesita un usuario autenticado hace el login completo por la UI
+(formulario, /login/success) en su propio navegador y, al terminar, se captura el estado
+que deja la aplicación: cookies, localStorage y sessionStorage (donde queda el JWT). Las
+pruebas siguientes con el mismo usuario reciben ese estado inyectado antes de navegar:
+una carga liviana del mismo origen (BOOTSTRAP_PATH) para poder escribir cookies y
+almacenamiento. Después se carga la página de inicio y se comprueba en el header que la
+sesión haya quedado activa (enlace Logout, o sin enlace Login); si no, el servidor ya
+no la reconoce (se reinició, cerró la sesión...): se descarta, se limpia el navegador y
+se hace el login por la UI.
+
+El estado se reutiliza mientras el JWT siga vigente (claim 'exp', como en
+api_client/tokens.py); si no se encontró un JWT se asume DEFAULT_TOKEN_TTL. Con
+cache_path se guarda además en disco, así una nueva ejecución dentro de la vigencia no
+repite el login. Las pruebas que verifican el login en sí siguen usando LoginPage.
+"""
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from selenium.webdriver.common.by import By
+
+from api_client.tokens import DEFAULT_REFRESH_MARGIN, DEFAULT_TOKEN_TTL, decode_jwt_exp
+from pages.elements import read_elements
+from pages.waits import until
+from pages.shophub.shophub_home_page import HomePage
+from storage.json_files import read_json, update_json
+
+# Recurso pequeño del mismo origen: basta para escribir cookies y almacenamiento sin cargar la aplicación
+BOOTSTRAP_PATH = "/robots.txt"
+# Atributos de cookie que acepta WebDriver (add_cookie); 'domain' se omite: vale el host actual
+_COOKIE_KEYS = ("name", "value", "path", "secure", "httpOnly", "expiry", "sameSite")
+# Enlaces del header que indican si hay sesión (los mismos que usa LoginPage)
+LOGOUT_LINK = (By.LINK_TEXT, "Logout")
+LOGIN_LINK = (By.LINK_TEXT, "Login")
+# Espera máxima a que el header muestre uno de los dos enlaces tras la inyección (segundos)
+VERIFY_TIMEOUT = 10
+
+_JWT = re.compile(r"eyJ[\w-]+\.[\w-]+\.[\w-]*")
+
+_CAPTURE_SCRIPT = """
+const dump = (store) => {
+    const items = {};
+    for (let i = 0; i < store.length; i++) { items[store.key(i)] = store.getItem(store.key(i)); }
+    return items;
+};
+return {origin: location.origin, local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+_RESTORE_SCRIPT = """
+const [local, session] = arguments;
+Object.entries(local).forEach(([key, value]) => window.localStorage.setItem(key, value));
+Object.entries(session).forEach(([key, value]) => window.sessionStorage.setItem(key, value));
+"""
+
+_CLEAR_SCRIPT = "window.localStorage.clear(); window.sessionStorage.clear();"
+
+
+@dataclass
+class SessionState:
+    """Cookies y almacenamiento de una sesión autenticada, con la expiración de su JWT."""
+    email: str
+    origin: str
+    cookies: List[dict] = field(default_factory=list)
+    local_storage: Dict[str, str] = field(default_factory=dict)
+    session_storage: Dict[str, str] = field(default_factory=dict)
+    expires_at: float = 0.0
+
+    def token(self) -> Optional[str]:
+        """Primer JWT encontrado en el almacenamiento o en las cookies."""
+        values = (list(self.local_storage.values()) + list(self.session_storage.values())
+                  + [cookie.get("value", "") for cookie in self.cookies])
+        for value in values:
+            match = _JWT.search(value or "")
+            if match:
+                return match.group(0)
+        return None
+
+    def is_valid(self, margin: float = DEFAULT_REFRESH_MARGIN) -> bool:
+        return self.expires_at - margin > time.time()
+
+
+def capture_session(driver, email: str) -> SessionState:
+    """Estado de la sesión del navegador en el origen actual."""
+    data = driver.execute_script(_CAPTURE_SCRIPT)
+    state = SessionState(email=email, origin=data["origin"], cookies=driver.get_cookies(),
+                         local_storage=data["local"], session_storage=data["session"])
+    token = state.token()
+    state.expires_at = (token and decode_jwt_exp(token)) or time.time() + DEFAULT_TOKEN_TTL
+    return state
+
+
+def inject_session(driver, state: SessionState):
+    """
+    Escribe cookies y almacenamiento de 'state' en el navegador. Deja el navegador en
+    BOOTSTRAP_PATH: la prueba navega después a la página que necesite.
+    """
+    driver.get(state.origin + BOOTSTRAP_PATH)
+    for cookie in state.cookies:
+        driver.add_cookie({key: cookie[key] for key in _COOKIE_KEYS if key in cookie})
+    driver.execute_script(_RESTORE_SCRIPT, state.local_storage, state.session_storage)
+
+
+def is_authenticated(driver, origin: str, timeout: float = VERIFY_TIMEOUT) -> bool:
+    """
+    Carga el inicio de 'origin' y espera a que el header muestre Logout o Login. Hay sesión
+    si aparece Logout o si no aparece Login (la app a veces tarda en mostrar Logout).
+    """
+    driver.get(origin + "/")
+    links = {}
+
+    def header_rendered(d):
+        for name, locator in (("logout", LOGOUT_LINK), ("login", LOGIN_LINK)):
+            links[name] = bool(read_elements(d, locator, attributes=()))
+        return any(links.values())
+
+    until(driver, header_rendered, timeout)
+    return links["logout"] or not links["login"]
+
+
+def clear_session(driver):
+    """Borra cookies y almacenamiento del origen actual."""
+    driver.delete_all_cookies()
+    driver.execute_script(_CLEAR_SCRIPT)
+
+
+def login_via_ui(driver, email: str, password: str) -> SessionState:
+    """Flujo de login completo por la UI; devuelve la sesión que quedó en el navegador."""
+    home_page = HomePage(driver)
+    home_page.go_to()
+    login_page = home_page.click_login()
+    login_page.login(email, password)
+    login_page.handle_login_success_page()
+    login_page.verify_login_success()
+    return capture_session(driver, email)
+
+
+class ShopHubSessions:
+    """
+    Sesiones autenticadas por usuario (una por worker de xdist). Con force_ui cada prueba
+    hace el login por la UI (para depurar el flujo o comparar tiempos).
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None, force_ui: bool = False):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.force_ui = force_ui
+        self.ui_logins = 0
+        self.injections = 0
+        self.rejected = 0
+        self._states: Dict[str, SessionState] = {}
+        self._lock = threading.Lock()
+        self._load_cache()
+
+    def login(self, driver, email: str, password: str) -> bool:
+        """
+        Deja el navegador autenticado como 'email': inyecta la sesión vigente si la hay (y el
+        navegador queda en la página de inicio) o, si no o si la aplicación no la reconoce, hace
+        el login por la UI y guarda la sesión para las próximas pruebas.
+        Devuelve True si la sesión se inyectó.
+        """
+        with self._lock:
+            state = None if self.force_ui else self._states.get(email)
+        if state is not None and state.is_valid():
+            inject_session(driver, state)
+            if is_authenticated(driver, state.origin):
+                with self._lock:
+                    self.injections += 1
+                print(f"🔑 Sesión de {email} inyectada (sin login por UI)")
+                return True
+            print(f"⚠️  La sesión guardada de {email} ya no es válida: se descarta y se hace el login por UI")
+            clear_session(driver)
+            with self._lock:
+                self.rejected += 1
+                if self._states.get(email) is state:
+                    del self._states[email]
+                    self._save_cache(dropped=email)
+
+        state = login_via_ui(driver, email, password)
+        with self._lock:
+            self.ui_logins += 1
+            if state.token() and not self.force_ui:
+                self._states[email] = state
+                self._save_cache()
+        if not state.token():
+            print(f"⚠️  No se encontró un JWT tras el login de {email}: la sesión no se reutilizará")
+        return False
+
+    def summary(self) -> str:
+        return (f"{self.ui_logins} login(s) por UI, {self.injections} sesión(es) inyectada(s), "
+                f"{self.rejected} descartada(s)")
+
+    # --- Caché en disco ---
+
+    def _load_cache(self):
+        if not self.cache_path:
+            return
+        try:
+            self._states = {email: SessionState(**state)
+                            for email, state in read_json(self.cache_path, {}).items()}
+        except (AttributeError, TypeError):
+            self._states = {}
+
+    def _save_cache(self, dropped: Optional[str] = None):
+        """Guarda las sesiones de este proceso sobre las de los demás; 'dropped' se quita del archivo."""
+        if not self.cache_path:
+            return
+
+        def merge(content):
+            content.pop(dropped, None)
+            content.update({email: asdict(state) for email, state in self._states.items()})
+            return content
+
+        # Si falla el disco sólo se repite el login en la próxima ejecución
+        update_json(self.cache_path, merge, indent=2)
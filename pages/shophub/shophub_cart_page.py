@@ -1,8 +1,7 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from pages.elements import read_elements, wait_for_elements
+from pages.waits import until
 
 class CartPage:
     def __init__(self, driver: WebDriver):
@@ -12,35 +11,37 @@ class CartPage:
     EMPTY_CART_MESSAGE = (By.XPATH, "//h1[text()='Your Cart is Empty']")
     # Localizador para productos en el carrito.
     CART_ITEM = (By.XPATH, "//div[contains(@class, 'cart-item')] | //div[@data-product-id]")
+    # Los mismos items sin las tarjetas de producto de otras vistas (que también tienen data-product-id):
+    # indican que la vista del carrito ya se mostró
+    CART_VIEW_ITEM = (By.XPATH, "//div[contains(@class, 'cart-item')] | //div[@data-product-id]"
+                                "[not(ancestor-or-self::*[contains(concat(' ', normalize-space(@class), ' '),"
+                                " ' product-card ')])]")
+    # Sub-elementos de cada item donde aparece el nombre del producto
+    PRODUCT_NAME_IN_CART = "h3, p"
 
     def get_cart_items(self):
         """
         Obtiene una lista de elementos que representan los productos en el carrito.
         """
-        try:
-            # Esperar a que el mensaje de "carrito vacío" desaparezca
-            WebDriverWait(self.driver, 10).until(
-                EC.invisibility_of_element_located(self.EMPTY_CART_MESSAGE)
-            )
-            # Si el mensaje desaparece, intentar encontrar los elementos del carrito
-            return self.driver.find_elements(*self.CART_ITEM)
-        except TimeoutException:
-            # Si el mensaje sigue visible después de 10 segundos, indica que el carrito está vacío
-            return []
+        return [info.element for info in self._read_cart_items()]
 
     def is_product_in_cart(self, product_name: str) -> bool:
         """
         Verifica si un producto con el nombre dado está presente en el carrito.
+        Los nombres de todos los items se leen en la misma llamada que los items.
         """
-        cart_items = self.get_cart_items()
-        PRODUCT_NAME_IN_CART = (By.CSS_SELECTOR, "h3, p")
+        for item in self._read_cart_items(fields={"names": self.PRODUCT_NAME_IN_CART}):
+            if any(product_name.lower() in name.lower() for name in item.fields["names"]):
+                return True
+        return False
 
-        for item in cart_items:
-            try:
-                name_elements = item.find_elements(*PRODUCT_NAME_IN_CART)
-                for el in name_elements:
-                    if product_name.lower() in el.text.strip().lower():
-                        return True
-            except:
-                continue
-        return False
\ No newline at end of file
+    def _read_cart_items(self, **kwargs):
+        """Items del carrito (ElementInfo); lista vacía si el carrito está vacío."""
+        # Esperar a que el mensaje de "carrito vacío" desaparezca (leído con un script: si no existe
+        # no se paga la espera implícita del driver)
+        if not until(self.driver, lambda d: not any(
+                info.visible for info in read_elements(d, self.EMPTY_CART_MESSAGE, attributes=())), 10):
+            # Si el mensaje sigue visible después de 10 segundos, indica que el carrito está vacío
+            return []
+        # Si el mensaje desaparece, esperar a que se rendericen los items (el listado llega después)
+        return wait_for_elements(self.driver, self.CART_ITEM, timeout=10, attributes=(), **kwargs)
@@ -4,7 +4,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from pages.shophub.shophub_product_page import ProductPage
-import time
+from pages import waits
+from pages.elements import read_elements, wait_for_elements
 
 
 class CategoryPage:
@@ -16,7 +17,11 @@ class CategoryPage:
     FIRST_PRODUCT_LINK = (By.CSS_SELECTOR, ".product-card a")
     ADD_TO_CART_BUTTON_BY_ID = (By.ID, "add-to-cart-{product_id}")
     CATEGORY_TITLE = (By.TAG_NAME, "h2")
+    # Título de una categoría en particular (indica que la vista de esa categoría ya se mostró)
+    CATEGORY_TITLE_BY_NAME = (By.XPATH, "//h2[contains(normalize-space(), '{category_name}')]")
     OVERLAY = (By.CSS_SELECTOR, "div.fixed.inset-0.z-50")
+    # Cada tarjeta de producto tiene un <h3> o <p> con el nombre
+    PRODUCT_NAME_IN_CARD = "h3, p"
 
     def get_category_title(self):
         """
@@ -44,33 +49,17 @@ class CategoryPage:
             raise Exception("No se cargaron productos en la categoría.")
 
         # Esperar a que el overlay desaparezca
-        try:
-            WebDriverWait(self.driver, 10).until(
-                EC.invisibility_of_element_located(self.OVERLAY)
-            )
-            print("✅ Overlay desapareció antes de hacer clic en producto.")
-            time.sleep(2)
-        except:
-            print("⚠️  No se encontró overlay. Continuando...")
-            time.sleep(1)
+        if waits.overlay_gone(self.driver, self.OVERLAY):
+            print("✅ Sin overlay antes de hacer clic en producto.")
+        else:
+            print("⚠️  El overlay no desapareció en 10 segundos. Continuando...")
 
         # Encontrar el primer enlace de producto
         first_product_link_element = self.driver.find_element(*self.FIRST_PRODUCT_LINK)
 
-        # Scroll al elemento
-        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", first_product_link_element)
-        time.sleep(0.5)
-
-        # Verificar una vez más que no hay overlay
-        overlays = self.driver.find_elements(*self.OVERLAY)
-        if overlays:
-            for overlay in overlays:
-                if overlay.is_displayed():
-                    print("⚠️  Overlay detectado, esperando...")
-                    WebDriverWait(self.driver, 10).until(
-                        EC.invisibility_of_element_located(self.OVERLAY)
-                    )
-                    time.sleep(0.5)
+        # Scroll al elemento y verificar una vez más que no hay overlay
+        waits.scroll_into_view(self.driver, first_product_link_element)
+        waits.overlay_gone(self.driver, self.OVERLAY)
 
         # Intentar clic normal primero, JavaScript como fallback
         try:
@@ -92,14 +81,19 @@ class CategoryPage:
         Obtiene una lista de elementos que representan las tarjetas de producto.
         """
         # Usar el título de categoría como "producto"
-        try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located(self.CATEGORY_TITLE)
-            )
-            # Devolver el título como "producto" ficticio
-            return [self.driver.find_element(*self.CATEGORY_TITLE)]
-        except:
+        titles = wait_for_elements(self.driver, self.CATEGORY_TITLE, timeout=10, attributes=())
+        if not titles:
             raise Exception("No se cargó ni el título de categoría ni productos.")
+        # Devolver el título como "producto" ficticio
+        return [titles[0].element]
+
+    def read_product_cards(self):
+        """
+        Texto, nombre (fields["name"]), visibilidad y posición de todas las tarjetas de producto,
+        leídos en una sola llamada al navegador (ver pages/elements.py). Lista vacía si no hay.
+        """
+        return read_elements(self.driver, self.PRODUCT_CARD, attributes=("data-product-id",),
+                             fields={"name": self.PRODUCT_NAME_IN_CARD})
 
     def add_product_to_cart_by_id(self, product_id: str):
         """
@@ -138,54 +132,34 @@ class CategoryPage:
         Busca un producto por su nombre visible en la página de categoría y hace clic en él.
         Devuelve una instancia de ProductPage.
         """
-        # Cada tarjeta de producto tiene un <h3> o <p> con el nombre
-        PRODUCT_NAME_LOCATOR = (By.CSS_SELECTOR, ".product-card h3, .product-card p")
-
         # Esperar a que al menos un producto esté presente
         WebDriverWait(self.driver, 10).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, ".product-card"))
         )
 
         # Esperar a que el overlay desaparezca
-        try:
-            WebDriverWait(self.driver, 10).until(
-                EC.invisibility_of_element_located(self.OVERLAY)
-            )
-            print(f"✅ Overlay desapareció antes de buscar '{product_name}'.")
-            time.sleep(2)
-        except:
-            print("⚠️  No se encontró overlay. Continuando...")
-            time.sleep(1)
+        if waits.overlay_gone(self.driver, self.OVERLAY):
+            print(f"✅ Sin overlay antes de buscar '{product_name}'.")
+        else:
+            print("⚠️  El overlay no desapareció en 10 segundos. Continuando...")
 
-        # Obtener todas las tarjetas de producto
-        product_cards = self.driver.find_elements(By.CSS_SELECTOR, ".product-card")
+        # Leer nombre de todas las tarjetas de producto en una sola llamada
+        product_cards = self.read_product_cards()
         print(f"   📦 Productos disponibles: {len(product_cards)}")
 
         for card in product_cards:
             try:
-                name_element = card.find_element(*PRODUCT_NAME_LOCATOR)
-                card_product_name = name_element.text.strip()
+                card_product_name = card.fields["name"][0] if card.fields["name"] else ""
 
                 if product_name.lower() in card_product_name.lower():
                     print(f"   ✅ Producto encontrado: '{card_product_name}'")
 
                     # Hacer clic en el enlace
-                    link = card.find_element(By.TAG_NAME, "a")
-
-                    # Scroll al elemento
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", link)
-                    time.sleep(0.5)
-
-                    # Verificar overlay una vez más
-                    overlays = self.driver.find_elements(*self.OVERLAY)
-                    if overlays:
-                        for overlay in overlays:
-                            if overlay.is_displayed():
-                                print("   ⚠️  Overlay detectado, esperando...")
-                                WebDriverWait(self.driver, 10).until(
-                                    EC.invisibility_of_element_located(self.OVERLAY)
-                                )
-                                time.sleep(0.5)
+                    link = card.element.find_element(By.TAG_NAME, "a")
+
+                    # Scroll al elemento y verificar overlay una vez más
+                    waits.scroll_into_view(self.driver, link)
+                    waits.overlay_gone(self.driver, self.OVERLAY)
 
                     # Intentar clic normal, JavaScript como fallback
                     try:
@@ -199,7 +173,6 @@ class CategoryPage:
                         else:
                             raise click_error
 
-                    from pages.shophub.shophub_product_page import ProductPage
                     return ProductPage(self.driver)
             except:
                 continue
@@ -5,6 +5,8 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 
+from pages import performance
+
 class HomePage:
     def __init__(self, driver: WebDriver):
         self.driver = driver
@@ -25,6 +27,7 @@ class HomePage:
                                   "'Categories')]")
     def go_to(self):
         self.driver.get("https://shophub-commerce.vercel.app/")
+        performance.capture(self.driver, "shophub.home")
 
     def get_title(self):
         return self.driver.title
@@ -74,9 +77,13 @@ class HomePage:
         cart_link = WebDriverWait(self.driver, 10).until(
             EC.element_to_be_clickable(self.CART_LINK_ROBUST)
         )
-        cart_link.click()
-
         from pages.shophub.shophub_cart_page import CartPage
+        # La transición termina cuando, ya fuera de la vista anterior, el carrito muestra sus items
+        # (no las tarjetas de producto) o el mensaje de carrito vacío
+        with performance.transition(self.driver, "shophub.cart",
+                                    ready=(CartPage.CART_VIEW_ITEM, CartPage.EMPTY_CART_MESSAGE)):
+            cart_link.click()
+
         return CartPage(self.driver)
 
     def get_cart_item_count(self):
@@ -180,8 +187,10 @@ class HomePage:
         )
 
         # Hacer clic con ActionChains para mayor fiabilidad
-        ActionChains(self.driver).move_to_element(element).click().perform()
         from pages.shophub.shophub_category_page import CategoryPage
+        title = (By.XPATH, CategoryPage.CATEGORY_TITLE_BY_NAME[1].format(category_name=category_name))
+        with performance.transition(self.driver, "shophub.category", ready=(title,), leaving=element):
+            ActionChains(self.driver).move_to_element(element).click().perform()
         return CategoryPage(self.driver)
 
     def is_logout_button_visible(self):
@@ -2,8 +2,8 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from pages import waits
 import os
-import time
 
 
 class LoginPage:
@@ -41,45 +41,30 @@ class LoginPage:
         Esperar a que el overlay desaparezca y el login se complete.
         """
         # 1. Esperar a que el overlay inicial desaparezca (si existe)
-        try:
-            WebDriverWait(self.driver, 10).until(
-                EC.invisibility_of_element_located(self.OVERLAY)
-            )
-            print("✅ Overlay inicial desapareció.")
-        except:
-            print("ℹ️  No se encontró overlay inicial.")
+        if waits.overlay_gone(self.driver, self.OVERLAY):
+            print("✅ Sin overlay inicial.")
+        else:
+            print("⚠️  El overlay inicial no desapareció en 10 segundos.")
 
         # 2. Hacer clic en el botón de login
         sign_in_button = self.driver.find_element(*self.SIGN_IN_BUTTON)
+        login_url = self.driver.current_url
 
-        # Scroll al botón por si acaso
-        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", sign_in_button)
-        time.sleep(0.5)
+        # Scroll al botón por si acaso (sin animación: no hay que esperar a que termine)
+        waits.scroll_into_view(self.driver, sign_in_button)
 
         # Usar JavaScript click para mayor confiabilidad
         self.driver.execute_script("arguments[0].click();", sign_in_button)
         print("🔐 Botón 'Sign In' clickeado.")
 
-        # 3. Esperar a que aparezca el overlay de carga (indica que se está procesando)
-        try:
-            WebDriverWait(self.driver, 3).until(
-                EC.presence_of_element_located(self.OVERLAY)
-            )
-            print("⏳ Overlay de carga apareció (procesando login)...")
-        except:
-            print("⚠️  No apareció overlay de carga.")
-
-        # 4. Esperar a que desaparezca el overlay (login completado)
-        try:
-            WebDriverWait(self.driver, 15).until(
-                EC.invisibility_of_element_located(self.OVERLAY)
-            )
+        # 3. Esperar a que la petición de login termine: overlay fuera y red en reposo
+        if waits.overlay_gone(self.driver, self.OVERLAY, timeout=15):
             print("✅ Overlay de carga desapareció (login procesado).")
-        except:
+        else:
             print("⚠️  Overlay no desapareció en 15 segundos.")
-
-        # 5. Esperar adicional para que se procese completamente
-        time.sleep(2)
+        if not waits.url_changed(self.driver, login_url, timeout=5):
+            print("ℹ️  La URL no cambió tras el login.")
+        waits.network_idle(self.driver)
 
     def handle_login_success_page(self):
         """
@@ -91,7 +76,10 @@ class LoginPage:
         if "/login/success" in current_url:
             print("✅ Página /login/success detectada")
             print("⏳ Esperando establecimiento de token JWT...")
-            time.sleep(5)
+            if waits.token_in_storage(self.driver):
+                print("✅ Token JWT guardado en el navegador")
+            else:
+                print("⚠️  No se detectó el token JWT en 10 segundos")
 
             # Hacer clic en el botón "Go to Home"
             try:
@@ -101,7 +89,8 @@ class LoginPage:
                 )
                 go_home_button.click()
                 print("✅ Click en 'Go to Home'")
-                time.sleep(3)
+                waits.url_changed(self.driver, current_url)
+                waits.network_idle(self.driver)
                 return True
             except Exception as e:
                 print(f"⚠️  No se pudo hacer click en 'Go to Home': {e}")
@@ -2,7 +2,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+from pages import waits
 
 
 class ProductPage:
@@ -33,43 +33,31 @@ class ProductPage:
         """
         try:
             # 1. Esperar a que el overlay desaparezca
-            try:
-                WebDriverWait(self.driver, 10).until(
-                    EC.invisibility_of_element_located(self.OVERLAY)
-                )
-                print("✅ Overlay desapareció antes de 'Add to Cart'.")
-                time.sleep(2)
-            except:
-                print("⚠️  No se encontró overlay. Continuando...")
-                time.sleep(1)
+            if waits.overlay_gone(self.driver, self.OVERLAY):
+                print("✅ Sin overlay antes de 'Add to Cart'.")
+            else:
+                print("⚠️  El overlay no desapareció en 10 segundos. Continuando...")
 
             # 2. Encontrar el botón
             add_to_cart_button = WebDriverWait(self.driver, 10).until(
                 EC.presence_of_element_located(self.ADD_TO_CART_BUTTON)
             )
 
-            # 3. Scroll al botón
-            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", add_to_cart_button)
-            time.sleep(0.5)
+            # 3. Scroll al botón y verificar que ningún overlay quedó bloqueando
+            waits.scroll_into_view(self.driver, add_to_cart_button)
+            waits.overlay_gone(self.driver, self.OVERLAY)
 
-            # 4. Verificar que no hay overlay bloqueando
-            overlays = self.driver.find_elements(*self.OVERLAY)
-            if overlays:
-                for overlay in overlays:
-                    if overlay.is_displayed():
-                        print("⚠️  Overlay detectado, esperando...")
-                        WebDriverWait(self.driver, 10).until(
-                            EC.invisibility_of_element_located(self.OVERLAY)
-                        )
-                        time.sleep(0.5)
-
-            # 5. Usar JavaScript click para evitar interceptación
+            # 4. Usar JavaScript click para evitar interceptación
+            previous_count = waits.text_of(self.driver, waits.CART_BADGE)
             print("🔧 Usando JavaScript click en Add to Cart...")
             self.driver.execute_script("arguments[0].click();", add_to_cart_button)
             print("✅ Botón 'Add to Cart' clickeado (JavaScript).")
 
-            # 6. Esperar a que se procese
-            time.sleep(3)
+            # 5. Esperar a que se procese: el contador del carrito cambia (o, si no, la red queda en reposo)
+            if waits.badge_changed(self.driver, previous_count, timeout=5):
+                print(f"✅ Contador del carrito: {waits.text_of(self.driver, waits.CART_BADGE)}")
+            else:
+                waits.network_idle(self.driver)
 
         except Exception as e:
             raise Exception(f"No se pudo hacer clic en el botón 'Add to Cart': {e}")
\ No newline at end of file
@@ -0,0 +1,237 @@
+"""
+Esperas por señales concretas de la página para los Page Objects.
+
+En lugar de dormir un tiempo fijo "por si acaso", cada función espera el evento que de
+verdad indica que se puede seguir: que el overlay de carga se haya ido, que la red esté
+quieta o el DOM estable (page_quiet, resuelto dentro de la página), que el token JWT
+esté guardado en el navegador o que el contador del carrito haya cambiado. Terminan en cuanto ocurre la señal y devuelven False (sin elevar) si no
+ocurre dentro del timeout, igual que los sleeps a los que reemplazan no fallaban nunca.
+
+Modo auditoría (--audit-sleeps en pytest): mientras está activo, time.sleep queda
+instrumentado y se acumula el tiempo dormido por prueba (y por línea de código que
+duerme) junto al tiempo de estas esperas, para ver qué pausas fijas quedan por quitar.
+"""
+import os
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Overlay de carga de ShopHub que intercepta los clics mientras procesa
+OVERLAY = (By.CSS_SELECTOR, "div.fixed.inset-0.z-50")
+# Badge con la cantidad de productos del botón del carrito en el header de ShopHub
+CART_BADGE = (By.CSS_SELECTOR, "header a[href='/cart'] button div")
+
+# La red se considera quieta tras este tiempo sin peticiones ni recursos nuevos (ms)
+NETWORK_IDLE_MS = 500
+# La página se considera estable tras este tiempo sin mutaciones del DOM ni actividad de red (ms)
+QUIET_MS = 300
+# Intervalo de sondeo de las esperas (s)
+POLL_INTERVAL = 0.1
+
+_real_sleep = time.sleep
+_audit: Optional["SleepAudit"] = None
+
+_JWT_IN_STORAGE_SCRIPT = """
+const jwt = /eyJ[\\w-]+\\.[\\w-]+\\.[\\w-]*/;
+const stores = [window.localStorage, window.sessionStorage];
+for (const store of stores) {
+    for (let i = 0; i < store.length; i++) {
+        if (jwt.test(store.getItem(store.key(i)) || "")) { return true; }
+    }
+}
+return jwt.test(document.cookie);
+"""
+
+_VISIBLE_SCRIPT = """
+return Array.from(document.querySelectorAll(arguments[0])).some(e => {
+    const style = window.getComputedStyle(e);
+    return style.display !== 'none' && style.visibility !== 'hidden' && e.getClientRects().length > 0;
+});
+"""
+
+# Instrumentación de la página (una vez por documento): MutationObserver para el DOM, contador de
+# fetch/XHR en curso y PerformanceObserver para los recursos que ya estaban en vuelo al instalarla.
+_INSTRUMENT_SCRIPT = """
+if (!window.__pageQuiet) {
+    const state = window.__pageQuiet = {pending: 0, lastDom: performance.now(), lastNet: performance.now()};
+    const domActivity = () => { state.lastDom = performance.now(); };
+    const netActivity = () => { state.lastNet = performance.now(); };
+    new MutationObserver(domActivity).observe(document, {
+        subtree: true, childList: true, attributes: true, characterData: true
+    });
+    if (window.PerformanceObserver) {
+        try { new PerformanceObserver(netActivity).observe({type: 'resource', buffered: false}); } catch (e) {}
+    }
+    const started = () => { state.pending++; netActivity(); };
+    const finished = () => { state.pending = Math.max(0, state.pending - 1); netActivity(); };
+    if (window.fetch) {
+        const originalFetch = window.fetch;
+        window.fetch = function () {
+            started();
+            return originalFetch.apply(this, arguments).finally(finished);
+        };
+    }
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        started();
+        this.addEventListener('loadend', finished, {once: true});
+        return originalSend.apply(this, arguments);
+    };
+}
+"""
+
+# Resuelve dentro de la página, en una sola llamada, cuando lleva 'quietMs' sin actividad
+_QUIET_SCRIPT = _INSTRUMENT_SCRIPT + """
+const [quietMs, timeoutMs, watchDom, done] = arguments;
+const state = window.__pageQuiet;
+const start = performance.now();
+(function check() {
+    const now = performance.now();
+    const last = watchDom ? Math.max(state.lastDom, state.lastNet) : state.lastNet;
+    const quiet = document.readyState === 'complete' && state.pending === 0 && now - last >= quietMs;
+    if (quiet || now - start >= timeoutMs) {
+        done({quiet: quiet, pending: state.pending, waitedMs: Math.round(now - start)});
+    } else {
+        setTimeout(check, Math.min(50, quietMs));
+    }
+})();
+"""
+
+
+@dataclass
+class SleepAudit:
+    """Tiempo dormido con time.sleep y tiempo esperado por señales durante una prueba."""
+    slept: float = 0.0
+    sleeps: int = 0
+    waited: float = 0.0
+    waits: int = 0
+    by_site: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
+
+    def sleep(self, seconds):
+        frame = sys._getframe(1)
+        site = f"{os.path.relpath(frame.f_code.co_filename)}:{frame.f_lineno}"
+        start = time.perf_counter()
+        try:
+            _real_sleep(seconds)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.slept += elapsed
+            self.sleeps += 1
+            self.by_site[site] += elapsed
+
+    def to_dict(self) -> dict:
+        return {
+            "slept_s": round(self.slept, 3),
+            "sleeps": self.sleeps,
+            "waited_s": round(self.waited, 3),
+            "waits": self.waits,
+            "by_site": {site: round(seconds, 3) for site, seconds in
+                        sorted(self.by_site.items(), key=lambda item: item[1], reverse=True)},
+        }
+
+
+def start_audit() -> SleepAudit:
+    """Instrumenta time.sleep y empieza a acumular tiempos en una auditoría nueva."""
+    global _audit
+    _audit = SleepAudit()
+    time.sleep = _audit.sleep
+    return _audit
+
+
+def stop_audit() -> Optional[SleepAudit]:
+    """Restaura time.sleep y devuelve la auditoría en curso (None si no había)."""
+    global _audit
+    audit, _audit = _audit, None
+    time.sleep = _real_sleep
+    return audit
+
+
+def until(driver, condition, timeout: float) -> bool:
+    """WebDriverWait(...).until(condition) que devuelve False al agotar el timeout y cuenta en la auditoría."""
+    start = time.perf_counter()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=POLL_INTERVAL).until(condition)
+        return True
+    except TimeoutException:
+        return False
+    finally:
+        if _audit is not None:
+            _audit.waited += time.perf_counter() - start
+            _audit.waits += 1
+
+
+def overlay_gone(driver, locator=OVERLAY, timeout: float = 10) -> bool:
+    """
+    Espera a que ningún elemento del localizador CSS sea visible. Se comprueba con un script:
+    si no hay overlay devuelve True de inmediato, sin pagar el timeout implícito del driver.
+    """
+    return until(driver, lambda d: not d.execute_script(_VISIBLE_SCRIPT, locator[1]), timeout)
+
+
+def page_quiet(driver, quiet_ms: int = QUIET_MS, timeout: float = 10, dom: bool = True) -> bool:
+    """
+    Espera a que la página lleve 'quiet_ms' sin mutaciones del DOM (si dom=True) y sin
+    peticiones fetch/XHR en curso ni recursos nuevos. Instala en la página un pequeño
+    script (MutationObserver y contadores de red) y resuelve dentro de ella en una sola
+    llamada asíncrona, sin sondear desde Python. Las peticiones que ya estaban en vuelo
+    antes de la primera llamada en ese documento cuentan como actividad al completarse.
+    """
+    start = time.perf_counter()
+    script_timeout = driver.timeouts.script
+    if script_timeout < timeout + 5:
+        driver.set_script_timeout(timeout + 5)
+    try:
+        result = driver.execute_async_script(_QUIET_SCRIPT, quiet_ms, int(timeout * 1000), dom)
+        return bool(result and result.get("quiet"))
+    except WebDriverException:
+        # La página navegó durante la espera (se pierde el callback): se considera no quieta
+        return False
+    finally:
+        if script_timeout < timeout + 5:
+            driver.set_script_timeout(script_timeout)
+        if _audit is not None:
+            _audit.waited += time.perf_counter() - start
+            _audit.waits += 1
+
+
+def network_idle(driver, idle_ms: int = NETWORK_IDLE_MS, timeout: float = 10) -> bool:
+    """Espera a que no haya fetch/XHR en curso ni recursos nuevos durante 'idle_ms' (ver page_quiet)."""
+    return page_quiet(driver, quiet_ms=idle_ms, timeout=timeout, dom=False)
+
+
+def token_in_storage(driver, timeout: float = 10) -> bool:
+    """Espera a que haya un JWT guardado en localStorage, sessionStorage o en una cookie."""
+    return until(driver, lambda d: d.execute_script(_JWT_IN_STORAGE_SCRIPT), timeout)
+
+
+def url_changed(driver, previous_url: str, timeout: float = 10) -> bool:
+    """Espera a que el navegador haya salido de 'previous_url'."""
+    return until(driver, EC.url_changes(previous_url), timeout)
+
+
+def text_of(driver, locator) -> Optional[str]:
+    """
+    Texto del elemento de un localizador CSS, o None si no existe. Se lee con un script
+    para no esperar el timeout implícito cuando el elemento todavía no está.
+    """
+    return driver.execute_script(
+        "const e = document.querySelector(arguments[0]); return e ? e.textContent.trim() : null;",
+        locator[1],
+    )
+
+
+def badge_changed(driver, previous: Optional[str], locator=CART_BADGE, timeout: float = 10) -> bool:
+    """Espera a que el texto del badge (localizador CSS; por defecto el contador del carrito) cambie."""
+    return until(driver, lambda d: text_of(d, locator) != previous, timeout)
+
+
+def scroll_into_view(driver, element):
+    """Centra el elemento en la vista sin animación, así no hace falta esperar a que termine el scroll."""
+    driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'instant'});", element)
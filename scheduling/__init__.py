@@ -0,0 +1,7 @@
+from .durations import DurationStore, Plan, plan
+
+__all__ = [
+    "DurationStore",
+    "Plan",
+    "plan",
+]
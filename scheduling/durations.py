@@ -0,0 +1,104 @@
+"""
+Duraciones históricas por prueba y reparto de la suite entre workers.
+
+DurationStore guarda en un JSON (.pytest_cache/durations.json, o TEST_DURATIONS) la
+duración de cada prueba (preparación + prueba + limpieza), suavizada entre ejecuciones
+con una media exponencial. plan() reparte las pruebas entre N workers con el algoritmo
+LPT (la más larga primero, al worker con menos carga prevista), que deja los workers
+con cargas parecidas y evita que uno termine con un flujo de checkout de 60 s al final
+mientras el resto está ocioso.
+
+Las pruebas sin historial se estiman con la mediana de su archivo, si tiene alguna con
+historial, o con la mediana de toda la suite.
+"""
+import os
+import statistics
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from storage.json_files import read_json, update_json
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_STORE_PATH = Path(os.getenv("TEST_DURATIONS", ROOT_DIR / ".pytest_cache" / "durations.json"))
+# Peso de la última ejecución en la media exponencial
+SMOOTHING = 0.5
+# Estimación (s) cuando no hay historial de ninguna prueba
+DEFAULT_ESTIMATE = 1.0
+
+
+def _module_of(nodeid: str) -> str:
+    return nodeid.split("::", 1)[0]
+
+
+class DurationStore:
+    """Duraciones (s) por nodeid, persistidas entre ejecuciones."""
+
+    def __init__(self, path: Optional[Path] = DEFAULT_STORE_PATH):
+        self.path = Path(path) if path else None
+        self.durations: Dict[str, float] = {}
+        self.runs: Dict[str, int] = {}
+        self._load()
+
+    def _load(self):
+        if not self.path:
+            return
+        for nodeid, entry in read_json(self.path, {}).items():
+            self.durations[nodeid] = float(entry["duration"])
+            self.runs[nodeid] = int(entry.get("runs", 1))
+
+    def record(self, nodeid: str, duration: float):
+        """Suma la duración medida a la media exponencial de la prueba."""
+        previous = self.durations.get(nodeid)
+        self.durations[nodeid] = duration if previous is None else SMOOTHING * duration + (1 - SMOOTHING) * previous
+        self.runs[nodeid] = self.runs.get(nodeid, 0) + 1
+
+    def save(self):
+        if not self.path:
+            return
+        def merge(content):
+            content.update({
+                nodeid: {"duration": round(duration, 3), "runs": self.runs.get(nodeid, 1)}
+                for nodeid, duration in self.durations.items()
+            })
+            return dict(sorted(content.items()))
+
+        # Si falla el disco la próxima ejecución reparte con estimaciones
+        update_json(self.path, merge, indent=2)
+
+    def estimates(self, nodeids: Sequence[str]) -> Dict[str, float]:
+        """Duración prevista de cada prueba (historial, o mediana de su archivo o de la suite)."""
+        known = {nodeid: self.durations[nodeid] for nodeid in nodeids if nodeid in self.durations}
+        by_module: Dict[str, List[float]] = {}
+        for nodeid, duration in known.items():
+            by_module.setdefault(_module_of(nodeid), []).append(duration)
+        overall = statistics.median(known.values()) if known else DEFAULT_ESTIMATE
+        module_medians = {module: statistics.median(values) for module, values in by_module.items()}
+        return {
+            nodeid: known.get(nodeid, module_medians.get(_module_of(nodeid), overall))
+            for nodeid in nodeids
+        }
+
+
+@dataclass
+class Plan:
+    """Reparto de las pruebas: por worker, índices en orden de ejecución y carga prevista (s)."""
+    bins: List[List[int]] = field(default_factory=list)
+    loads: List[float] = field(default_factory=list)
+
+    @property
+    def makespan(self) -> float:
+        return max(self.loads, default=0.0)
+
+
+def plan(estimates: Sequence[float], workers: int) -> Plan:
+    """
+    Reparto LPT: recorre las pruebas de la más larga a la más corta y asigna cada una al
+    worker con menos carga prevista. Cada worker recibe las suyas de mayor a menor.
+    """
+    result = Plan(bins=[[] for _ in range(workers)], loads=[0.0] * workers)
+    for index in sorted(range(len(estimates)), key=lambda i: estimates[i], reverse=True):
+        worker = min(range(workers), key=lambda w: result.loads[w])
+        result.bins[worker].append(index)
+        result.loads[worker] += estimates[index]
+    return result
@@ -0,0 +1,147 @@
+"""
+Scheduler de pytest-xdist que reparte las pruebas por duración prevista.
+
+Al terminar la recolección arma un plan LPT (ver durations.plan): cada worker recibe
+su lote, de la prueba más larga a la más corta, con cargas previstas parecidas. Las
+pruebas se envían de a poco (MIN_PENDING en cola por worker), así que si un worker
+agota su lote antes de lo previsto le quita a otro la más larga que aún no envió; los
+errores de estimación no dejan workers ociosos al final.
+
+Mide además el tiempo real de cada worker y de toda la ejecución para compararlo con
+el plan en el resumen final.
+"""
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence
+
+import pytest
+from xdist.scheduler import LoadScheduling
+from xdist.workermanage import WorkerController
+
+from scheduling.durations import DurationStore, Plan, plan
+
+# Pruebas en cola por worker: la que corre y la siguiente
+MIN_PENDING = 2
+
+
+class DurationScheduling(LoadScheduling):
+    """LoadScheduling con lotes por worker armados por duración prevista y robo de trabajo al final."""
+
+    def __init__(self, config: pytest.Config, log=None, store: Optional[DurationStore] = None):
+        super().__init__(config, log)
+        self.store = store or DurationStore()
+        self.estimates: List[float] = []
+        self.unknown = 0
+        self.plan: Optional[Plan] = None
+        self.planned: Dict[str, float] = {}
+        self.queues: Dict[WorkerController, Deque[int]] = {}
+        self.busy: Dict[str, float] = {}
+        self.stolen = 0
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    @property
+    def tests_finished(self) -> bool:
+        if not self.collection_is_completed or self.pending or any(self.queues.values()):
+            return False
+        return all(len(pending) < MIN_PENDING for pending in self.node2pending.values())
+
+    @property
+    def has_pending(self) -> bool:
+        return bool(self.pending or any(self.queues.values()) or any(self.node2pending.values()))
+
+    def schedule(self) -> None:
+        assert self.collection_is_completed
+        if self.collection is not None:
+            # Nodo agregado más tarde (p. ej. reemplazo de uno caído): empieza robando
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+        self.collection = next(iter(self.node2collection.values()))
+        if not self.collection:
+            return
+
+        estimates = self.store.estimates(self.collection)
+        self.estimates = [estimates[nodeid] for nodeid in self.collection]
+        self.unknown = sum(1 for nodeid in self.collection if nodeid not in self.store.durations)
+        nodes = self.nodes
+        self.plan = plan(self.estimates, len(nodes))
+        for node, indices, load in zip(nodes, self.plan.bins, self.plan.loads):
+            self.queues[node] = deque(indices)
+            self.planned[node.gateway.id] = load
+        self.started = time.perf_counter()
+        for node in nodes:
+            self.check_schedule(node)
+
+    def check_schedule(self, node: WorkerController, duration: float = 0) -> None:
+        if node.shutting_down:
+            return
+        queue = self.queues.setdefault(node, deque())
+        pending = self.node2pending[node]
+        to_send = []
+        while len(pending) + len(to_send) < MIN_PENDING and (queue or self._steal(node)):
+            to_send.append(queue.popleft())
+        if to_send:
+            pending.extend(to_send)
+            node.send_runtest_some(to_send)
+        if not self.pending and not any(self.queues.values()):
+            node.shutdown()
+
+    def _steal(self, thief: WorkerController) -> bool:
+        """Pasa a la cola de 'thief' la prueba más larga sin enviar del worker con más carga pendiente."""
+        if self.pending:
+            self.pending.sort(key=lambda index: self.estimates[index], reverse=True)
+            self.queues[thief].append(self.pending.pop(0))
+            return True
+        victims = [node for node, queue in self.queues.items() if queue and node is not thief]
+        if not victims:
+            return False
+        victim = max(victims, key=lambda node: sum(self.estimates[index] for index in self.queues[node]))
+        self.queues[thief].append(self.queues[victim].popleft())
+        self.stolen += 1
+        return True
+
+    def mark_test_complete(self, node: WorkerController, item_index: int, duration: float = 0) -> None:
+        self.node2pending[node].remove(item_index)
+        worker = node.gateway.id
+        self.busy[worker] = self.busy.get(worker, 0.0) + duration
+        self.finished = time.perf_counter()
+        self.check_schedule(node, duration=duration)
+
+    def mark_test_pending(self, item: str) -> None:
+        assert self.collection is not None
+        self.pending.insert(0, self.collection.index(item))
+        for node in self.node2pending:
+            self.check_schedule(node)
+
+    def remove_node(self, node: WorkerController) -> Optional[str]:
+        """Saca un worker (terminó o se cayó); lo que tenía asignado vuelve a repartirse."""
+        pending = self.node2pending.pop(node)
+        queue = self.queues.pop(node, deque())
+        if not pending and not queue:
+            return None
+        crashitem = None
+        if pending:
+            assert self.collection is not None
+            crashitem = self.collection[pending.pop(0)]
+        self.pending.extend(pending)
+        self.pending.extend(queue)
+        for other in self.node2pending:
+            self.check_schedule(other)
+        return crashitem
+
+    def summary(self) -> Sequence[str]:
+        """Makespan previsto frente al real, en total y por worker."""
+        if self.plan is None or self.started is None:
+            return []
+        actual = (self.finished or time.perf_counter()) - self.started
+        lines = [
+            f"Makespan previsto {self.plan.makespan:.1f} s | real {actual:.1f} s | "
+            f"{len(self.collection)} pruebas ({self.unknown} sin historial) | {self.stolen} reasignadas"
+        ]
+        for worker in sorted(self.planned):
+            lines.append(f"  {worker}: previsto {self.planned[worker]:7.1f} s | real {self.busy.get(worker, 0.0):7.1f} s")
+        return lines
@@ -1,5 +1,30 @@
 from .user_schema import USER_SCHEMA
-# from .flight_schema import FLIGHT_SCHEMA
-# from .booking_schema import BOOKING_SCHEMA
+from .airport_schema import AIRPORT_SCHEMA
+from .aircraft_schema import AIRCRAFT_SCHEMA
+from .flight_schema import FLIGHT_SCHEMA
+from .booking_schema import BOOKING_SCHEMA
+from .payment_schema import PAYMENT_SCHEMA
+from .registry import SchemaRegistry, ValidationStats
+from .streaming import iter_json_array
 
-__all__ = ["USER_SCHEMA"]
\ No newline at end of file
+# Registro compartido por las pruebas: cada esquema se compila una sola vez por proceso
+registry = SchemaRegistry()
+registry.register("user", USER_SCHEMA)
+registry.register("airport", AIRPORT_SCHEMA)
+registry.register("aircraft", AIRCRAFT_SCHEMA)
+registry.register("flight", FLIGHT_SCHEMA)
+registry.register("booking", BOOKING_SCHEMA)
+registry.register("payment", PAYMENT_SCHEMA)
+
+__all__ = [
+    "USER_SCHEMA",
+    "AIRPORT_SCHEMA",
+    "AIRCRAFT_SCHEMA",
+    "FLIGHT_SCHEMA",
+    "BOOKING_SCHEMA",
+    "PAYMENT_SCHEMA",
+    "SchemaRegistry",
+    "ValidationStats",
+    "iter_json_array",
+    "registry",
+]
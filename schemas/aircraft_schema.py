@@ -0,0 +1,11 @@
+# AircraftOut (docs/Schemas.docx)
+AIRCRAFT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "string"},
+        "tail_number": {"type": "string", "minLength": 5, "maxLength": 10},
+        "model": {"type": "string"},
+        "capacity": {"type": "integer"}
+    },
+    "required": ["id", "tail_number", "model", "capacity"]
+}
@@ -0,0 +1,11 @@
+# AirportOut (docs/Schemas.docx)
+AIRPORT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "string"},
+        "iata_code": {"type": "string", "pattern": "^[A-Z]{3}$"},
+        "city": {"type": "string"},
+        "country": {"type": "string"}
+    },
+    "required": ["id", "iata_code", "city", "country"]
+}
@@ -0,0 +1,16 @@
+# FlightOut (docs/Schemas.docx)
+FLIGHT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "string"},
+        "origin": {"type": "string", "pattern": "^[A-Z]{3}$"},
+        "destination": {"type": "string", "pattern": "^[A-Z]{3}$"},
+        "departure_time": {"type": "string", "format": "date-time"},
+        "arrival_time": {"type": "string", "format": "date-time"},
+        "base_price": {"type": "number"},
+        "aircraft_id": {"type": "string"},
+        "available_seats": {"type": "integer"}
+    },
+    "required": ["id", "origin", "destination", "departure_time", "arrival_time", "base_price",
+                 "aircraft_id", "available_seats"]
+}
@@ -0,0 +1,15 @@
+# PaymentOut no figura en docs/Schemas.docx: sólo los campos que verifica TC-API-25, sin cerrar el objeto
+PAYMENT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "string"},
+        "booking_id": {"type": "string"},
+        "status": {
+            "type": "string",
+            "enum": ["pending", "success", "failed"]
+        },
+        "amount": {"type": "number"},
+        "payment_method": {"type": "string"}
+    },
+    "required": ["id", "booking_id", "status", "amount", "payment_method"]
+}
@@ -0,0 +1,136 @@
+"""
+Registro de esquemas JSON compilados una sola vez.
+
+jsonschema.validate() verifica el esquema y construye un validador nuevo en cada
+llamada. El registro verifica cada esquema al registrarlo, guarda su validador (con
+FormatChecker, para que 'format: email' sí se compruebe) y valida los listados
+elemento por elemento a medida que se lee la respuesta (iter_stream, ver
+schemas/streaming.py), o sobre una lista ya decodificada. También acumula cuántas instancias se
+validaron y en cuánto tiempo, para vigilar que validar listados grandes siga siendo barato.
+"""
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List
+
+from jsonschema import FormatChecker, ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+from .streaming import CHUNK_SIZE, iter_source_items
+
+
+@dataclass
+class ValidationStats:
+    """Instancias validadas con un esquema y tiempo total empleado."""
+    instances: int = 0
+    seconds: float = 0.0
+
+    @property
+    def per_second(self) -> float:
+        return self.instances / self.seconds if self.seconds else 0.0
+
+
+class SchemaRegistry:
+    """
+    Esquemas por nombre con su validador compilado.
+
+    Uso:
+        registry.validate("user", response.json())          # un objeto
+        registry.validate_stream("user", response.json())   # un listado ya decodificado
+        registry.validate_stream("flight", api_client.get("/flights", stream=True))
+    """
+
+    def __init__(self):
+        self._schemas: Dict[str, dict] = {}
+        self._validators: Dict[str, object] = {}
+        self.stats: Dict[str, ValidationStats] = {}
+        self._lock = threading.Lock()
+        self._format_checker = FormatChecker()
+
+    def register(self, name: str, schema: dict):
+        """Registra un esquema; falla con SchemaError si el esquema no es válido."""
+        cls = validator_for(schema)
+        cls.check_schema(schema)
+        self._schemas[name] = schema
+        self._validators[name] = cls(schema, format_checker=self._format_checker)
+        self.stats.setdefault(name, ValidationStats())
+
+    def schema(self, name: str) -> dict:
+        return self._schemas[name]
+
+    def validator(self, name: str):
+        """Validador compilado del esquema."""
+        try:
+            return self._validators[name]
+        except KeyError:
+            raise KeyError(f"Esquema no registrado: '{name}'. Disponibles: {', '.join(self._schemas)}") from None
+
+    def errors(self, name: str, instance) -> List[ValidationError]:
+        """Todos los errores de validación de la instancia (lista vacía si es válida)."""
+        return self._timed(name, 1, lambda: list(self.validator(name).iter_errors(instance)))
+
+    def validate(self, name: str, instance):
+        """Valida un objeto; eleva ValidationError con el error más relevante, como jsonschema.validate."""
+        error = best_match(self.errors(name, instance))
+        if error is not None:
+            raise error
+
+    def iter_stream(self, name: str, source, chunk_size: int = CHUNK_SIZE) -> Iterator:
+        """
+        Decodifica y valida uno a uno los elementos de un listado y los entrega a medida que
+        llegan. 'source' es una Response pedida con stream=True (o bytes, o una lista ya
+        decodificada). Al terminar, si algún elemento era inválido eleva ValidationError con
+        el primero; sólo se guarda ese error, así que la memoria no crece con el listado.
+        """
+        validator = self.validator(name)
+        first_error = None
+        invalid = 0
+        index = -1
+        elapsed = 0.0
+        try:
+            for index, item in enumerate(iter_source_items(source, chunk_size)):
+                start = time.perf_counter()
+                error = best_match(validator.iter_errors(item))
+                elapsed += time.perf_counter() - start
+                if error is not None:
+                    invalid += 1
+                    if first_error is None:
+                        error.path.appendleft(index)
+                        first_error = error
+                yield item
+        finally:
+            with self._lock:
+                stats = self.stats[name]
+                stats.instances += index + 1
+                stats.seconds += elapsed
+        if first_error is not None:
+            first_error.message = (f"{invalid} elemento(s) inválido(s) de {index + 1}; "
+                                   f"el primero ({'/'.join(map(str, first_error.path))}): {first_error.message}")
+            raise first_error
+
+    def validate_stream(self, name: str, source, chunk_size: int = CHUNK_SIZE) -> int:
+        """Valida en streaming todos los elementos de un listado y devuelve cuántos había."""
+        count = 0
+        for _ in self.iter_stream(name, source, chunk_size):
+            count += 1
+        return count
+
+    def _timed(self, name: str, count: int, check):
+        start = time.perf_counter()
+        try:
+            return check()
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                stats = self.stats[name]
+                stats.instances += count
+                stats.seconds += elapsed
+
+    def summary(self) -> List[str]:
+        """Una línea por esquema usado: instancias validadas, tiempo y throughput."""
+        return [
+            f"{name}: {stats.instances} instancias en {stats.seconds * 1000:.1f} ms "
+            f"({stats.per_second:,.0f}/s)"
+            for name, stats in self.stats.items() if stats.instances
+        ]
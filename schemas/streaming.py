@@ -0,0 +1,104 @@
+"""
+Lectura incremental de respuestas JSON que son un arreglo ("[{...}, {...}, ...]").
+
+iter_json_array() decodifica los elementos a medida que llegan los fragmentos de la
+respuesta (response.iter_content con stream=True), de modo que sólo se mantiene en
+memoria el elemento en curso y el fragmento pendiente, sin importar el tamaño del
+listado. SchemaRegistry.iter_stream() valida cada elemento al decodificarlo.
+"""
+import codecs
+import json
+from typing import Iterator, Union
+
+# Tamaño de los fragmentos leídos de la respuesta (bytes)
+CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+# Caracteres con los que un número puede continuar en el fragmento siguiente ("599." + "99", "1e" + "3")
+_NUMBER_CONTINUATION = "0123456789.eE+-"
+
+
+def iter_chunks(source, chunk_size: int = CHUNK_SIZE) -> Iterator[Union[bytes, str]]:
+    """Fragmentos de una requests.Response (leída en streaming) o de un iterable de fragmentos."""
+    if hasattr(source, "iter_content"):
+        return source.iter_content(chunk_size=chunk_size)
+    if isinstance(source, (bytes, str)):
+        return iter([source])
+    return iter(source)
+
+
+def iter_json_array(source, chunk_size: int = CHUNK_SIZE) -> Iterator:
+    """
+    Elementos del arreglo JSON de 'source' (Response, bytes, str o iterable de fragmentos).
+    Eleva json.JSONDecodeError si el documento no es un arreglo JSON válido.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter_chunks(source, chunk_size)
+    buffer = ""
+    pos = 0
+    exhausted = False
+
+    def read_more() -> bool:
+        """Agrega el siguiente fragmento, descartando antes lo ya decodificado (memoria acotada)."""
+        nonlocal buffer, pos, exhausted
+        for chunk in chunks:
+            text = utf8.decode(chunk) if isinstance(chunk, bytes) else chunk
+            if text:
+                buffer = buffer[pos:] + text
+                pos = 0
+                return True
+        buffer += utf8.decode(b"", final=True)
+        exhausted = True
+        return False
+
+    def skip_whitespace():
+        """Avanza sobre los espacios en blanco, leyendo más fragmentos si hace falta."""
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer) or not read_more():
+                return
+
+    def peek() -> str:
+        skip_whitespace()
+        return buffer[pos] if pos < len(buffer) else ""
+
+    if peek() != "[":
+        raise json.JSONDecodeError("Se esperaba un arreglo JSON", buffer, pos)
+    pos += 1
+    if peek() == "]":
+        return
+    while True:
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+            # Un número que termina en el borde del fragmento, o antes de un carácter que podría
+            # continuarlo, puede seguir en el fragmento siguiente
+            number = isinstance(item, (int, float)) and not isinstance(item, bool)
+            complete = exhausted or (end < len(buffer)
+                                     and not (number and buffer[end] in _NUMBER_CONTINUATION))
+        except json.JSONDecodeError:
+            if exhausted:
+                raise
+            complete = False
+        if not complete:
+            read_more()
+            continue
+        yield item
+
+        pos = end
+        separator = peek()
+        if separator == "]":
+            return
+        if separator != ",":
+            raise json.JSONDecodeError("Se esperaba ',' o ']'", buffer, pos)
+        pos += 1
+        skip_whitespace()
+
+
+def iter_source_items(source, chunk_size: int = CHUNK_SIZE) -> Iterator:
+    """Elementos de una respuesta (Response, bytes o str) leída en streaming, o de un listado ya decodificado."""
+    if hasattr(source, "iter_content") or isinstance(source, (bytes, str)):
+        return iter_json_array(source, chunk_size)
+    return iter(source)
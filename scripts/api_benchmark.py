@@ -0,0 +1,101 @@
+"""
+Benchmark de latencia de la API de aerolínea con comparación contra una línea base.
+
+Uso:
+    python scripts/api_benchmark.py                        # mide y compara con benchmarks/baseline.json
+    python scripts/api_benchmark.py --base-url local       # contra la API local en memoria
+    python scripts/api_benchmark.py --update-baseline      # guarda la ejecución como nueva línea base
+
+Cada ejecución se guarda en benchmarks/results/benchmark_<fecha>.json. Termina con
+código 1 si algún endpoint empeora más de --tolerance respecto a la línea base.
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api_client import ApiClient  # noqa: E402
+from api_client import benchmark  # noqa: E402
+
+BASE_URL = "https://cf-automation-airline-api.onrender.com"
+LOCAL_API = "local"
+
+
+def parse_endpoint(value: str) -> benchmark.Endpoint:
+    """'GET /airports' -> Endpoint('GET /airports', 'GET', '/airports')"""
+    method, _, path = value.strip().partition(" ")
+    if not path.startswith("/"):
+        raise argparse.ArgumentTypeError(f"Endpoint inválido '{value}'. Formato: 'GET /ruta'.")
+    return benchmark.Endpoint(f"{method.upper()} {path}", method.upper(), path)
+
+
+def print_results(run: dict):
+    print(f"\n{'endpoint':28} {'p50':>9} {'p95':>9} {'p99':>9} {'req/s':>8} {'errores':>8}")
+    for name, stats in run["results"].items():
+        print(f"{name:28} {stats['p50_ms']:8.1f}ms {stats['p95_ms']:8.1f}ms {stats['p99_ms']:8.1f}ms "
+              f"{stats['throughput_rps']:8.1f} {stats['errors']:8}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default=os.getenv("API_BASE_URL", BASE_URL),
+                        help=f"URL de la API, o '{LOCAL_API}' para la API en memoria.")
+    parser.add_argument("--endpoint", action="append", type=parse_endpoint, dest="endpoints",
+                        help="Endpoint a medir ('GET /airports'). Repetible. Por defecto: / y /airports.")
+    parser.add_argument("--warmup", type=int, default=benchmark.DEFAULT_WARMUP)
+    parser.add_argument("--samples", type=int, default=benchmark.DEFAULT_SAMPLES)
+    parser.add_argument("--output-dir", default=str(benchmark.RESULTS_DIR))
+    parser.add_argument("--baseline", default=os.path.join("benchmarks", "baseline.json"))
+    parser.add_argument("--metric", default=benchmark.DEFAULT_METRIC,
+                        choices=("p50_ms", "p95_ms", "p99_ms", "mean_ms"))
+    parser.add_argument("--tolerance", type=float, default=benchmark.DEFAULT_TOLERANCE,
+                        help="Empeoramiento permitido respecto a la línea base (0.2 = 20%%).")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Guardar esta ejecución como línea base en lugar de comparar.")
+    args = parser.parse_args(argv)
+
+    fake_api = None
+    base_url = args.base_url
+    if base_url == LOCAL_API:
+        from fake_airline_api import FakeAirlineApi
+        fake_api = FakeAirlineApi().start()
+        base_url = fake_api.url
+
+    client = ApiClient(base_url, trust_env=fake_api is None)
+    try:
+        print(f"\n⏱ Midiendo {base_url} ({args.warmup} de calentamiento, {args.samples} muestras por endpoint)...")
+        run = benchmark.run_benchmark(client, args.endpoints, args.warmup, args.samples)
+    finally:
+        client.close()
+        if fake_api is not None:
+            fake_api.stop()
+
+    print_results(run)
+    path = benchmark.save_run(run, args.output_dir)
+    print(f"\n💾 Resultados guardados en {path}")
+
+    baseline_path = Path(args.baseline)
+    if args.update_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(run, indent=2))
+        print(f"📌 Línea base actualizada: {baseline_path}")
+        return 0
+    if not baseline_path.exists():
+        print(f"⚠️ No hay línea base en {baseline_path}; usa --update-baseline para crearla.")
+        return 0
+
+    regressions = benchmark.compare(run, benchmark.load_run(baseline_path), args.tolerance, args.metric)
+    if regressions:
+        print("\n❌ Regresiones de latencia:")
+        for regression in regressions:
+            print(f"   - {regression}")
+        return 1
+    print(f"\n✅ Sin regresiones ({args.metric}, tolerancia {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
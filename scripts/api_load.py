@@ -0,0 +1,75 @@
+"""
+Prueba de carga de los endpoints de vuelos, reservas y pagos de la API de aerolínea.
+
+Uso:
+    python scripts/api_load.py --base-url local --rate 50 --duration 30
+    python scripts/api_load.py --scenario bookings --scenario payments --rate 5 --ramp-up 10 --duration 60
+
+Las llegadas son de lazo abierto (--rate llegadas por segundo, con rampa lineal de
+--ramp-up segundos), así que la latencia reportada incluye la espera en cola cuando
+el servidor no da abasto. Con --output se guarda el reporte en JSON.
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api_client import ApiClient, ResourceProvisioner, TokenBroker  # noqa: E402
+from api_client.load import SCENARIOS, LoadRunner  # noqa: E402
+
+BASE_URL = "https://cf-automation-airline-api.onrender.com"
+LOCAL_API = "local"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default=os.getenv("API_BASE_URL", BASE_URL),
+                        help=f"URL de la API, o '{LOCAL_API}' para la API en memoria.")
+    parser.add_argument("--scenario", action="append", dest="scenarios", choices=sorted(SCENARIOS),
+                        help="Escenario a ejecutar (repetible, se alternan). Por defecto: todos.")
+    parser.add_argument("--rate", type=float, default=10, help="Llegadas por segundo (por defecto: 10).")
+    parser.add_argument("--duration", type=float, default=30, help="Duración en segundos (por defecto: 30).")
+    parser.add_argument("--ramp-up", type=float, default=0, help="Segundos de rampa hasta --rate (por defecto: 0).")
+    parser.add_argument("--concurrency", type=int, default=16,
+                        help="Máximo de llegadas en curso a la vez (por defecto: 16).")
+    parser.add_argument("--passengers", type=int, default=5, help="Pasajeros de prueba que reparten la carga.")
+    parser.add_argument("--timeout", type=float, default=30, help="Timeout por petición en segundos.")
+    parser.add_argument("--output", help="Archivo JSON donde guardar el reporte.")
+    args = parser.parse_args(argv)
+
+    fake_api = None
+    base_url = args.base_url
+    if base_url == LOCAL_API:
+        from fake_airline_api import FakeAirlineApi
+        fake_api = FakeAirlineApi().start()
+        base_url = fake_api.url
+
+    client = ApiClient(base_url, pool_size=args.concurrency, timeout=args.timeout, trust_env=fake_api is None)
+    broker = TokenBroker(client, pool_size=args.passengers)
+    runner = LoadRunner(client, broker, ResourceProvisioner(client, broker), args.scenarios or list(SCENARIOS),
+                        rate=args.rate, duration=args.duration, ramp_up=args.ramp_up,
+                        concurrency=args.concurrency)
+    try:
+        print(f"\n🛫 Preparando pasajeros y vuelos en {base_url}...")
+        ctx = runner.setup()
+        print(f"🚀 {args.rate:g} llegadas/s durante {args.duration:g}s "
+              f"(rampa {args.ramp_up:g}s, concurrencia {args.concurrency})...\n")
+        report = runner.run(ctx)
+    finally:
+        client.close()
+        if fake_api is not None:
+            fake_api.stop()
+
+    print(report.format())
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(report.to_dict(), indent=2))
+        print(f"\n💾 Reporte guardado en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
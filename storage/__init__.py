@@ -0,0 +1,8 @@
+from .json_files import file_lock, read_json, update_json, write_atomic
+
+__all__ = [
+    "file_lock",
+    "read_json",
+    "update_json",
+    "write_atomic",
+]
@@ -0,0 +1,76 @@
+"""
+Archivos JSON que comparten las ejecuciones y los procesos de una misma ejecución
+(workers de xdist), como las cachés de localizadores, tokens o duraciones.
+
+update_json() lee, fusiona y escribe el archivo con un candado de archivo (fcntl en
+POSIX), así cada proceso fusiona lo suyo sobre lo último que escribió otro en vez de
+pisarlo. write_atomic() escribe en un temporal del proceso y lo reemplaza: un lector
+nunca ve un archivo a medias. En Windows (sin fcntl) la escritura sigue siendo atómica
+pero la fusión entre procesos no queda protegida.
+"""
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+PathLike = Union[str, Path]
+
+# Entre hilos del mismo proceso (comparten el nombre del temporal y el candado de archivo)
+_thread_lock = threading.RLock()
+
+
+def read_json(path: PathLike, default: Any = None) -> Any:
+    """Contenido del archivo, o 'default' si no existe o no es un JSON válido."""
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return default
+
+
+def write_atomic(path: PathLike, text: str):
+    """Escribe 'text' en un temporal del proceso y lo mueve sobre 'path'. Lanza OSError."""
+    path = Path(path)
+    with _thread_lock:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        tmp_path.replace(path)
+
+
+@contextmanager
+def file_lock(path: PathLike):
+    """Candado exclusivo entre procesos sobre '<path>.lock' (y entre hilos del proceso)."""
+    path = Path(path)
+    with _thread_lock:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path.with_name(f"{path.name}.lock"), "a") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def update_json(path: PathLike, merge: Callable[[dict], Any], **dump_kwargs) -> Any:
+    """
+    Aplica merge(contenido actual, o {} si no hay) y escribe su resultado, todo bajo
+    file_lock. Devuelve lo escrito, o None si el disco falló (las cachés son opcionales:
+    sin ellas sólo se repite trabajo en la próxima ejecución).
+    """
+    try:
+        with file_lock(path):
+            current = read_json(path, {})
+            content = merge(current if isinstance(current, dict) else {})
+            write_atomic(path, json.dumps(content, **dump_kwargs))
+        return content
+    except OSError:
+        return None
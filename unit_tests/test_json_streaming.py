@@ -0,0 +1,46 @@
+import json
+
+import pytest
+
+from schemas.streaming import iter_json_array
+
+"""
+Regresión de la lectura incremental de listados JSON (schemas/streaming.py).
+Objetivo: Comprobar que el resultado no depende de dónde se corten los fragmentos de la
+respuesta: números, strings, escapes y caracteres multibyte partidos en cualquier posición.
+No usa la API.
+"""
+pytestmark = pytest.mark.unit
+
+DOCUMENTS = [
+    [599.99, 1e3, -12, 1.5e-7, 0, 12345678901234567890],
+    ["a\"b", "barra \\ final", "línea\nnueva", "é€", "😀", ""],
+    [{"price": 599.99, "code": "JFK", "ok": True, "none": None, "tags": [1, -2.5e+2, "x"]}],
+    [],
+]
+
+
+def _splits(data: bytes):
+    """Todas las formas de cortar 'data' en dos y en tres fragmentos."""
+    for i in range(len(data) + 1):
+        yield [data[:i], data[i:]]
+        for j in range(i, len(data) + 1):
+            yield [data[:i], data[i:j], data[j:]]
+
+
+@pytest.mark.parametrize("document", DOCUMENTS, ids=["numeros", "strings", "objeto", "vacio"])
+def test_iter_json_array_is_independent_of_chunk_boundaries(document):
+    data = json.dumps(document, ensure_ascii=False).encode("utf-8")
+    for chunks in _splits(data):
+        assert list(iter_json_array(chunks)) == document, f"Fragmentos: {chunks}"
+
+
+def test_iter_json_array_number_split_at_decimal_point():
+    assert list(iter_json_array([b"[599.", b"99]"])) == [599.99]
+    assert list(iter_json_array([b"[1e", b"3]"])) == [1000.0]
+
+
+@pytest.mark.parametrize("data", [b'{"a": 1}', b"[1, 2", b"[1 2]"])
+def test_iter_json_array_rejects_invalid_documents(data):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array([data[:3], data[3:]]))
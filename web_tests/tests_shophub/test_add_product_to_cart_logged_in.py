@@ -12,7 +12,7 @@ Datos de prueba: Importados desde data.py
 """
 
 
-def test_add_product_to_cart_as_logged_in_user(driver):
+def test_add_product_to_cart_as_logged_in_user(driver, shophub_login):
     """
     TC-WEB-08: Agregar producto al carrito como usuario autenticado.
 
@@ -21,7 +21,7 @@ def test_add_product_to_cart_as_logged_in_user(driver):
     - Producto disponible en la categoría especificada
 
     Pasos:
-    1. Login con credenciales válidas
+    1. Sesión iniciada con credenciales válidas (fixture 'shophub_login')
     2. Navegar a la categoría del producto
     3. Buscar y seleccionar producto específico
     4. Agregar producto al carrito
@@ -49,19 +49,10 @@ def test_add_product_to_cart_as_logged_in_user(driver):
 
     # ==================== PASO 1: LOGIN ====================
     print("PASO 1: Autenticación del usuario")
+    # El flujo de login por UI se verifica en test_shophub_login; aquí basta la sesión
+    shophub_login(TEST_EMAIL, TEST_PASSWORD)
     home_page = HomePage(driver)
     home_page.go_to()
-
-    login_page = home_page.click_login()
-    login_page.enter_email(TEST_EMAIL)
-    login_page.enter_password(TEST_PASSWORD)
-    login_page.click_sign_in()
-
-    # Manejar página de éxito del login
-    login_page.handle_login_success_page()
-
-    # Verificar autenticación (no falla si Logout no aparece - bug conocido)
-    login_page.verify_login_success()
     print("✅ Usuario autenticado - Continuando con el flujo\n")
     print("   (La autenticación se confirmará al verificar el carrito)\n")
 
@@ -2,32 +2,27 @@ from pages.shophub.shophub_home_page import HomePage
 from pages.shophub.shophub_product_page import ProductPage
 from pages.shophub.shophub_cart_page import CartPage
 import pytest
+from data import Users
 
 
-def test_view_cart_content_as_logged_in_user(driver):
+def test_view_cart_content_as_logged_in_user(driver, shophub_login):
     """
     Caso de prueba: TC-WEB-10: Ver contenido del carrito
     Objetivo: Verificar que un usuario autenticado pueda ver el contenido de su carrito de compras.
     Esta prueba requiere un usuario autenticado y un producto agregado al carrito.
 
-    REFACTORIZADO: Usa métodos POM de LoginPage, CategoryPage, ProductPage y CartPage
+    REFACTORIZADO: Usa métodos POM de CategoryPage, ProductPage y CartPage
     en lugar de manipular el driver directamente.
     """
-    # ==================== PASO 1: Login usando POM ====================
-    print("🔍 [1] Navegando a la página principal...")
+    # ==================== PASO 1: Sesión iniciada ====================
+    # El flujo de login por UI se verifica en test_shophub_login; aquí basta la sesión
+    print("🔍 [1] Iniciando sesión (fixture 'shophub_login')...")
+    shophub_login(Users.Admin.EMAIL, Users.Admin.PASSWORD)
+
+    print("🔍 [2] Navegando a la página principal...")
     home_page = HomePage(driver)
     home_page.go_to()
-
-    print("🔍 [2] Iniciando sesión usando POM LoginPage...")
-    login_page = home_page.click_login()
-    login_page.login("admin@demo.com", "SecurePass123!")
-
-    # Manejar la página de éxito del login usando POM
-    login_page.handle_login_success_page()
-
-    # Verificar login exitoso usando POM
-    login_page.verify_login_success()
-    print("✅ Login verificado con POM.")
+    print("✅ Usuario autenticado.")
 
     # ==================== PASO 2: Navegar a Electronics usando CategoryPage POM ====================
     print("🔍 [3] Navegando a 'Electronics'...")
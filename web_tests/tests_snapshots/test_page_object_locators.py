@@ -0,0 +1,37 @@
+import pytest
+from page_snapshots import declared_locators, seat_states_problem
+
+"""
+Revisión rápida de los localizadores de los Page Objects contra los snapshots guardados
+(page_snapshots/html). No visita ShopHub ni Fake Cinema: cada snapshot se sirve desde un
+servidor local y todos sus localizadores se cuentan en una sola llamada (fixture
+'snapshot_locators'). Un localizador roto aquí falla también contra la aplicación real,
+salvo que la aplicación haya cambiado: en ese caso, recapturar con
+'python -m page_snapshots capture'.
+
+    pytest web_tests/tests_snapshots    # o -m snapshots
+"""
+
+
+@pytest.mark.snapshots
+@pytest.mark.parametrize("locator", declared_locators(), ids=lambda check: check.key)
+def test_locator_matches_snapshot(snapshot_locators, locator):
+    check = snapshot_locators[locator.key]
+    if check.skip_reason:
+        pytest.skip(check.skip_reason)
+    if not check.checked:
+        pytest.skip(f"Sin snapshots capturados de {', '.join(check.snapshots)}")
+
+    by, value = check.locator
+    assert not check.invalid, f"{check.key} no es un localizador válido: {by}={value}"
+    assert check.found, (
+        f"{check.key} ({by}={value}) no encuentra elementos en {', '.join(check.matches)}. "
+        f"Corregir el Page Object, o recapturar los snapshots si la aplicación cambió."
+    )
+
+
+@pytest.mark.snapshots
+def test_seat_map_reads_selected_seats(snapshot_seat_states):
+    """La sala se capturó con asientos elegidos: seat_map debe reconocerlos con el marcado real."""
+    problem = seat_states_problem(snapshot_seat_states)
+    assert problem is None, f"{problem}. Revisar cómo detecta la selección pages/fake_cinema/seat_map.py."